@@ -1,8 +1,12 @@
+from collections import Counter
 from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
 import functools
 import hashlib
 from itertools import accumulate
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 import re
 
@@ -19,6 +23,11 @@ from freetype import (
 )
 import requests
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from esphome import external_files
 import esphome.codegen as cg
 import esphome.config_validation as cv
@@ -38,6 +47,8 @@ from esphome.const import (
 from esphome.core import CORE, HexInt
 from esphome.types import ConfigType
 
+from .cache import GlyphCache
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "font"
@@ -55,6 +66,21 @@ CONF_EXTRAS = "extras"
 CONF_FONTS = "fonts"
 CONF_GLYPHSETS = "glyphsets"
 CONF_IGNORE_MISSING_GLYPHS = "ignore_missing_glyphs"
+CONF_MAX_WORKERS = "max_workers"
+CONF_CACHE_SIZE = "cache_size"
+CONF_COMPRESSION = "compression"
+CONF_GLYPH_CACHE_SIZE = "glyph_cache_size"
+CONF_GLYPH_INDEX_PAGES = "glyph_index_pages"
+
+COMPRESSION_NONE = "NONE"
+COMPRESSION_RLE = "RLE"
+
+# Key into CORE.data for the persistent glyph cache
+KEY_GLYPH_CACHE = "glyph_cache"
+# Key into CORE.data for the glyph cache budget, the smallest cache_size of any font
+KEY_GLYPH_CACHE_SIZE = "glyph_cache_size"
+# Default upper bound for the on-disk cache of rendered glyphs
+DEFAULT_CACHE_SIZE = 16 * 1024 * 1024
 
 
 # Cache loaded freetype fonts
@@ -79,6 +105,8 @@ class FontCache(MutableMapping):
 
     def __init__(self):
         self.store = {}
+        self.paths = {}
+        self.hashes = {}
 
     def __delitem__(self, key):
         del self.store[self._keytransform(key)]
@@ -96,12 +124,29 @@ class FontCache(MutableMapping):
         transformed = self._keytransform(key)
         try:
             self.store[transformed] = Face(str(value))
+            self.paths[transformed] = Path(value)
+            self.hashes.pop(transformed, None)
         except FT_Exception as exc:
             file = transformed.split(":", 1)
             raise cv.Invalid(
                 f"{file[0].capitalize()} {file[1]} is not a valid font file"
             ) from exc
 
+    def get_path(self, key) -> Path:
+        return self.paths[self._keytransform(key)]
+
+    def file_hash(self, key):
+        """
+        Get a hash of the contents of the font file for the given config
+        """
+        transformed = self._keytransform(key)
+        if (result := self.hashes.get(transformed)) is None:
+            h = hashlib.new("sha256")
+            h.update(self.get_path(key).read_bytes())
+            result = h.hexdigest()
+            self.hashes[transformed] = result
+        return result
+
 
 FONT_CACHE = FontCache()
 
@@ -440,6 +485,13 @@ DEFAULT_GLYPHS = (
 )
 
 CONF_RAW_GLYPH_ID = "raw_glyph_id"
+CONF_RAW_PAGE_MAP_ID = "raw_page_map_id"
+CONF_RAW_GLYPH_INDEX_ID = "raw_glyph_index_id"
+
+# Marks an unused slot in the glyph index, must match GLYPH_INDEX_NONE in font.h
+GLYPH_INDEX_NONE = 0xFFFF
+# Glyphs a page other than page 0 needs to be worth its 512 byte index
+GLYPH_INDEX_MIN_GLYPHS = 32
 
 FONT_SCHEMA = cv.Schema(
     {
@@ -452,6 +504,15 @@ FONT_SCHEMA = cv.Schema(
         cv.Optional(CONF_IGNORE_MISSING_GLYPHS, default=False): cv.boolean,
         cv.Optional(CONF_SIZE): cv.int_range(min=1),
         cv.Optional(CONF_BPP, default=1): cv.one_of(1, 2, 4, 8),
+        cv.Optional(CONF_MAX_WORKERS, default=1): cv.int_range(min=0),
+        cv.Optional(CONF_COMPRESSION, default=COMPRESSION_NONE): cv.one_of(
+            COMPRESSION_NONE, COMPRESSION_RLE, upper=True
+        ),
+        cv.Optional(CONF_GLYPH_CACHE_SIZE, default=16): cv.int_range(min=1, max=255),
+        cv.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): cv.All(
+            cv.float_with_unit("cache size", "(B|b)?"), int
+        ),
+        cv.Optional(CONF_GLYPH_INDEX_PAGES, default=1): cv.int_range(min=0, max=255),
         cv.Optional(CONF_EXTRAS, default=[]): cv.ensure_list(
             cv.Schema(
                 {
@@ -462,10 +523,24 @@ FONT_SCHEMA = cv.Schema(
         ),
         cv.GenerateID(CONF_RAW_DATA_ID): cv.declare_id(cg.uint8),
         cv.GenerateID(CONF_RAW_GLYPH_ID): cv.declare_id(Glyph),
+        cv.GenerateID(CONF_RAW_PAGE_MAP_ID): cv.declare_id(cg.uint8),
+        cv.GenerateID(CONF_RAW_GLYPH_INDEX_ID): cv.declare_id(cg.uint16),
     },
 )
 
-CONFIG_SCHEMA = cv.All(FONT_SCHEMA, validate_font_config)
+def store_cache_size(config):
+    """
+    Record the budget of the build-wide glyph cache. The cache is shared by all fonts,
+    so the smallest cache_size applies, and 0 on any font disables it.
+    """
+    size = config[CONF_CACHE_SIZE]
+    if (current := CORE.data.get(KEY_GLYPH_CACHE_SIZE)) is not None:
+        size = min(size, current)
+    CORE.data[KEY_GLYPH_CACHE_SIZE] = size
+    return config
+
+
+CONFIG_SCHEMA = cv.All(FONT_SCHEMA, validate_font_config, store_cache_size)
 
 
 class EFont:
@@ -485,28 +560,35 @@ class GlyphInfo:
         self.height = height
 
 
-def glyph_to_glyphinfo(glyph, font, size, bpp):
-    # Convert to 32 bit unicode codepoint
-    glyph = ord(glyph)
-    scale = 256 // (1 << bpp)
+def set_font_size(font, size):
     if not font.is_scalable:
         sizes = [pt_to_px(x.size) for x in font.available_sizes]
         if size in sizes:
             font.select_size(sizes.index(size))
     else:
         font.set_pixel_sizes(size, 0)
-    flags = FT_LOAD_RENDER
-    if bpp != 1:
-        flags |= FT_LOAD_NO_BITMAP
-    else:
-        flags |= FT_LOAD_TARGET_MONO
-    font.load_char(glyph, flags)
-    width = font.glyph.bitmap.width
-    height = font.glyph.bitmap.rows
-    buffer = font.glyph.bitmap.buffer
-    pitch = font.glyph.bitmap.pitch
+
+
+def pack_glyph_bitmap(buffer, width, height, pitch, src_mode, bpp):
+    """
+    Pack a rendered freetype bitmap into a continuous MSB-first bit stream of
+    `bpp` bits per pixel, with no padding between rows.
+    """
+    scale = 256 // (1 << bpp)
+    if np is not None and pitch >= 0:
+        if width == 0 or height == 0:
+            return []
+        src = np.asarray(buffer[: height * pitch], dtype=np.uint8)
+        src = src.reshape(height, pitch)
+        if src_mode == ft_pixel_mode_mono:
+            pixels = np.unpackbits(src, axis=1)[:, :width] * ((1 << bpp) - 1)
+        else:
+            pixels = src[:, :width] // scale
+        shifts = np.arange(bpp - 1, -1, -1, dtype=np.uint8)
+        bits = (pixels.reshape(-1, 1) >> shifts) & 1
+        return np.packbits(bits.astype(np.uint8)).tolist()
+
     glyph_data = [0] * ((height * width * bpp + 7) // 8)
-    src_mode = font.glyph.bitmap.pixel_mode
     pos = 0
     for y in range(height):
         for x in range(width):
@@ -522,6 +604,29 @@ def glyph_to_glyphinfo(glyph, font, size, bpp):
                 if pixel & (1 << (bpp - bit_num - 1)):
                     glyph_data[pos // 8] |= 0x80 >> (pos % 8)
                 pos += 1
+    return glyph_data
+
+
+def glyph_to_glyphinfo(glyph, font, size, bpp):
+    # Convert to 32 bit unicode codepoint
+    glyph = ord(glyph)
+    set_font_size(font, size)
+    flags = FT_LOAD_RENDER
+    if bpp != 1:
+        flags |= FT_LOAD_NO_BITMAP
+    else:
+        flags |= FT_LOAD_TARGET_MONO
+    font.load_char(glyph, flags)
+    width = font.glyph.bitmap.width
+    height = font.glyph.bitmap.rows
+    glyph_data = pack_glyph_bitmap(
+        font.glyph.bitmap.buffer,
+        width,
+        height,
+        font.glyph.bitmap.pitch,
+        font.glyph.bitmap.pixel_mode,
+        bpp,
+    )
     ascender = pt_to_px(font.size.ascender)
     if ascender == 0:
         if not font.is_scalable:
@@ -543,6 +648,165 @@ def glyph_to_glyphinfo(glyph, font, size, bpp):
     )
 
 
+def get_glyph_cache() -> GlyphCache:
+    """
+    Get the glyph cache for this build, stored alongside downloaded font files
+    """
+    if (cache := CORE.data.get(KEY_GLYPH_CACHE)) is None:
+        cache = GlyphCache(
+            external_files.compute_local_file_dir(DOMAIN) / "glyphs",
+            CORE.data.get(KEY_GLYPH_CACHE_SIZE, DEFAULT_CACHE_SIZE),
+        )
+        CORE.data[KEY_GLYPH_CACHE] = cache
+    return cache
+
+
+def cached_glyph_to_glyphinfo(glyph, file, size, bpp):
+    """
+    Render a glyph, or fetch it from the glyph cache if this font file has
+    rendered it before at the same size and bpp.
+    """
+    cache = get_glyph_cache()
+    key = (FONT_CACHE.file_hash(file), size, bpp, ord(glyph))
+    if (entry := cache.get(*key)) is not None:
+        return GlyphInfo(ord(glyph), *entry)
+    info = glyph_to_glyphinfo(glyph, FONT_CACHE[file], size, bpp)
+    cache.put(
+        *key,
+        (
+            info.bitmap_data,
+            info.advance,
+            info.offset_x,
+            info.offset_y,
+            info.width,
+            info.height,
+        ),
+    )
+    return info
+
+
+def rle_encode(data):
+    """
+    Compress glyph bitmap data. A control byte below 0x80 is followed by
+    (control + 1) literal bytes; a control byte of 0x80 or above is followed by a
+    single byte to be repeated (control - 0x80 + 3) times.
+    Must match the decoder in font.cpp.
+    """
+    result = []
+    pos = 0
+    size = len(data)
+    while pos < size:
+        run = 1
+        while pos + run < size and run < 130 and data[pos + run] == data[pos]:
+            run += 1
+        if run >= 3:
+            result += [0x80 | (run - 3), data[pos]]
+            pos += run
+            continue
+        start = pos
+        while pos < size and pos - start < 128:
+            if pos + 2 < size and data[pos] == data[pos + 1] == data[pos + 2]:
+                break
+            pos += 1
+        result += [pos - start - 1, *data[start:pos]]
+    return result
+
+
+def glyph_index_tables(codepoints, max_pages):
+    """
+    Build a direct lookup index for Basic Multilingual Plane pages used by a font.
+    Page 0, holding ASCII, is indexed first; other pages only if they have at least
+    GLYPH_INDEX_MIN_GLYPHS glyphs, densest first.
+    :param codepoints: The integer codepoints of the glyph table, in table order
+    :param max_pages: The most pages to index, each costing 512 bytes
+    :return: A 256 entry map from the high byte of a codepoint to a page number
+    (0 meaning not indexed), a table of 256 glyph indices per indexed page, and
+    whether every BMP codepoint in the font is covered by the index
+    """
+    counts = Counter(x >> 8 for x in codepoints if x <= 0xFFFF)
+    dense = sorted(
+        (p for p, n in counts.items() if p == 0 or n >= GLYPH_INDEX_MIN_GLYPHS),
+        key=lambda p: (p != 0, -counts[p], p),
+    )
+    pages = sorted(dense[:max_pages])
+    complete = len(pages) == len(counts)
+    page_map = [0] * 256
+    for number, page in enumerate(pages):
+        page_map[page] = number + 1
+    index = [GLYPH_INDEX_NONE] * (256 * len(pages))
+    for glyph_index, codepoint in enumerate(codepoints):
+        if codepoint <= 0xFFFF and (page := page_map[codepoint >> 8]) != 0:
+            index[(page - 1) * 256 + (codepoint & 0xFF)] = glyph_index
+    return page_map, index, complete
+
+
+# Faces opened by a worker process, keyed by font file path
+WORKER_FACES: dict[str, Face] = {}
+
+
+def render_glyph_chunk(path, size, bpp, codepoints):
+    """
+    Render a list of codepoints in a worker process. freetype faces cannot be
+    shared between processes, so each worker opens its own from the font file.
+    :return: A list of (codepoint, glyph cache entry) pairs
+    """
+    if (font := WORKER_FACES.get(path)) is None:
+        font = Face(path)
+        WORKER_FACES[path] = font
+    result = []
+    for codepoint in codepoints:
+        info = glyph_to_glyphinfo(chr(codepoint), font, size, bpp)
+        result.append(
+            (
+                codepoint,
+                (
+                    info.bitmap_data,
+                    info.advance,
+                    info.offset_x,
+                    info.offset_y,
+                    info.width,
+                    info.height,
+                ),
+            )
+        )
+    return result
+
+
+def prerender_glyphs(point_font_map, size, bpp, max_workers):
+    """
+    Render all glyphs missing from the glyph cache across a process pool, storing
+    the results in the cache. Worker processes inherit the loaded modules, so this
+    requires the fork start method and is skipped where it is unavailable.
+    """
+    cache = get_glyph_cache()
+    missing: dict[str, tuple[str, list[int]]] = {}
+    for glyph, file in point_font_map.items():
+        font_hash = FONT_CACHE.file_hash(file)
+        if not cache.contains(font_hash, size, bpp, ord(glyph)):
+            path = str(FONT_CACHE.get_path(file))
+            missing.setdefault(font_hash, (path, []))[1].append(ord(glyph))
+    total = sum(len(points) for _, points in missing.values())
+    workers = min(max_workers or os.cpu_count() or 1, total)
+    if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return
+
+    # Several chunks per worker keeps the pool busy when glyph costs vary
+    chunk_size = max(1, -(-total // (workers * 4)))
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as pool:
+        futures = [
+            (font_hash, pool.submit(render_glyph_chunk, path, size, bpp, chunk))
+            for font_hash, (path, points) in missing.items()
+            for chunk in (
+                points[i : i + chunk_size] for i in range(0, len(points), chunk_size)
+            )
+        ]
+        for font_hash, future in futures:
+            for codepoint, value in future.result():
+                cache.put(font_hash, size, bpp, codepoint, value)
+
+
 async def to_code(config):
     """
     Collect all glyph codepoints, construct a map from a codepoint to a font file.
@@ -562,58 +826,77 @@ async def to_code(config):
     # get the codepoints from the glyphs key, flatten to a list of chrs and combine with the points from glyphsets
     point_set.update(flatten(config[CONF_GLYPHS]))
     # Create the codepoint to font file map
-    base_font = FONT_CACHE[config[CONF_FILE]]
-    point_font_map: dict[str, Face] = {c: base_font for c in point_set}
+    base_file = config[CONF_FILE]
+    base_font = FONT_CACHE[base_file]
+    point_font_map: dict[str, ConfigType] = {c: base_file for c in point_set}
     # process extras, updating the map and extending the codepoint list
     for extra in config[CONF_EXTRAS]:
         extra_points = flatten(extra[CONF_GLYPHS])
         point_set.update(extra_points)
-        extra_font = FONT_CACHE[extra[CONF_FILE]]
-        point_font_map.update({c: extra_font for c in extra_points})
+        point_font_map.update({c: extra[CONF_FILE] for c in extra_points})
 
     codepoints = list(point_set)
     codepoints.sort(key=functools.cmp_to_key(glyph_comparator))
     bpp = config[CONF_BPP]
     size = config[CONF_SIZE]
-    # create the data array for all glyphs
+    if config[CONF_MAX_WORKERS] != 1:
+        prerender_glyphs(point_font_map, size, bpp, config[CONF_MAX_WORKERS])
+    # create the data array for all glyphs, in glyph_comparator order
     glyph_args = [
-        glyph_to_glyphinfo(x, point_font_map[x], size, bpp) for x in codepoints
+        cached_glyph_to_glyphinfo(x, point_font_map[x], size, bpp) for x in codepoints
     ]
-    rhs = [HexInt(x) for x in flatten([x.bitmap_data for x in glyph_args])]
+    bitmaps = [x.bitmap_data for x in glyph_args]
+    compressed = config[CONF_COMPRESSION] == COMPRESSION_RLE
+    if compressed:
+        raw_size = sum(len(x) for x in bitmaps)
+        bitmaps = [rle_encode(x) for x in bitmaps]
+        _LOGGER.info(
+            "Font %s: glyph bitmaps compressed from %d to %d bytes",
+            config[CONF_ID],
+            raw_size,
+            sum(len(x) for x in bitmaps),
+        )
+    rhs = [HexInt(x) for x in flatten(bitmaps)]
     prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], rhs)
 
     # Create the glyph table that points to data in the above array.
     glyph_initializer = [
         [
             x.glyph,
-            prog_arr + (y - len(x.bitmap_data)),
+            prog_arr + (y - len(bitmap)),
             x.advance,
             x.offset_x,
             x.offset_y,
             x.width,
             x.height,
         ]
-        for (x, y) in zip(
-            glyph_args, list(accumulate([len(x.bitmap_data) for x in glyph_args]))
+        for (x, bitmap, y) in zip(
+            glyph_args, bitmaps, list(accumulate([len(x) for x in bitmaps]))
         )
     ]
 
     glyphs = cg.static_const_array(config[CONF_RAW_GLYPH_ID], glyph_initializer)
+    page_map, glyph_index, index_complete = glyph_index_tables(
+        [x.glyph for x in glyph_args], config[CONF_GLYPH_INDEX_PAGES]
+    )
 
+    # Glyphs may all have come from the cache, so make sure the metrics are current
+    set_font_size(base_font, size)
     font_height = pt_to_px(base_font.size.height)
     ascender = pt_to_px(base_font.size.ascender)
     descender = abs(pt_to_px(base_font.size.descender))
-    g = glyph_to_glyphinfo("x", base_font, size, bpp)
+    g = cached_glyph_to_glyphinfo("x", base_file, size, bpp)
     xheight = g.height if len(g.bitmap_data) > 1 else 0
-    g = glyph_to_glyphinfo("X", base_font, size, bpp)
+    g = cached_glyph_to_glyphinfo("X", base_file, size, bpp)
     capheight = g.height if len(g.bitmap_data) > 1 else 0
+    get_glyph_cache().save()
     if font_height == 0:
         if not base_font.is_scalable:
             font_height = size
             ascender = font_height
         else:
             _LOGGER.error("Unable to determine height of font %s", config[CONF_FILE])
-    cg.new_Pvariable(
+    var = cg.new_Pvariable(
         config[CONF_ID],
         glyphs,
         len(glyph_initializer),
@@ -624,3 +907,16 @@ async def to_code(config):
         capheight,
         bpp,
     )
+    if compressed:
+        max_glyph_size = max((len(x.bitmap_data) for x in glyph_args), default=0)
+        cg.add(var.set_compressed(config[CONF_GLYPH_CACHE_SIZE], max_glyph_size))
+    if len(glyph_args) < GLYPH_INDEX_NONE and glyph_index:
+        cg.add(
+            var.set_glyph_index(
+                cg.progmem_array(
+                    config[CONF_RAW_PAGE_MAP_ID], [HexInt(x) for x in page_map]
+                ),
+                cg.progmem_array(config[CONF_RAW_GLYPH_INDEX_ID], glyph_index),
+                index_complete,
+            )
+        )
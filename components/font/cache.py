@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the rendered output for identical inputs changes
+CACHE_VERSION = 1
+
+
+class GlyphCache:
+    """
+    Persistent store of rendered glyphs.
+
+    Glyphs are grouped into one JSON table per (font file hash, size, bpp), mapping
+    each codepoint to its packed bitmap and metrics. Tables are loaded on first use
+    and written back by `save()` only if new glyphs were added. Tables are evicted
+    least-recently-used first once the total size exceeds ``max_size`` bytes; a
+    ``max_size`` of 0 keeps glyphs for the current build only.
+    """
+
+    def __init__(self, directory: Path, max_size: int):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.tables = {}
+        self.dirty = set()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _table_path(self, font_hash: str, size: int, bpp: int) -> Path:
+        return self.directory / f"{font_hash[:16]}_{size}_{bpp}_v{CACHE_VERSION}.json"
+
+    def _table(self, font_hash: str, size: int, bpp: int) -> dict:
+        key = (font_hash, size, bpp)
+        if (table := self.tables.get(key)) is None:
+            table = {}
+            path = self._table_path(*key)
+            if self.enabled:
+                with contextlib.suppress(OSError, ValueError):
+                    content = json.loads(path.read_text())
+                    if content.get("font") == font_hash:
+                        table = content["glyphs"]
+                        # Touch the table so eviction is least-recently-used
+                        os.utime(path)
+            self.tables[key] = table
+        return table
+
+    def contains(self, font_hash: str, size: int, bpp: int, codepoint: int) -> bool:
+        return str(codepoint) in self._table(font_hash, size, bpp)
+
+    def get(self, font_hash: str, size: int, bpp: int, codepoint: int):
+        """
+        :return: (bitmap_data, advance, offset_x, offset_y, width, height) or None
+        """
+        entry = self._table(font_hash, size, bpp).get(str(codepoint))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        data, *metrics = entry
+        return (list(bytes.fromhex(data)), *metrics)
+
+    def put(self, font_hash: str, size: int, bpp: int, codepoint: int, value):
+        data, *metrics = value
+        self._table(font_hash, size, bpp)[str(codepoint)] = [
+            bytes(data).hex(),
+            *metrics,
+        ]
+        self.dirty.add((font_hash, size, bpp))
+
+    def save(self) -> None:
+        """
+        Write back any tables that gained new glyphs and evict old ones if the cache
+        is over budget
+        """
+        for key in self.dirty if self.enabled else ():
+            path = self._table_path(*key)
+            content = json.dumps({"font": key[0], "glyphs": self.tables[key]})
+            if len(content) > self.max_size:
+                continue
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.tmp")
+                tmp.write_text(content)
+                os.replace(tmp, path)
+            except OSError as exc:
+                _LOGGER.warning("Could not write glyph cache %s: %s", path, exc)
+        if self.dirty and self.enabled:
+            self.evict()
+        self.dirty.clear()
+        if self.hits or self.misses:
+            _LOGGER.debug(
+                "Glyph cache: %d hits, %d misses, %d evicted",
+                self.hits,
+                self.misses,
+                self.evicted,
+            )
+
+    def evict(self) -> None:
+        """
+        Remove least-recently-used tables until the cache fits within max_size
+        """
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+            total -= size
+            self.evicted += 1
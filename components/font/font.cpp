@@ -2,6 +2,7 @@
 
 #include "esphome/core/color.h"
 #include "esphome/core/hal.h"
+#include "esphome/core/helpers.h"
 #include "esphome/core/log.h"
 
 namespace esphome {
@@ -12,6 +13,12 @@ static const char *const TAG = "font";
 const uint8_t *Font::get_glyph_bitmap(const lv_font_t *font, uint32_t unicode_letter) {
   auto *fe = (Font *) font->dsc;
   const auto *gd = fe->get_glyph_data_(unicode_letter);
+  if (gd == nullptr) {
+    return nullptr;
+  }
+  return fe->get_bitmap(gd);
+}
+
 static const uint8_t OPA4_TABLE[16] = {0, 17, 34, 51, 68, 85, 102, 119, 136, 153, 170, 187, 204, 221, 238, 255};
 
 static const uint8_t OPA2_TABLE[4] = {0, 85, 170, 255};
@@ -24,9 +31,9 @@ const void *Font::get_glyph_bitmap(lv_font_glyph_dsc_t *dsc, lv_draw_buf_t *draw
   if (gd == nullptr) {
     return nullptr;
   }
-  return gd->data;
+  return fe->get_bitmap(gd);
 
-  const uint8_t *bitmap_in = gd->data;
+  const uint8_t *bitmap_in = fe->get_bitmap(gd);
   uint8_t *bitmap_out_tmp = draw_buf->data;
   int32_t i = 0;
   int32_t x, y;
@@ -97,6 +104,14 @@ const void *Font::get_glyph_bitmap(lv_font_glyph_dsc_t *dsc, lv_draw_buf_t *draw
 }
 
 bool Font::get_glyph_dsc_cb(const lv_font_t *font, lv_font_glyph_dsc_t *dsc, uint32_t unicode_letter, uint32_t next) {
+  auto *fe = (Font *) font->dsc;
+  const auto *gd = fe->get_glyph_data_(unicode_letter);
+  if (gd == nullptr) {
+    return false;
+  }
+  dsc->adv_w = gd->advance;
+  dsc->ofs_x = gd->offset_x;
+  dsc->ofs_y = fe->height_ - gd->height - gd->offset_y - fe->lv_font_.base_line;
   dsc->box_w = gd->width;
   dsc->box_h = gd->height;
   dsc->is_placeholder = 0;
@@ -244,6 +259,20 @@ Font::Font(const Glyph *data, int data_nr, int baseline, int height, int descend
 }
 
 const Glyph *Font::find_glyph(uint32_t codepoint) const {
+  // Direct lookup for the BMP pages this font uses; ASCII is always page 0.
+  if (this->page_map_ != nullptr && codepoint <= 0xFFFF) {
+    uint8_t page = progmem_read_byte(this->page_map_ + (codepoint >> 8));
+    if (page != 0) {
+      uint16_t index = progmem_read_uint16(this->glyph_index_ + (page - 1) * 256 + (codepoint & 0xFF));
+      if (index == GLYPH_INDEX_NONE)
+        return nullptr;
+      return &this->glyphs_[index];
+    }
+    if (this->index_complete_)
+      return nullptr;
+  }
+  if (this->glyphs_.empty())
+    return nullptr;
   int lo = 0;
   int hi = this->glyphs_.size() - 1;
   while (lo != hi) {
@@ -260,6 +289,63 @@ const Glyph *Font::find_glyph(uint32_t codepoint) const {
   return nullptr;
 }
 
+/**
+ * Decode an RLE compressed glyph bitmap, as produced by rle_encode() in __init__.py.
+ * A control byte below 0x80 is followed by (control + 1) literal bytes, a control byte of 0x80 or above by one byte
+ * to be repeated (control - 0x80 + 3) times.
+ */
+static void rle_decode(const uint8_t *src, uint8_t *dst, size_t size) {
+  size_t pos = 0;
+  while (pos < size) {
+    uint8_t control = progmem_read_byte(src++);
+    if (control & 0x80) {
+      size_t count = (control & 0x7F) + 3;
+      uint8_t value = progmem_read_byte(src++);
+      while (count-- != 0 && pos < size)
+        dst[pos++] = value;
+    } else {
+      size_t count = control + 1;
+      while (count-- != 0 && pos < size)
+        dst[pos++] = progmem_read_byte(src++);
+    }
+  }
+}
+
+void Font::set_compressed(uint8_t cache_size, size_t max_glyph_size) {
+  this->compressed_ = true;
+  this->max_glyph_size_ = max_glyph_size;
+  this->cache_slots_.assign(cache_size, GlyphCacheSlot{0, 0});
+  RAMAllocator<uint8_t> allocator;
+  this->cache_data_ = allocator.allocate(cache_size * max_glyph_size);
+  if (this->cache_data_ == nullptr && max_glyph_size != 0)
+    ESP_LOGE(TAG, "Could not allocate %zu bytes for the glyph cache", cache_size * max_glyph_size);
+}
+
+const uint8_t *Font::get_bitmap(const Glyph *glyph) {
+  if (!this->compressed_ || this->max_glyph_size_ == 0)
+    return glyph->data;
+  if (this->cache_data_ == nullptr)
+    return nullptr;
+  // Codepoint 0 is never a glyph, so it marks an empty slot. Evict the least recently used slot on a miss.
+  size_t victim = 0;
+  this->cache_tick_++;
+  for (size_t i = 0; i != this->cache_slots_.size(); i++) {
+    auto &slot = this->cache_slots_[i];
+    if (slot.code_point == glyph->code_point) {
+      slot.last_used = this->cache_tick_;
+      return this->cache_data_ + i * this->max_glyph_size_;
+    }
+    if (slot.last_used < this->cache_slots_[victim].last_used)
+      victim = i;
+  }
+  auto &slot = this->cache_slots_[victim];
+  slot.code_point = glyph->code_point;
+  slot.last_used = this->cache_tick_;
+  uint8_t *dst = this->cache_data_ + victim * this->max_glyph_size_;
+  rle_decode(glyph->data, dst, (glyph->width * glyph->height * this->bpp_ + 7) / 8);
+  return dst;
+}
+
 #ifdef USE_DISPLAY
 void Font::measure(const char *str, int *width, int *x_offset, int *baseline, int *height) {
   *baseline = this->baseline_;
@@ -314,7 +400,9 @@ void Font::print(int x_start, int y_start, display::Display *display, Color colo
       continue;
     }
 
-    const uint8_t *data = glyph->data;
+    const uint8_t *data = this->get_bitmap(glyph);
+    if (data == nullptr)
+      continue;
     const int max_x = x_at + glyph->offset_x + glyph->width;
     const int max_y = y_start + glyph->offset_y + glyph->height;
 
@@ -3,6 +3,7 @@
 #include "esphome/core/color.h"
 #include "esphome/core/datatypes.h"
 #include "esphome/core/defines.h"
+#include <vector>
 #ifdef USE_DISPLAY
 #include "esphome/components/display/display.h"
 #endif
@@ -15,6 +16,9 @@ namespace font {
 
 class Font;
 
+/// Marks a codepoint with no glyph in the glyph index.
+static const uint16_t GLYPH_INDEX_NONE = 0xFFFF;
+
 class Glyph {
  public:
   constexpr Glyph(uint32_t code_point, const uint8_t *data, int advance, int offset_x, int offset_y, int width,
@@ -60,6 +64,27 @@ class Font
 
   const Glyph *find_glyph(uint32_t codepoint) const;
 
+  /** Set the direct lookup index generated for the Basic Multilingual Plane pages used by this font.
+   *
+   * @param page_map 256 entries mapping the high byte of a codepoint to a page number, 0 if not indexed.
+   * @param glyph_index 256 glyph indices per page, GLYPH_INDEX_NONE where there is no glyph.
+   * @param complete True if every BMP glyph is covered, so a codepoint on an unindexed page has no glyph.
+   */
+  void set_glyph_index(const uint8_t *page_map, const uint16_t *glyph_index, bool complete) {
+    this->page_map_ = page_map;
+    this->glyph_index_ = glyph_index;
+    this->index_complete_ = complete;
+  }
+
+  /** Mark the glyph bitmaps as RLE compressed and set up the decode cache.
+   *
+   * @param cache_size The number of decoded glyphs to keep.
+   * @param max_glyph_size The size in bytes of the largest decoded glyph bitmap.
+   */
+  void set_compressed(uint8_t cache_size, size_t max_glyph_size);
+  /// Get the packed bitmap of a glyph, decoding it into the glyph cache if the font is compressed.
+  const uint8_t *get_bitmap(const Glyph *glyph);
+
 #ifdef USE_DISPLAY
   void print(int x_start, int y_start, display::Display *display, Color color, const char *text,
              Color background) override;
@@ -88,6 +113,18 @@ class Font
   int xheight_;
   int capheight_;
   uint8_t bpp_;  // bits per pixel
+  const uint8_t *page_map_{};
+  const uint16_t *glyph_index_{};
+  bool index_complete_{};
+  struct GlyphCacheSlot {
+    uint32_t code_point;
+    uint32_t last_used;
+  };
+  bool compressed_{false};
+  size_t max_glyph_size_{};
+  std::vector<GlyphCacheSlot> cache_slots_{};
+  uint8_t *cache_data_{};
+  uint32_t cache_tick_{};
 #ifdef USE_LVGL_FONT
   lv_font_t lv_font_{};
   static const uint8_t *get_glyph_bitmap(const lv_font_t *font, uint32_t unicode_letter);
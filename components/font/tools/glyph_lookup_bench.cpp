@@ -0,0 +1,113 @@
+// Host micro-benchmark for Font::find_glyph(): binary search against the direct page index.
+//
+// The tables are laid out as glyph_index_tables() in __init__.py generates them, and both lookups
+// mirror font.cpp. Build and run with:
+//
+//   g++ -O2 -std=c++17 -o glyph_lookup_bench glyph_lookup_bench.cpp && ./glyph_lookup_bench
+//
+// The font is printable ASCII plus 3000 CJK ideographs; the text is 80% ASCII.
+
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <random>
+#include <vector>
+
+static const uint16_t GLYPH_INDEX_NONE = 0xFFFF;
+
+struct Index {
+  std::vector<uint8_t> page_map = std::vector<uint8_t>(256);
+  std::vector<uint16_t> glyph_index;
+  bool complete{};
+};
+
+static const uint32_t *binary_search(const std::vector<uint32_t> &glyphs, uint32_t codepoint) {
+  if (glyphs.empty())
+    return nullptr;
+  int lo = 0;
+  int hi = glyphs.size() - 1;
+  while (lo != hi) {
+    int mid = (lo + hi + 1) / 2;
+    if (glyphs[mid] <= codepoint) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return glyphs[lo] == codepoint ? &glyphs[lo] : nullptr;
+}
+
+static const uint32_t *indexed(const std::vector<uint32_t> &glyphs, const Index &index, uint32_t codepoint) {
+  if (codepoint <= 0xFFFF) {
+    uint8_t page = index.page_map[codepoint >> 8];
+    if (page != 0) {
+      uint16_t i = index.glyph_index[(page - 1) * 256 + (codepoint & 0xFF)];
+      return i == GLYPH_INDEX_NONE ? nullptr : &glyphs[i];
+    }
+    if (index.complete)
+      return nullptr;
+  }
+  return binary_search(glyphs, codepoint);
+}
+
+// Index page 0 and up to max_pages - 1 other pages, as glyph_index_tables() does for dense pages
+static Index build_index(const std::vector<uint32_t> &glyphs, size_t max_pages) {
+  Index index;
+  std::vector<size_t> counts(256);
+  for (auto cp : glyphs) {
+    if (cp <= 0xFFFF)
+      counts[cp >> 8]++;
+  }
+  size_t used = 0, pages = 0;
+  for (size_t page = 0; page != 256; page++) {
+    if (counts[page] == 0)
+      continue;
+    used++;
+    if (pages < max_pages && (page == 0 || counts[page] >= 32))
+      index.page_map[page] = ++pages;
+  }
+  index.complete = pages == used;
+  index.glyph_index.assign(pages * 256, GLYPH_INDEX_NONE);
+  for (size_t i = 0; i != glyphs.size(); i++) {
+    uint32_t cp = glyphs[i];
+    if (cp <= 0xFFFF && index.page_map[cp >> 8] != 0)
+      index.glyph_index[(index.page_map[cp >> 8] - 1) * 256 + (cp & 0xFF)] = i;
+  }
+  return index;
+}
+
+template<typename F> static double time_ns(const std::vector<uint32_t> &text, F lookup) {
+  size_t found = 0;
+  auto start = std::chrono::steady_clock::now();
+  for (int round = 0; round != 20; round++) {
+    for (auto cp : text)
+      found += lookup(cp) != nullptr;
+  }
+  std::chrono::duration<double, std::nano> elapsed = std::chrono::steady_clock::now() - start;
+  if (found == 0)
+    printf("no glyphs found\n");
+  return elapsed.count() / (20.0 * text.size());
+}
+
+int main() {
+  std::vector<uint32_t> glyphs;
+  for (uint32_t cp = 0x20; cp != 0x7F; cp++)
+    glyphs.push_back(cp);
+  for (uint32_t cp = 0x4E00; cp != 0x4E00 + 3000; cp++)
+    glyphs.push_back(cp);
+
+  std::mt19937 rng(1);
+  std::vector<uint32_t> text(1 << 20);
+  for (auto &cp : text)
+    cp = rng() % 5 != 0 ? 0x20 + rng() % 95 : glyphs[95 + rng() % 3000];
+
+  printf("binary search      %6.2f ns/lookup\n",
+         time_ns(text, [&](uint32_t cp) { return binary_search(glyphs, cp); }));
+  for (size_t pages : {1, 4, 16}) {
+    Index index = build_index(glyphs, pages);
+    printf("index, %2zu pages    %6.2f ns/lookup, %zu bytes\n", pages,
+           time_ns(text, [&](uint32_t cp) { return indexed(glyphs, index, cp); }),
+           index.page_map.size() + index.glyph_index.size() * 2);
+  }
+  return 0;
+}
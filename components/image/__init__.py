@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 import contextlib
 import hashlib
 import io
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 import re
 
 from PIL import Image, UnidentifiedImageError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from esphome import core, external_files
 import esphome.codegen as cg
 from esphome.components.const import CONF_BYTE_ORDER
@@ -31,6 +39,9 @@ from esphome.const import (
 from esphome.core import CORE, HexInt
 from esphome.final_validate import full_config
 
+from .cache import ImageCache
+from .compression import COMPRESSION_NONE, COMPRESSIONS, compress
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "image"
@@ -39,12 +50,28 @@ DEPENDENCIES = ["display"]
 image_ns = cg.esphome_ns.namespace("image")
 
 ImageType = image_ns.enum("ImageType")
+ImageCompression = image_ns.enum("ImageCompression")
 
 CONF_OPAQUE = "opaque"
 CONF_CHROMA_KEY = "chroma_key"
 CONF_ALPHA_CHANNEL = "alpha_channel"
 CONF_INVERT_ALPHA = "invert_alpha"
 CONF_IMAGES = "images"
+CONF_CACHE_SIZE = "cache_size"
+CONF_MAX_WORKERS = "max_workers"
+CONF_COMPRESSION = "compression"
+CONF_DECODE_CACHE_SIZE = "decode_cache_size"
+
+# Keys into CORE.data for build-wide image settings and state
+KEY_IMAGE_OPTIONS = "image_options"
+KEY_IMAGE_CACHE = "image_cache"
+
+# Default upper bound for the on-disk cache of converted images
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+# Images are converted serially unless more workers are allowed; 0 means one per CPU
+DEFAULT_MAX_WORKERS = 1
+# Default RAM budget on the device for decoded copies of compressed images
+DEFAULT_DECODE_CACHE_SIZE = 1024 * 1024
 
 TRANSPARENCY_TYPES = (
     CONF_OPAQUE,
@@ -61,6 +88,10 @@ def get_transparency_enum(transparency):
     return getattr(TransparencyType, f"TRANSPARENCY_{transparency.upper()}")
 
 
+def get_compression_enum(compression):
+    return getattr(ImageCompression, f"IMAGE_COMPRESSION_{compression}")
+
+
 class ImageEncoder:
     """
     Superclass of image type encoders
@@ -106,6 +137,26 @@ class ImageEncoder:
         Encode a single pixel
         """
 
+    def encode_frame(self, frame):
+        """
+        Encode a complete frame in one pass. Subclasses override this with array
+        operations; the default falls back to the per-pixel path.
+        :param frame: numpy array of the converted frame, (height, width[, channels])
+        """
+        for row in frame.tolist():
+            for pixel in row:
+                self.encode(pixel)
+            self.end_row()
+
+    def write_bytes(self, values):
+        """
+        Store a flat array of encoded bytes at the current index
+        """
+        values = values.ravel().tolist()
+        end = self.index + len(values)
+        self.data[self.index : end] = values
+        self.index = end
+
     def end_row(self):
         """
         Marks the end of a pixel row
@@ -173,6 +224,13 @@ class ImageBinary(ImageEncoder):
             self.bitno = 0
             self.index += 1
 
+    def encode_frame(self, frame):
+        bits = frame.astype(bool)
+        if self.invert_alpha:
+            bits = ~bits
+        # packbits pads each row to a byte boundary, matching end_row()
+        self.write_bytes(np.packbits(bits, axis=1))
+
     def end_row(self):
         """
         Pad rows to a byte boundary
@@ -211,6 +269,18 @@ class ImageGrayscale(ImageEncoder):
         self.data[self.index] = b
         self.index += 1
 
+    def encode_frame(self, frame):
+        b = frame[..., 0].copy()
+        a = frame[..., 1]
+        if self.transparency == CONF_CHROMA_KEY:
+            b[b == 1] = 0
+            b[a != 0xFF] = 1
+        if self.invert_alpha:
+            b ^= 0xFF
+        if self.transparency == CONF_ALPHA_CHANNEL:
+            b = np.where(a != 0xFF, a, b)
+        self.write_bytes(b)
+
 
 class ImageRGB565(ImageEncoder):
     def __init__(self, width, height, transparency, dither, invert_alpha):
@@ -260,6 +330,26 @@ class ImageRGB565(ImageEncoder):
             self.data[self.index] = rgb >> 8
             self.index += 1
 
+    def encode_frame(self, frame):
+        r = frame[..., 0].astype(np.uint16) >> 3
+        g = frame[..., 1].astype(np.uint16) >> 2
+        b = frame[..., 2].astype(np.uint16) >> 3
+        a = frame[..., 3].copy()
+        if self.invert_alpha:
+            a ^= 0xFF
+        start = self.index // 2
+        self.alpha[start : start + a.size] = a.ravel().tolist()
+        if self.transparency == CONF_CHROMA_KEY:
+            key = (r == 0) & (g == 1) & (b == 0)
+            g[key] = 0
+            transparent = ~key & (a < 128)
+            r[transparent] = 0
+            g[transparent] = 1
+            b[transparent] = 0
+        rgb = (r << 11) | (g << 5) | b
+        dtype = ">u2" if self.big_endian else "<u2"
+        self.write_bytes(rgb.astype(dtype).view(np.uint8))
+
     def end_image(self):
         if self.transparency == CONF_ALPHA_CHANNEL:
             self.data.extend(self.alpha)
@@ -300,6 +390,25 @@ class ImageRGB(ImageEncoder):
             self.data[self.index] = a
             self.index += 1
 
+    def encode_frame(self, frame):
+        r = frame[..., 0].copy()
+        g = frame[..., 1].copy()
+        b = frame[..., 2].copy()
+        a = frame[..., 3].copy()
+        if self.transparency == CONF_CHROMA_KEY:
+            key = (r == 0) & (g == 1) & (b == 0)
+            g[key] = 0
+            transparent = ~key & (a < 128)
+            r[transparent] = 0
+            g[transparent] = 1
+            b[transparent] = 0
+        channels = [b, g, r]
+        if self.transparency == CONF_ALPHA_CHANNEL:
+            if self.invert_alpha:
+                a ^= 0xFF
+            channels.append(a)
+        self.write_bytes(np.stack(channels, axis=-1))
+
 
 class ReplaceWith:
     """
@@ -489,6 +598,11 @@ def validate_settings(value, path=()):
             f"Image format '{conf_type}' does not support byte order configuration",
             path=path,
         )
+    compression = value.get(CONF_COMPRESSION, COMPRESSION_NONE)
+    if compression != COMPRESSION_NONE and conf_type == "BINARY":
+        raise cv.Invalid(
+            "Image format 'BINARY' does not support compression", path=path
+        )
     if file := value.get(CONF_FILE):
         file = Path(file)
         if not is_svg_file(file):
@@ -516,6 +630,9 @@ OPTIONS_SCHEMA = {
     cv.Optional(CONF_INVERT_ALPHA, default=False): cv.boolean,
     cv.Optional(CONF_BYTE_ORDER): cv.one_of("BIG_ENDIAN", "LITTLE_ENDIAN", upper=True),
     cv.Optional(CONF_TRANSPARENCY, default=CONF_OPAQUE): validate_transparency(),
+    cv.Optional(CONF_COMPRESSION, default=COMPRESSION_NONE): cv.one_of(
+        *COMPRESSIONS, upper=True
+    ),
 }
 
 DEFAULTS_SCHEMA = {
@@ -629,6 +746,18 @@ def typed_image_schema(image_type):
     )
 
 
+def store_options(value):
+    """
+    Record the build-wide options, which are not part of any single image config.
+    """
+    CORE.data[KEY_IMAGE_OPTIONS] = {
+        CONF_CACHE_SIZE: value[CONF_CACHE_SIZE],
+        CONF_MAX_WORKERS: value[CONF_MAX_WORKERS],
+        CONF_DECODE_CACHE_SIZE: value[CONF_DECODE_CACHE_SIZE],
+    }
+    return value
+
+
 # The config schema can be a (possibly empty) single list of images,
 # or a dictionary with optional keys `defaults:`, `images:` and the image types
 
@@ -653,8 +782,18 @@ def _config_schema(value):
                     }
                 ),
                 **{cv.Optional(t.lower()): typed_image_schema(t) for t in IMAGE_TYPE},
+                cv.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): cv.All(
+                    cv.float_with_unit("cache size", "(B|b)?"), int
+                ),
+                cv.Optional(
+                    CONF_MAX_WORKERS, default=DEFAULT_MAX_WORKERS
+                ): cv.int_range(min=0),
+                cv.Optional(
+                    CONF_DECODE_CACHE_SIZE, default=DEFAULT_DECODE_CACHE_SIZE
+                ): cv.All(cv.float_with_unit("decode cache size", "(B|b)?"), int),
             }
         ),
+        store_options,
         validate_defaults,
     )(value)
 
@@ -680,11 +819,42 @@ def _final_validate(config):
 FINAL_VALIDATE_SCHEMA = _final_validate
 
 
-async def write_image(config, all_frames=False):
-    path = Path(config[CONF_FILE])
-    if not path.is_file():
-        raise core.EsphomeError(f"Could not load image file {path}")
+def get_image_cache() -> ImageCache:
+    """
+    Get the image cache for this build, stored in the build data directory
+    alongside downloaded files.
+    """
+    if (cache := CORE.data.get(KEY_IMAGE_CACHE)) is None:
+        options = CORE.data.get(KEY_IMAGE_OPTIONS, {})
+        cache = ImageCache(
+            external_files.compute_local_file_dir(DOMAIN) / "cache",
+            options.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
+        )
+        CORE.data[KEY_IMAGE_CACHE] = cache
+    return cache
+
+
+def cache_settings(config, all_frames):
+    """
+    The settings that, together with the source file, determine the encoded output
+    """
+    return {
+        "type": config[CONF_TYPE],
+        "transparency": config.get(CONF_TRANSPARENCY, CONF_OPAQUE),
+        "invert_alpha": config[CONF_INVERT_ALPHA],
+        "dither": config[CONF_DITHER],
+        "resize": list(config[CONF_RESIZE]) if CONF_RESIZE in config else None,
+        "byte_order": config.get(CONF_BYTE_ORDER),
+        "all_frames": all_frames,
+    }
 
+
+def convert_image(config, all_frames=False):
+    """
+    Decode, resize and encode an image file.
+    :return: The encoded bytes, width, height, final transparency and frame count
+    """
+    path = Path(config[CONF_FILE])
     resize = config.get(CONF_RESIZE)
     try:
         if is_svg_file(path):
@@ -745,33 +915,197 @@ async def write_image(config, all_frames=False):
         encoder.set_big_endian(byte_order == "BIG_ENDIAN")
     for frame_index in range(frame_count):
         image.seek(frame_index)
-        pixels = encoder.convert(image.resize((width, height)), path).getdata()
-        for row in range(height):
-            for col in range(width):
-                encoder.encode(pixels[row * width + col])
-            encoder.end_row()
+        frame = encoder.convert(image.resize((width, height)), path)
+        if np is not None:
+            encoder.encode_frame(np.asarray(frame))
+        else:
+            pixels = frame.getdata()
+            for row in range(height):
+                for col in range(width):
+                    encoder.encode(pixels[row * width + col])
+                encoder.end_row()
         encoder.end_image()
 
-    rhs = [HexInt(x) for x in encoder.data]
+    return encoder.data, width, height, encoder.transparency, frame_count
+
+
+def conversion_config(config):
+    """
+    Reduce an image config to the plain values used by convert_image, so it can be
+    sent to a worker process.
+    """
+    return {
+        key: config[key]
+        for key in (
+            CONF_FILE,
+            CONF_TYPE,
+            CONF_RESIZE,
+            CONF_DITHER,
+            CONF_TRANSPARENCY,
+            CONF_INVERT_ALPHA,
+            CONF_BYTE_ORDER,
+        )
+        if key in config
+    }
+
+
+def get_worker_pool_context():
+    """
+    Worker processes must inherit the already-loaded external component modules,
+    so only the fork start method can be used. Returns None where it is unavailable.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def load_images(configs, all_frames=False, max_workers=1):
+    """
+    Get the encoded data for a list of image configs, from the cache where possible.
+    Cache misses are converted in a process pool when more than one worker is allowed.
+    :return: A list of (data, width, height, transparency, frame_count) in input order
+    """
+    cache = get_image_cache()
+    results = [None] * len(configs)
+    keys = {}
+    for index, config in enumerate(configs):
+        path = Path(config[CONF_FILE])
+        if not path.is_file():
+            raise core.EsphomeError(f"Could not load image file {path}")
+        key = None
+        if cache.enabled:
+            key = cache.compute_key(path, cache_settings(config, all_frames))
+            if (entry := cache.get(key)) is not None:
+                data, meta = entry
+                results[index] = (
+                    data,
+                    meta[CONF_WIDTH],
+                    meta[CONF_HEIGHT],
+                    meta[CONF_TRANSPARENCY],
+                    meta["frame_count"],
+                )
+                continue
+        keys[index] = key
+
+    workers = min(max_workers or os.cpu_count() or 1, len(keys))
+    context = get_worker_pool_context() if workers > 1 else None
+    if context is None:
+        for index in keys:
+            results[index] = convert_image(configs[index], all_frames)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {
+                index: pool.submit(
+                    convert_image, conversion_config(configs[index]), all_frames
+                )
+                for index in keys
+            }
+            for index, future in futures.items():
+                results[index] = future.result()
+
+    for index, key in keys.items():
+        if key is None:
+            continue
+        data, width, height, transparency, frame_count = results[index]
+        cache.put(
+            key,
+            bytes(data),
+            {
+                CONF_WIDTH: width,
+                CONF_HEIGHT: height,
+                CONF_TRANSPARENCY: transparency,
+                "frame_count": frame_count,
+            },
+        )
+    return results
+
+
+def emit_image(config, converted):
+    """
+    Generate the progmem array for converted image data
+    """
+    data, width, height, transparency, frame_count = converted
+    rhs = [HexInt(x) for x in data]
     prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], rhs)
-    image_type = get_image_type_enum(type)
-    trans_value = get_transparency_enum(encoder.transparency)
+    image_type = get_image_type_enum(config[CONF_TYPE])
+    trans_value = get_transparency_enum(transparency)
 
     return prog_arr, width, height, image_type, trans_value, frame_count
 
 
+def compression_unit(image_type, transparency):
+    """
+    The size in bytes of one pixel, the unit of RLE runs. Must match rle_decode() in
+    image.cpp.
+    """
+    if image_type == "RGB565":
+        return 2
+    if image_type == "RGB":
+        return 4 if transparency == CONF_ALPHA_CHANNEL else 3
+    return 1
+
+
+async def write_image(config, all_frames=False):
+    (converted,) = load_images([config], all_frames)
+    return emit_image(config, converted)
+
+
 async def to_code(config):
     cg.add_define("USE_IMAGE")
     CORE.data[DOMAIN] = {}
+    options = CORE.data.get(KEY_IMAGE_OPTIONS, {})
     # By now the config should be a simple list.
-    for entry in config:
-        prog_arr, width, height, image_type, trans_value, _ = await write_image(entry)
-        cg.new_Pvariable(
+    converted = load_images(
+        config, max_workers=options.get(CONF_MAX_WORKERS, DEFAULT_MAX_WORKERS)
+    )
+    raw_total = 0
+    compressed_total = 0
+    for entry, result in zip(config, converted):
+        compression = entry.get(CONF_COMPRESSION, COMPRESSION_NONE)
+        compressed_size = None
+        if compression != COMPRESSION_NONE:
+            data, width, height, transparency, frame_count = result
+            compressed = compress(
+                data, compression, compression_unit(entry[CONF_TYPE], transparency)
+            )
+            compressed_size = len(compressed)
+            raw_total += len(data)
+            compressed_total += compressed_size
+            _LOGGER.info(
+                "Image %s: %s compressed %d -> %d bytes (%.0f%%)",
+                entry[CONF_ID].id,
+                compression,
+                len(data),
+                compressed_size,
+                100.0 * compressed_size / max(len(data), 1),
+            )
+            result = (compressed, width, height, transparency, frame_count)
+        prog_arr, width, height, image_type, trans_value, _ = emit_image(entry, result)
+        var = cg.new_Pvariable(
             entry[CONF_ID], prog_arr, width, height, image_type, trans_value
         )
+        if compressed_size is not None:
+            cg.add(
+                var.set_compression(
+                    get_compression_enum(compression), compressed_size
+                )
+            )
         CORE.data[DOMAIN][entry[CONF_ID].id] = {
             CONF_WIDTH: width,
             CONF_HEIGHT: height,
             CONF_TYPE: image_type,
             CONF_TRANSPARENCY: trans_value,
         }
+    if raw_total:
+        cg.add_define("USE_IMAGE_COMPRESSION")
+        cg.add_define(
+            "IMAGE_DECODE_CACHE_SIZE",
+            options.get(CONF_DECODE_CACHE_SIZE, DEFAULT_DECODE_CACHE_SIZE),
+        )
+        _LOGGER.info(
+            "Compressed images: %d bytes in flash, %d bytes uncompressed (%d saved)",
+            compressed_total,
+            raw_total,
+            raw_total - compressed_total,
+        )
+    get_image_cache().log_stats()
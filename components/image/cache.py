@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the encoded output for identical inputs changes
+CACHE_VERSION = 1
+
+DATA_SUFFIX = ".bin"
+META_SUFFIX = ".json"
+
+
+class ImageCache:
+    """
+    Content-addressed store of converted image arrays.
+
+    Each entry is a pair of files named by a hash of the source file contents and the
+    encoder settings: ``<key>.bin`` holds the encoded bytes and ``<key>.json`` the
+    dimensions and metadata. Entries are evicted least-recently-used first once the
+    total size exceeds ``max_size`` bytes; a ``max_size`` of 0 disables the cache.
+    """
+
+    def __init__(self, directory: Path, max_size: int):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def compute_key(path: Path, settings: dict) -> str:
+        """
+        Compute the cache key for a source file and its encoder settings
+        :param path: Path to the source image
+        :param settings: JSON-serialisable encoder settings
+        """
+        h = hashlib.new("sha256")
+        h.update(f"v{CACHE_VERSION}".encode())
+        h.update(json.dumps(settings, sort_keys=True).encode())
+        h.update(Path(path).read_bytes())
+        return h.hexdigest()
+
+    def get(self, key: str) -> tuple[bytes, dict] | None:
+        """
+        Look up an entry, returning the encoded bytes and metadata, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        data_path = self.directory / f"{key}{DATA_SUFFIX}"
+        meta_path = self.directory / f"{key}{META_SUFFIX}"
+        try:
+            meta = json.loads(meta_path.read_text())
+            data = data_path.read_bytes()
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if len(data) != meta.get("size"):
+            self.misses += 1
+            return None
+        # Touch the entry so eviction is least-recently-used rather than oldest
+        os.utime(data_path)
+        self.hits += 1
+        return data, meta
+
+    def put(self, key: str, data: bytes, meta: dict) -> None:
+        """
+        Store an entry and evict old ones if the cache is over budget
+        """
+        if not self.enabled or len(data) > self.max_size:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta = {**meta, "size": len(data)}
+        try:
+            for suffix, content in (
+                (DATA_SUFFIX, data),
+                (META_SUFFIX, json.dumps(meta).encode()),
+            ):
+                target = self.directory / f"{key}{suffix}"
+                tmp = self.directory / f"{key}{suffix}.tmp"
+                tmp.write_bytes(content)
+                os.replace(tmp, target)
+        except OSError as exc:
+            _LOGGER.warning("Could not write image cache entry %s: %s", key, exc)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least-recently-used entries until the cache fits within max_size
+        """
+        entries = []
+        total = 0
+        for data_path in self.directory.glob(f"*{DATA_SUFFIX}"):
+            meta_path = data_path.with_suffix(META_SUFFIX)
+            try:
+                stat = data_path.stat()
+                size = stat.st_size + meta_path.stat().st_size
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, size, data_path, meta_path))
+            total += size
+        entries.sort(key=lambda e: e[0])
+        for _, size, data_path, meta_path in entries:
+            if total <= self.max_size:
+                break
+            for p in (data_path, meta_path):
+                with contextlib.suppress(OSError):
+                    p.unlink()
+            total -= size
+            self.evicted += 1
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss/eviction counters for this build
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+        }
+
+    def log_stats(self) -> None:
+        if self.enabled and (self.hits or self.misses):
+            _LOGGER.info(
+                "Image cache: %d hits, %d misses, %d evicted",
+                self.hits,
+                self.misses,
+                self.evicted,
+            )
@@ -0,0 +1,120 @@
+"""
+Compression of encoded image arrays, decoded on the device by image.cpp.
+
+Both formats decode front to back with no lookup tables, so they can be expanded
+straight from flash into a PSRAM buffer when an image is first drawn.
+"""
+
+from __future__ import annotations
+
+# Must match ImageCompression in image.h
+COMPRESSION_NONE = "NONE"
+COMPRESSION_RLE = "RLE"
+COMPRESSION_LZ4 = "LZ4"
+COMPRESSIONS = (COMPRESSION_NONE, COMPRESSION_RLE, COMPRESSION_LZ4)
+
+# LZ4 block format limits
+LZ4_MIN_MATCH = 4
+LZ4_LAST_LITERALS = 5
+LZ4_MATCH_LIMIT = 12
+LZ4_MAX_OFFSET = 0xFFFF
+
+
+def rle_compress(data, unit=1):
+    """
+    Run-length encode data in units of `unit` bytes, normally one pixel, so that
+    runs of multi-byte colours are found. A control byte below 0x80 is followed by
+    (control + 1) literal units; a control byte of 0x80 or above is followed by a
+    single unit to be repeated (control - 0x80 + 2) times.
+    Must match rle_decode() in image.cpp.
+    """
+    data = bytes(data) + bytes(-len(data) % unit)
+    units = [data[i : i + unit] for i in range(0, len(data), unit)]
+    result = bytearray()
+    pos = 0
+    count = len(units)
+    while pos < count:
+        run = 1
+        while pos + run < count and run < 129 and units[pos + run] == units[pos]:
+            run += 1
+        if run >= 2:
+            result.append(0x80 | (run - 2))
+            result += units[pos]
+            pos += run
+            continue
+        start = pos
+        while pos < count and pos - start < 128:
+            if pos + 1 < count and units[pos] == units[pos + 1]:
+                break
+            pos += 1
+        result.append(pos - start - 1)
+        result += b"".join(units[start:pos])
+    return bytes(result)
+
+
+def _lz4_length(out, length):
+    while length >= 255:
+        out.append(255)
+        length -= 255
+    out.append(length)
+
+
+def _lz4_sequence(out, literals, offset=0, match_length=0):
+    match_code = match_length - LZ4_MIN_MATCH if offset else 0
+    out.append((min(len(literals), 15) << 4) | min(match_code, 15))
+    if len(literals) >= 15:
+        _lz4_length(out, len(literals) - 15)
+    out += literals
+    if offset:
+        out += offset.to_bytes(2, "little")
+        if match_code >= 15:
+            _lz4_length(out, match_code - 15)
+
+
+def lz4_compress(data):
+    """
+    Compress data to an LZ4 block, without a frame header or stored size. Uses the
+    lz4 package when it is installed, otherwise a greedy pure Python matcher.
+    Must match lz4_decode() in image.cpp.
+    """
+    data = bytes(data)
+    try:
+        import lz4.block
+
+        return lz4.block.compress(data, mode="high_compression", store_size=False)
+    except ImportError:
+        pass
+    out = bytearray()
+    size = len(data)
+    table = {}
+    anchor = 0
+    pos = 0
+    while pos < size - LZ4_MATCH_LIMIT:
+        key = data[pos : pos + LZ4_MIN_MATCH]
+        candidate = table.get(key)
+        table[key] = pos
+        if candidate is None or pos - candidate > LZ4_MAX_OFFSET:
+            pos += 1
+            continue
+        length = LZ4_MIN_MATCH
+        max_length = size - LZ4_LAST_LITERALS - pos
+        while length < max_length and data[candidate + length] == data[pos + length]:
+            length += 1
+        _lz4_sequence(out, data[anchor:pos], pos - candidate, length)
+        pos += length
+        anchor = pos
+    _lz4_sequence(out, data[anchor:])
+    return bytes(out)
+
+
+def compress(data, compression, unit=1):
+    """
+    Compress an encoded image
+    :param compression: One of COMPRESSIONS
+    :param unit: Bytes per pixel, the run-length unit for RLE
+    """
+    if compression == COMPRESSION_RLE:
+        return rle_compress(data, unit)
+    if compression == COMPRESSION_LZ4:
+        return lz4_compress(data)
+    return bytes(data)
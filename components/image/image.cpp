@@ -2,11 +2,297 @@
 
 #include "esphome/core/hal.h"
 #include "esphome/core/helpers.h"
+#include "esphome/core/log.h"
+
+#ifdef USE_IMAGE_COMPRESSION
+#include <algorithm>
+#include <list>
+#include <vector>
+#ifdef USE_LVGL
+#include "src/draw/lv_image_decoder_private.h"
+#endif  // USE_LVGL
+#endif  // USE_IMAGE_COMPRESSION
 
 namespace esphome {
 namespace image {
 
+static const char *const TAG = "image";
+
+#ifndef USE_IMAGE_COMPRESSION
+bool Image::acquire_decoded_data_() const { return false; }
+void Image::release_decoded_data_() const {}
+#else
+// Bytes of decoded image data kept in RAM once no longer drawn
+#ifndef IMAGE_DECODE_CACHE_SIZE
+#define IMAGE_DECODE_CACHE_SIZE (1024 * 1024)
+#endif
+
+/// Expand rle_compress() output (see compression.py) into at most dst_len bytes.
+static size_t rle_decode(const uint8_t *src, size_t src_len, uint8_t *dst, size_t dst_len, size_t unit) {
+  const uint8_t *end = src + src_len;
+  size_t pos = 0;
+  while (src < end && pos < dst_len) {
+    uint8_t control = progmem_read_byte(src++);
+    if (control < 0x80) {
+      size_t count = std::min<size_t>((control + 1) * unit, dst_len - pos);
+      for (size_t i = 0; i != count; i++)
+        dst[pos++] = progmem_read_byte(src + i);
+      src += (control + 1) * unit;
+    } else {
+      for (size_t run = (control & 0x7F) + 2; run != 0 && pos < dst_len; run--) {
+        for (size_t i = 0; i != unit && pos < dst_len; i++)
+          dst[pos++] = progmem_read_byte(src + i);
+      }
+      src += unit;
+    }
+  }
+  return pos;
+}
+
+/// Expand an LZ4 block (see lz4_compress() in compression.py) into at most dst_len bytes.
+static size_t lz4_decode(const uint8_t *src, size_t src_len, uint8_t *dst, size_t dst_len) {
+  const uint8_t *end = src + src_len;
+  size_t pos = 0;
+  while (src < end) {
+    uint8_t token = progmem_read_byte(src++);
+    size_t literals = token >> 4;
+    if (literals == 15) {
+      uint8_t extra;
+      do {
+        extra = progmem_read_byte(src++);
+        literals += extra;
+      } while (extra == 255 && src < end);
+    }
+    for (size_t i = 0; i != literals && pos < dst_len; i++)
+      dst[pos++] = progmem_read_byte(src + i);
+    src += literals;
+    // The last sequence has literals only
+    if (src + 2 > end)
+      break;
+    size_t offset = progmem_read_byte(src) | (progmem_read_byte(src + 1) << 8);
+    src += 2;
+    size_t length = (token & 0x0F) + 4;
+    if ((token & 0x0F) == 0x0F) {
+      uint8_t extra;
+      do {
+        extra = progmem_read_byte(src++);
+        length += extra;
+      } while (extra == 255 && src < end);
+    }
+    if (offset == 0 || offset > pos)
+      break;  // corrupt data
+    for (; length != 0 && pos < dst_len; length--, pos++)
+      dst[pos] = dst[pos - offset];
+  }
+  return pos;
+}
+
+/**
+ * Decoded copies of compressed images. An entry is pinned while it is being drawn; unpinned entries
+ * are freed least recently drawn first once the total exceeds IMAGE_DECODE_CACHE_SIZE. LVGL may
+ * draw from several threads, so all access is under the lock.
+ */
+struct DecodedImage {
+  const Image *image;
+  uint8_t *data;
+  size_t size;
+  uint32_t last_used;
+  uint16_t users;
+  // Users reading through Image::pixel_data_, included in users
+  uint16_t data_users{};
+#ifdef USE_LVGL
+  lv_draw_buf_t draw_buf;
+#endif
+};
+
+struct DecodeCache {
+  std::list<DecodedImage> entries;  // a list, so entries do not move
+  size_t total_bytes{};
+  uint32_t clock{};
+  Mutex lock;
+};
+
+static DecodeCache &decode_cache() {
+  static DecodeCache cache;
+  return cache;
+}
+
+/// Free unpinned entries, least recently used first, until `needed` more bytes fit the budget.
+static void evict_decoded(DecodeCache &cache, size_t needed) {
+  RAMAllocator<uint8_t> allocator;
+  while (cache.total_bytes + needed > IMAGE_DECODE_CACHE_SIZE) {
+    auto victim = cache.entries.end();
+    for (auto it = cache.entries.begin(); it != cache.entries.end(); ++it) {
+      if (it->users == 0 && (victim == cache.entries.end() || it->last_used < victim->last_used))
+        victim = it;
+    }
+    if (victim == cache.entries.end())
+      return;
+    allocator.deallocate(victim->data, victim->size);
+    cache.total_bytes -= victim->size;
+    cache.entries.erase(victim);
+  }
+}
+
+/// Find or decode the data of a compressed image, and pin it.
+static DecodedImage *acquire_decoded(const Image *image) {
+  auto &cache = decode_cache();
+  LockGuard guard(cache.lock);
+  for (auto &entry : cache.entries) {
+    if (entry.image == image) {
+      entry.users++;
+      entry.last_used = ++cache.clock;
+      return &entry;
+    }
+  }
+  size_t size = image->get_data_size();
+  evict_decoded(cache, size);
+  RAMAllocator<uint8_t> allocator;
+  uint8_t *data = allocator.allocate(size);
+  if (data == nullptr) {
+    // Drop everything not being drawn and try once more
+    evict_decoded(cache, IMAGE_DECODE_CACHE_SIZE + 1);
+    data = allocator.allocate(size);
+    if (data == nullptr) {
+      ESP_LOGE(TAG, "Cannot allocate %u bytes to decode image", (unsigned) size);
+      return nullptr;
+    }
+  }
+  uint32_t start = millis();
+  size_t decoded;
+  if (image->get_compression() == IMAGE_COMPRESSION_RLE) {
+    // Runs are of whole pixels; the alpha plane of RGB565 images is in the same 2-byte units
+    size_t unit = std::max<size_t>(image->get_bpp() / 8, 1);
+    decoded = rle_decode(image->get_data_start(), image->get_compressed_size(), data, size, unit);
+  } else {
+    decoded = lz4_decode(image->get_data_start(), image->get_compressed_size(), data, size);
+  }
+  if (decoded != size)
+    ESP_LOGW(TAG, "Image decoded to %u bytes, expected %u", (unsigned) decoded, (unsigned) size);
+  ESP_LOGV(TAG, "Decoded %u bytes in %u ms", (unsigned) size, (unsigned) (millis() - start));
+  cache.entries.push_back(DecodedImage{image, data, size, ++cache.clock, 1});
+  cache.total_bytes += size;
+  return &cache.entries.back();
+}
+
+static void release_decoded(DecodedImage *entry) {
+  auto &cache = decode_cache();
+  LockGuard guard(cache.lock);
+  entry->users--;
+  entry->last_used = ++cache.clock;
+  evict_decoded(cache, 0);
+}
+
+static DecodedImage *find_decoded(const Image *image) {
+  auto &cache = decode_cache();
+  LockGuard guard(cache.lock);
+  for (auto &entry : cache.entries) {
+    if (entry.image == image)
+      return &entry;
+  }
+  return nullptr;
+}
+
+bool Image::acquire_decoded_data_() const {
+  DecodedImage *entry = acquire_decoded(this);
+  if (entry == nullptr)
+    return false;
+  LockGuard guard(decode_cache().lock);
+  entry->data_users++;
+  this->pixel_data_ = entry->data;
+  return true;
+}
+
+void Image::release_decoded_data_() const {
+  DecodedImage *entry = find_decoded(this);
+  if (entry == nullptr)
+    return;
+  {
+    // Another reader, such as a draw on a different task, may still be using pixel_data_
+    LockGuard guard(decode_cache().lock);
+    if (entry->data_users != 0 && --entry->data_users == 0)
+      this->pixel_data_ = nullptr;
+  }
+  release_decoded(entry);
+}
+
+#ifdef USE_LVGL
+// Compressed images registered with the LVGL decoder, looked up by their image descriptor
+static std::vector<std::pair<const lv_image_dsc_t *, const Image *>> lv_compressed_images;  // NOLINT
+
+static const Image *find_lv_compressed_image(const void *src) {
+  for (auto &item : lv_compressed_images) {
+    if (item.first == src)
+      return item.second;
+  }
+  return nullptr;
+}
+
+static lv_result_t lv_decoder_info(lv_image_decoder_t *decoder, lv_image_decoder_dsc_t *dsc,
+                                   lv_image_header_t *header) {
+  if (dsc->src_type != LV_IMAGE_SRC_VARIABLE || find_lv_compressed_image(dsc->src) == nullptr)
+    return LV_RESULT_INVALID;
+  *header = static_cast<const lv_image_dsc_t *>(dsc->src)->header;
+  return LV_RESULT_OK;
+}
+
+// The decoded data is held in our cache rather than LVGL's image cache, pinned from open to close.
+static lv_result_t lv_decoder_open(lv_image_decoder_t *decoder, lv_image_decoder_dsc_t *dsc) {
+  const Image *image = find_lv_compressed_image(dsc->src);
+  if (image == nullptr)
+    return LV_RESULT_INVALID;
+  DecodedImage *entry = acquire_decoded(image);
+  if (entry == nullptr)
+    return LV_RESULT_INVALID;
+  const lv_image_header_t &header = static_cast<const lv_image_dsc_t *>(dsc->src)->header;
+  {
+    LockGuard guard(decode_cache().lock);
+    if (entry->draw_buf.data == nullptr) {
+      lv_draw_buf_init(&entry->draw_buf, header.w, header.h, (lv_color_format_t) header.cf, header.stride,
+                       entry->data, entry->size);
+    }
+  }
+  dsc->decoded = &entry->draw_buf;
+  dsc->user_data = entry;
+  return LV_RESULT_OK;
+}
+
+static void lv_decoder_close(lv_image_decoder_t *decoder, lv_image_decoder_dsc_t *dsc) {
+  if (dsc->user_data != nullptr)
+    release_decoded(static_cast<DecodedImage *>(dsc->user_data));
+}
+
+static void register_lv_compressed_image(const lv_image_dsc_t *dsc, const Image *image) {
+  static lv_image_decoder_t *decoder = nullptr;
+  if (decoder == nullptr) {
+    // New decoders are tried first, so this one sees compressed images before the built-in ones
+    decoder = lv_image_decoder_create();
+    lv_image_decoder_set_info_cb(decoder, lv_decoder_info);
+    lv_image_decoder_set_open_cb(decoder, lv_decoder_open);
+    lv_image_decoder_set_close_cb(decoder, lv_decoder_close);
+  }
+  if (find_lv_compressed_image(dsc) == nullptr)
+    lv_compressed_images.emplace_back(dsc, image);
+}
+#endif  // USE_LVGL
+#endif  // USE_IMAGE_COMPRESSION
+
+void Image::set_compression(ImageCompression compression, size_t compressed_size) {
+  this->compression_ = compression;
+  this->compressed_size_ = compressed_size;
+  this->pixel_data_ = compression == IMAGE_COMPRESSION_NONE ? this->data_start_ : nullptr;
+}
+
+size_t Image::get_data_size() const {
+  size_t size = this->get_width_stride() * this->height_;
+  if (this->type_ == IMAGE_TYPE_RGB565 && this->transparency_ == TRANSPARENCY_ALPHA_CHANNEL)
+    size += this->width_ * this->height_;
+  return size;
+}
+
 void Image::draw(int x, int y, display::Display *display, Color color_on, Color color_off) {
+  if (!this->acquire_data_())
+    return;
   int img_x0 = 0;
   int img_y0 = 0;
   int w = width_;
@@ -41,7 +327,7 @@ void Image::draw(int x, int y, display::Display *display, Color color_on, Color
       for (int img_x = img_x0; img_x < w; img_x++) {
         for (int img_y = img_y0; img_y < h; img_y++) {
           const uint32_t pos = (img_x + img_y * this->width_);
-          const uint8_t gray = progmem_read_byte(this->data_start_ + pos);
+          const uint8_t gray = progmem_read_byte(this->pixel_data_ + pos);
           Color color = Color(gray, gray, gray, 0xFF);
           switch (this->transparency_) {
             case TRANSPARENCY_CHROMA_KEY:
@@ -85,10 +371,18 @@ void Image::draw(int x, int y, display::Display *display, Color color_on, Color
       }
       break;
   }
+  this->release_data_();
 }
 Color Image::get_pixel(int x, int y, const Color color_on, const Color color_off) const {
   if (x < 0 || x >= this->width_ || y < 0 || y >= this->height_)
     return color_off;
+  if (!this->acquire_data_())
+    return color_off;
+  Color color = this->get_decoded_pixel_(x, y, color_on, color_off);
+  this->release_data_();
+  return color;
+}
+Color Image::get_decoded_pixel_(int x, int y, const Color color_on, const Color color_off) const {
   switch (this->type_) {
     case IMAGE_TYPE_BINARY:
       if (this->get_binary_pixel_(x, y))
@@ -114,6 +408,12 @@ lv_image_dsc_t *Image::get_lv_image_dsc() {
     this->dsc_.header.w = this->width_;
     this->dsc_.header.h = this->height_;
     this->dsc_.data_size = this->get_width_stride() * this->get_height();
+#ifdef USE_IMAGE_COMPRESSION
+    if (this->is_compressed()) {
+      this->dsc_.data_size = this->compressed_size_;
+      register_lv_compressed_image(&this->dsc_, this);
+    }
+#endif
     switch (this->get_type()) {
       case IMAGE_TYPE_BINARY:
         this->dsc_.header.cf = LV_COLOR_FORMAT_I1;
@@ -165,12 +465,12 @@ lv_image_dsc_t *Image::get_lv_image_dsc() {
 bool Image::get_binary_pixel_(int x, int y) const {
   const uint32_t width_8 = ((this->width_ + 7u) / 8u) * 8u;
   const uint32_t pos = x + y * width_8;
-  return progmem_read_byte(this->data_start_ + (pos / 8u)) & (0x80 >> (pos % 8u));
+  return progmem_read_byte(this->pixel_data_ + (pos / 8u)) & (0x80 >> (pos % 8u));
 }
 Color Image::get_rgb_pixel_(int x, int y) const {
   const uint32_t pos = (x + y * this->width_) * this->bpp_ / 8;
-  Color color = Color(progmem_read_byte(this->data_start_ + pos + 2), progmem_read_byte(this->data_start_ + pos + 1),
-                      progmem_read_byte(this->data_start_ + pos + 0), 0xFF);
+  Color color = Color(progmem_read_byte(this->pixel_data_ + pos + 2), progmem_read_byte(this->pixel_data_ + pos + 1),
+                      progmem_read_byte(this->pixel_data_ + pos + 0), 0xFF);
 
   switch (this->transparency_) {
     case TRANSPARENCY_CHROMA_KEY:
@@ -180,7 +480,7 @@ Color Image::get_rgb_pixel_(int x, int y) const {
       }
       break;
     case TRANSPARENCY_ALPHA_CHANNEL:
-      color.w = progmem_read_byte(this->data_start_ + (pos + 3));
+      color.w = progmem_read_byte(this->pixel_data_ + (pos + 3));
       break;
     default:
       break;
@@ -188,7 +488,7 @@ Color Image::get_rgb_pixel_(int x, int y) const {
   return color;
 }
 Color Image::get_rgb565_pixel_(int x, int y) const {
-  const uint8_t *pos = this->data_start_ + (x + y * this->width_) * this->bpp_ / 8;
+  const uint8_t *pos = this->pixel_data_ + (x + y * this->width_) * this->bpp_ / 8;
   uint16_t rgb565 = encode_uint16(progmem_read_byte(pos), progmem_read_byte(pos + 1));
   auto r = (rgb565 & 0xF800) >> 11;
   auto g = (rgb565 & 0x07E0) >> 5;
@@ -196,7 +496,7 @@ Color Image::get_rgb565_pixel_(int x, int y) const {
   auto a = 0xFF;
   switch (this->transparency_) {
     case TRANSPARENCY_ALPHA_CHANNEL:
-      a = progmem_read_byte(this->data_start_ + this->width_ * this->height_ * 2 + (x + y * this->width_));
+      a = progmem_read_byte(this->pixel_data_ + this->width_ * this->height_ * 2 + (x + y * this->width_));
       break;
     case TRANSPARENCY_CHROMA_KEY:
       if (rgb565 == 0x0020)
@@ -210,7 +510,7 @@ Color Image::get_rgb565_pixel_(int x, int y) const {
 
 Color Image::get_grayscale_pixel_(int x, int y) const {
   const uint32_t pos = (x + y * this->width_);
-  const uint8_t gray = progmem_read_byte(this->data_start_ + pos);
+  const uint8_t gray = progmem_read_byte(this->pixel_data_ + pos);
   switch (this->transparency_) {
     case TRANSPARENCY_CHROMA_KEY:
       if (gray == 1)
@@ -226,7 +526,12 @@ int Image::get_width() const { return this->width_; }
 int Image::get_height() const { return this->height_; }
 ImageType Image::get_type() const { return this->type_; }
 Image::Image(const uint8_t *data_start, int width, int height, ImageType type, Transparency transparency)
-    : width_(width), height_(height), type_(type), data_start_(data_start), transparency_(transparency) {
+    : width_(width),
+      height_(height),
+      type_(type),
+      data_start_(data_start),
+      transparency_(transparency),
+      pixel_data_(data_start) {
   switch (this->type_) {
     case IMAGE_TYPE_BINARY:
       this->bpp_ = 1;
@@ -22,6 +22,12 @@ enum Transparency {
   TRANSPARENCY_ALPHA_CHANNEL = 2,
 };
 
+enum ImageCompression {
+  IMAGE_COMPRESSION_NONE = 0,
+  IMAGE_COMPRESSION_RLE = 1,
+  IMAGE_COMPRESSION_LZ4 = 2,
+};
+
 class Image : public display::BaseImage {
  public:
   Image(const uint8_t *data_start, int width, int height, ImageType type, Transparency transparency);
@@ -40,6 +46,15 @@ class Image : public display::BaseImage {
 
   bool has_transparency() const { return this->transparency_ != TRANSPARENCY_OPAQUE; }
 
+  /// Mark the data as compressed. It is then decoded into RAM when the image is drawn, and kept in a
+  /// decode cache shared by all compressed images.
+  void set_compression(ImageCompression compression, size_t compressed_size);
+  bool is_compressed() const { return this->compression_ != IMAGE_COMPRESSION_NONE; }
+  ImageCompression get_compression() const { return this->compression_; }
+  size_t get_compressed_size() const { return this->compressed_size_; }
+  /// Return the size in bytes of the uncompressed pixel data.
+  size_t get_data_size() const;
+
 #ifdef USE_LVGL
   lv_image_dsc_t *get_lv_image_dsc();
 #endif
@@ -48,6 +63,15 @@ class Image : public display::BaseImage {
   Color get_rgb_pixel_(int x, int y) const;
   Color get_rgb565_pixel_(int x, int y) const;
   Color get_grayscale_pixel_(int x, int y) const;
+  Color get_decoded_pixel_(int x, int y, Color color_on, Color color_off) const;
+  /// Point pixel_data_ at the uncompressed data, decoding it if needed, until release_data_().
+  bool acquire_data_() const { return !this->is_compressed() || this->acquire_decoded_data_(); }
+  void release_data_() const {
+    if (this->is_compressed())
+      this->release_decoded_data_();
+  }
+  bool acquire_decoded_data_() const;
+  void release_decoded_data_() const;
 
   int width_;
   int height_;
@@ -56,6 +80,10 @@ class Image : public display::BaseImage {
   Transparency transparency_;
   size_t bpp_{};
   size_t stride_{};
+  // Data the pixel getters read: data_start_, or the decoded copy of compressed data while acquired
+  mutable const uint8_t *pixel_data_{};
+  ImageCompression compression_{IMAGE_COMPRESSION_NONE};
+  size_t compressed_size_{};
 #ifdef USE_LVGL
   lv_img_dsc_t dsc_{};
 #endif
@@ -43,7 +43,7 @@ from .encoders import (
 from .gradient import GRADIENT_SCHEMA, gradients_to_code
 from .keypads import KEYPADS_CONFIG, keypads_to_code
 from .lv_validation import lv_bool, lv_images_used
-from .lvcode import LvContext, LvglComponent, lvgl_static
+from .lvcode import LvContext, LvglComponent, SourceFile, lvgl_static
 from .schemas import (
     DISP_BG_SCHEMA,
     FULL_STYLE_SCHEMA,
@@ -53,10 +53,11 @@ from .schemas import (
     container_schema,
     obj_schema,
 )
-from .styles import styles_to_code, theme_to_code
+from .styles import ConstStyles, SharedStyles, styles_to_code, theme_to_code
 from .touchscreens import touchscreen_schema, touchscreens_to_code
 from .trigger import add_on_boot_triggers, generate_triggers
 from .types import IdleTrigger, PlainTrigger, lv_font_t, lv_group_t, lv_style_t, lvgl_ns
+from .widget_table import WidgetTable
 from .widgets import (
     LvScrActType,
     Widget,
@@ -73,6 +74,7 @@ from .widgets.page import (  # page_spec used in LVGL_SCHEMA
     add_pages,
     generate_page_triggers,
     page_spec,
+    warn_lazy_lambdas,
 )
 
 # Widget registration happens via WidgetType.__init__ in individual widget files
@@ -89,6 +91,16 @@ AUTO_LOAD = ["key_provider", "button"]
 CODEOWNERS = ["@youkorr"]  # LVGL 9.4.0 implementation with ThorVG enabled by default
 HELLO_WORLD_FILE = "hello_world.yaml"
 CONF_USE_PPA = "use_ppa"
+CONF_RENDER_CORE = "render_core"
+CONF_RENDER_WORKERS = "render_workers"
+CONF_SVG_CACHE_SIZE = "svg_cache_size"
+CONF_SMALL_ALLOC_SIZE = "small_alloc_size"
+CONF_INTERNAL_RAM_RESERVE = "internal_ram_reserve"
+CONF_SMALL_OBJECT_POOL = "small_object_pool"
+CONF_SHARE_STYLES = "share_styles"
+CONF_CONST_STYLES = "const_styles"
+CONF_WIDGET_TABLE = "widget_table"
+CONF_SPLIT_SOURCES = "split_sources"
 
 
 SIMPLE_TRIGGERS = (
@@ -234,6 +246,31 @@ async def to_code(configs):
         ppa_dir = Path(__file__).parent / "ppa"
         cg.add_build_flag(f"-I{ppa_dir}")
     df.add_define("LV_USE_STDLIB_MALLOC", "LV_STDLIB_CUSTOM")
+    # Size-class placement in lv_malloc_core(): small blocks in internal RAM, the rest in PSRAM
+    if small_alloc_size := config_0[CONF_SMALL_ALLOC_SIZE]:
+        cg.add_define("LVGL_MEM_SMALL_SIZE", small_alloc_size)
+    # Segregated free lists for small objects, tried before the heap
+    if pool_size := config_0[CONF_SMALL_OBJECT_POOL]:
+        cg.add_define("LVGL_MEM_POOL_SIZE", pool_size)
+    if small_alloc_size or pool_size:
+        cg.add_define(
+            "LVGL_MEM_INTERNAL_RESERVE", config_0[CONF_INTERNAL_RAM_RESERVE]
+        )
+    # Inline style properties of new widgets go into shared styles
+    SharedStyles.enabled = config_0[CONF_SHARE_STYLES]
+    # Styles never changed after boot are built as constant tables in flash
+    ConstStyles.enabled = config_0[CONF_CONST_STYLES]
+    # Static widget trees are built from descriptor tables rather than inline code
+    WidgetTable.enabled = config_0[CONF_WIDGET_TABLE]
+    # Pages and triggers are generated into their own source files
+    SourceFile.enabled = config_0[CONF_SPLIT_SOURCES]
+    # Lottie and SVG widgets render on a shared pool of ThorVG workers
+    cg.add_define("LVGL_RENDER_WORKERS", config_0[CONF_RENDER_WORKERS])
+    if CONF_RENDER_CORE in config_0:
+        cg.add_define("LVGL_RENDER_CORE", config_0[CONF_RENDER_CORE])
+    # Budget for SVG rasters kept after their page is unloaded
+    if svg_cache_size := config_0[CONF_SVG_CACHE_SIZE]:
+        cg.add_define("LVGL_SVG_CACHE_SIZE", svg_cache_size)
 
     # ============================================
     # THORVG + SVG/LOTTIE SUPPORT (LVGL v9.4+)
@@ -341,6 +378,16 @@ async def to_code(configs):
         lv_scr_act = get_screen_active(lv_component)
         async with LvContext():
             cg.add(lv_component.set_big_endian(config[CONF_BYTE_ORDER] == "big_endian"))
+            if config[df.CONF_DOUBLE_BUFFER]:
+                cg.add(lv_component.set_double_buffer(True))
+            merge_distance = config[df.CONF_MERGE_DISTANCE]
+            full_refresh_threshold = round(config[df.CONF_FULL_REFRESH_THRESHOLD] * 100)
+            if merge_distance != 0 or full_refresh_threshold < 100:
+                cg.add(
+                    lv_component.set_invalidation_policy(
+                        merge_distance, full_refresh_threshold
+                    )
+                )
             await touchscreens_to_code(lv_component, config)
             await encoders_to_code(lv_component, config, default_group)
             await keypads_to_code(lv_component, config, default_group)
@@ -357,7 +404,8 @@ async def to_code(configs):
     # Set this directly since we are limited in how many methods can be added to the Widget class.
     Widget.widgets_completed = True
     async with LvContext():
-        await generate_triggers()
+        with SourceFile("triggers"):
+            await generate_triggers()
         for config in configs:
             lv_component = await cg.get_variable(config[CONF_ID])
             await generate_page_triggers(config)
@@ -381,6 +429,10 @@ async def to_code(configs):
             await add_on_boot_triggers(config.get(CONF_ON_BOOT, ()))
 
     # This must be done after all widgets are created
+    warn_lazy_lambdas()
+    SharedStyles.report()
+    ConstStyles.report()
+    WidgetTable.report()
     for comp in helpers.lvgl_components_required:
         cg.add_define(f"USE_LVGL_{comp.upper()}")
     if {
@@ -397,6 +449,7 @@ async def to_code(configs):
         cg.add_define(f"USE_{use.upper()}")
     lv_conf_h_file = CORE.relative_src_path(LV_CONF_FILENAME)
     write_file_if_changed(lv_conf_h_file, generate_lv_conf_h())
+    SourceFile.remove_stale()
     cg.add_build_flag("-DLV_CONF_H=1")
     cg.add_build_flag(f'-DLV_CONF_PATH=\\"{LV_CONF_FILENAME}\\"')
     # Add include path for atomic.h shim (needed for LV_USE_OS=LV_OS_FREERTOS on ESP-IDF)
@@ -459,6 +512,13 @@ LVGL_SCHEMA = cv.All(
                 ): cv.boolean,
                 cv.Optional(CONF_DRAW_ROUNDING, default=2): cv.positive_int,
                 cv.Optional(CONF_BUFFER_SIZE, default=0): cv.percentage,
+                cv.Optional(df.CONF_DOUBLE_BUFFER, default=False): cv.boolean,
+                cv.Optional(df.CONF_MERGE_DISTANCE, default=0): cv.int_range(
+                    min=0, max=1000
+                ),
+                cv.Optional(
+                    df.CONF_FULL_REFRESH_THRESHOLD, default="100%"
+                ): cv.percentage,
                 cv.Optional(CONF_LOG_LEVEL, default="ERROR"): cv.one_of(
                     *df.LV_LOG_LEVELS, upper=True
                 ),
@@ -503,6 +563,28 @@ LVGL_SCHEMA = cv.All(
                 cv.GenerateID(df.CONF_DEFAULT_GROUP): cv.declare_id(lv_group_t),
                 cv.Optional(df.CONF_RESUME_ON_INPUT, default=True): cv.boolean,
                 cv.Optional(CONF_USE_PPA, default=False): cv.boolean,
+                cv.Optional(CONF_RENDER_WORKERS, default=1): cv.int_range(
+                    min=1, max=4
+                ),
+                cv.Optional(CONF_RENDER_CORE): cv.int_range(min=0, max=1),
+                cv.Optional(CONF_SVG_CACHE_SIZE, default=0): cv.All(
+                    cv.float_with_unit("cache size", "(B|b)?"), int
+                ),
+                cv.Optional(CONF_SMALL_ALLOC_SIZE, default=0): cv.All(
+                    cv.float_with_unit("allocation size", "(B|b)?"), int
+                ),
+                cv.Optional(CONF_INTERNAL_RAM_RESERVE, default="32kB"): cv.All(
+                    cv.float_with_unit("reserve", "(B|b)?"), int
+                ),
+                cv.Optional(CONF_SHARE_STYLES, default=False): cv.boolean,
+                cv.Optional(CONF_CONST_STYLES, default=False): cv.boolean,
+                cv.Optional(CONF_WIDGET_TABLE, default=False): cv.boolean,
+                cv.Optional(CONF_SPLIT_SOURCES, default=False): cv.boolean,
+                cv.Optional(CONF_SMALL_OBJECT_POOL, default=0): cv.All(
+                    cv.float_with_unit("pool size", "(B|b)?"),
+                    int,
+                    cv.Any(0, cv.int_range(min=4096)),
+                ),
             }
         )
         .extend(DISP_BG_SCHEMA),
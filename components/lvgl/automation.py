@@ -30,6 +30,7 @@ from .lvcode import (
     UPDATE_EVENT,
     LambdaContext,
     LocalVariable,
+    LvConditional,
     LvglComponent,
     ReturnStatement,
     add_line_marks,
@@ -63,6 +64,7 @@ from .widgets import (
     add_widgets,
     get_screen_active,
     get_widgets,
+    lazy_condition,
     set_obj_properties,
     wait_for_widgets,
 )
@@ -124,7 +126,9 @@ async def action_to_code(
     await wait_for_widgets()
     async with LambdaContext(parameters=args, where=action_id) as context:
         for widget in widgets:
-            await action(widget)
+            # Changes to a widget on an unloaded page are dropped
+            with LvConditional(lazy_condition(widget)):
+                await action(widget)
     return cg.new_Pvariable(action_id, template_arg, await context.get_lambda())
 
 
@@ -0,0 +1,253 @@
+#pragma once
+
+#include "esphome/core/hal.h"
+#include "esphome/core/log.h"
+#include <algorithm>
+#include <cstring>
+#include <lvgl.h>
+
+namespace esphome {
+namespace lvgl {
+
+static const char *const FRAME_PLAYER_TAG = "frame_player";
+
+// Must match the encodings in frames.py
+enum FrameEncoding : uint8_t {
+    FRAME_ENCODING_RAW,    // frames stored verbatim, displayed straight from flash
+    FRAME_ENCODING_RLE,    // each frame RLE-compressed on its own
+    FRAME_ENCODING_DELTA,  // RLE of the XOR against the previous frame; frame 0 against zeros
+};
+
+// --------------------------------------------------------------------------
+// Playback of a pre-rendered RGB565A8 frame sequence on a canvas or image
+// based widget, without any vector work on the device.  Compressed frames are
+// decoded into one PSRAM frame buffer, which only exists while the widget's
+// screen is loaded.
+// --------------------------------------------------------------------------
+struct FramePlayer {
+    // --- Config (set once, never freed) ---
+    lv_obj_t *obj;
+    const uint8_t *data;        // PROGMEM, all frames back to back, 4-byte aligned
+    const uint32_t *offsets;    // PROGMEM, start of each frame in data
+    uint16_t frame_count;
+    uint16_t width;
+    uint16_t height;
+    FrameEncoding encoding;
+    uint32_t frame_ms;
+    const uint16_t *frame_delays;  // PROGMEM, time to show each frame, nullptr when all are frame_ms
+    bool loop;
+    uint16_t repeat_count;      // plays when not looping, at least once
+    bool playing;
+
+    // --- Runtime state (freed on screen unload) ---
+    lv_draw_buf_t draw_buf;
+    uint8_t *frame_buf;         // decoded frame, nullptr for raw encoding
+    lv_timer_t *timer;
+    uint16_t current;
+    uint16_t repeats_done;
+};
+
+// Decode RLE data (see rle_encode() in frames.py) into len bytes at dst,
+// XOR-ing into the existing contents rather than overwriting if xor_mode.
+inline void frame_rle_decode(const uint8_t *src, uint8_t *dst, size_t len, bool xor_mode) {
+    size_t pos = 0;
+    while (pos < len) {
+        uint8_t control = progmem_read_byte(src++);
+        if (control < 0x80) {
+            size_t count = std::min<size_t>(control + 1, len - pos);
+            for (size_t i = 0; i != count; i++, pos++) {
+                uint8_t value = progmem_read_byte(src++);
+                dst[pos] = xor_mode ? dst[pos] ^ value : value;
+            }
+        } else {
+            size_t count = std::min<size_t>((control & 0x7F) + 3, len - pos);
+            uint8_t value = progmem_read_byte(src++);
+            if (!xor_mode) {
+                memset(dst + pos, value, count);
+                pos += count;
+            } else if (value == 0) {
+                pos += count;  // unchanged pixels
+            } else {
+                for (size_t i = 0; i != count; i++, pos++)
+                    dst[pos] ^= value;
+            }
+        }
+    }
+}
+
+inline size_t frame_player_frame_bytes(FramePlayer *player) {
+    return (size_t)player->width * player->height * 3;
+}
+
+inline const uint8_t *frame_player_frame_data(FramePlayer *player, uint16_t index) {
+    const uint8_t *offset = reinterpret_cast<const uint8_t *>(player->offsets + index);
+    uint32_t value = 0;
+    for (size_t i = 0; i != sizeof(uint32_t); i++)
+        value |= (uint32_t)progmem_read_byte(offset + i) << (8 * i);  // little-endian targets
+    return player->data + value;
+}
+
+inline uint32_t frame_player_delay(FramePlayer *player, uint16_t index) {
+    if (player->frame_delays == nullptr)
+        return player->frame_ms;
+    return progmem_read_uint16(player->frame_delays + index);
+}
+
+// Put frame `index` in the draw buffer and redraw.  Delta frames must be shown in order.
+inline void frame_player_show(FramePlayer *player, uint16_t index) {
+    const uint8_t *src = frame_player_frame_data(player, index);
+    size_t len = frame_player_frame_bytes(player);
+    if (player->encoding == FRAME_ENCODING_RAW) {
+        player->draw_buf.data = const_cast<uint8_t *>(src);
+    } else {
+        frame_rle_decode(src, player->frame_buf, len,
+                         player->encoding == FRAME_ENCODING_DELTA && index != 0);
+    }
+    player->current = index;
+    lv_image_cache_drop(&player->draw_buf);
+    lv_obj_invalidate(player->obj);
+}
+
+inline void frame_player_timer_cb(lv_timer_t *timer) {
+    FramePlayer *player = (FramePlayer *)lv_timer_get_user_data(timer);
+    // Hold the current frame while it can't be seen
+    if (lv_obj_get_screen(player->obj) != lv_screen_active() || !lv_obj_is_visible(player->obj))
+        return;
+    uint16_t next = player->current + 1;
+    if (next == player->frame_count) {
+        if (!player->loop && ++player->repeats_done >= player->repeat_count) {
+            lv_timer_delete(player->timer);
+            player->timer = nullptr;
+            player->playing = false;
+            return;
+        }
+        next = 0;
+    }
+    frame_player_show(player, next);
+    if (player->frame_delays != nullptr)
+        lv_timer_set_period(timer, frame_player_delay(player, next));
+}
+
+// Allocate the frame buffer and show the first frame.  Call under lv_lock.
+inline bool frame_player_load(FramePlayer *player) {
+    size_t len = frame_player_frame_bytes(player);
+    uint8_t *data = const_cast<uint8_t *>(frame_player_frame_data(player, 0));
+    if (player->encoding != FRAME_ENCODING_RAW) {
+        player->frame_buf = (uint8_t *)lv_malloc(len);
+        if (player->frame_buf == nullptr) {
+            ESP_LOGE(FRAME_PLAYER_TAG, "Frame buffer alloc failed (%u bytes)", (unsigned)len);
+            return false;
+        }
+        data = player->frame_buf;
+    }
+    lv_draw_buf_init(&player->draw_buf, player->width, player->height, LV_COLOR_FORMAT_RGB565A8, 0, data, len);
+#if LV_USE_CANVAS
+    if (lv_obj_check_type(player->obj, &lv_canvas_class)) {
+        lv_canvas_set_draw_buf(player->obj, &player->draw_buf);
+    } else
+#endif
+    {
+        lv_image_set_src(player->obj, &player->draw_buf);  // e.g. an animimg
+    }
+    frame_player_show(player, 0);
+    if (player->playing && player->frame_count > 1 && player->timer == nullptr)
+        player->timer = lv_timer_create(frame_player_timer_cb, frame_player_delay(player, 0), player);
+    return true;
+}
+
+inline void frame_player_unload(FramePlayer *player) {
+    if (player->timer) { lv_timer_delete(player->timer); player->timer = nullptr; }
+    if (player->frame_buf) { lv_free(player->frame_buf); player->frame_buf = nullptr; }
+}
+
+// --------------------------------------------------------------------------
+// Screen event callbacks – same two-phase lifecycle as the Lottie loader:
+// stop when the transition starts, free once the screen is gone.
+// --------------------------------------------------------------------------
+inline void frame_player_unload_start_cb(lv_event_t *e) {
+    FramePlayer *player = (FramePlayer *)lv_event_get_user_data(e);
+    if (player->timer) { lv_timer_delete(player->timer); player->timer = nullptr; }
+}
+
+inline void frame_player_unloaded_cb(lv_event_t *e) {
+    frame_player_unload((FramePlayer *)lv_event_get_user_data(e));
+}
+
+inline void frame_player_loaded_cb(lv_event_t *e) {
+    FramePlayer *player = (FramePlayer *)lv_event_get_user_data(e);
+    if (player->frame_buf == nullptr)
+        frame_player_load(player);
+}
+
+// --------------------------------------------------------------------------
+// Public API: play from the first frame, or stop on the current one.
+// --------------------------------------------------------------------------
+inline void frame_player_start(FramePlayer *player) {
+    player->playing = true;
+    player->repeats_done = 0;
+    if (player->frame_buf == nullptr && player->encoding != FRAME_ENCODING_RAW)
+        return;  // screen not loaded – starts on load
+    frame_player_show(player, 0);
+    if (player->timer == nullptr && player->frame_count > 1)
+        player->timer = lv_timer_create(frame_player_timer_cb, frame_player_delay(player, 0), player);
+}
+
+inline void frame_player_stop(FramePlayer *player) {
+    player->playing = false;
+    if (player->timer) { lv_timer_delete(player->timer); player->timer = nullptr; }
+}
+
+// Times to play when not looping; LV_ANIM_REPEAT_INFINITE loops.
+inline void frame_player_set_repeat_count(FramePlayer *player, uint16_t repeat_count) {
+    player->loop = repeat_count == LV_ANIM_REPEAT_INFINITE;
+    player->repeat_count = repeat_count;
+}
+
+// Show each frame for its own time, from a PROGMEM table with one entry per frame.
+inline void frame_player_set_frame_delays(FramePlayer *player, const uint16_t *frame_delays) {
+    player->frame_delays = frame_delays;
+    if (player->timer)
+        lv_timer_set_period(player->timer, frame_player_delay(player, player->current));
+}
+
+// The player attached to a widget by frame_player_init().
+inline FramePlayer *frame_player_get(lv_obj_t *obj) {
+    return (FramePlayer *)lv_obj_get_user_data(obj);
+}
+
+// --------------------------------------------------------------------------
+// Public API: attach a frame sequence to a canvas or image based widget.  Frames are
+// loaded when the widget's screen is shown.  Call under lv_lock.
+// --------------------------------------------------------------------------
+inline FramePlayer *frame_player_init(lv_obj_t *obj, const uint8_t *data, const uint32_t *offsets,
+                                      uint16_t frame_count, uint16_t width, uint16_t height,
+                                      FrameEncoding encoding, uint32_t frame_ms, bool loop,
+                                      bool auto_start) {
+    FramePlayer *player = new FramePlayer{};  // NOLINT
+    player->obj         = obj;
+    player->data        = data;
+    player->offsets     = offsets;
+    player->frame_count = frame_count;
+    player->width       = width;
+    player->height      = height;
+    player->encoding    = encoding;
+    player->frame_ms    = frame_ms;
+    player->loop        = loop;
+    player->repeat_count = 1;
+    player->playing     = auto_start;
+
+    lv_obj_set_user_data(obj, player);
+    lv_obj_t *screen = lv_obj_get_screen(obj);
+    lv_obj_add_event_cb(screen, frame_player_unload_start_cb, LV_EVENT_SCREEN_UNLOAD_START, player);
+    lv_obj_add_event_cb(screen, frame_player_unloaded_cb, LV_EVENT_SCREEN_UNLOADED, player);
+    lv_obj_add_event_cb(screen, frame_player_loaded_cb, LV_EVENT_SCREEN_LOADED, player);
+    if (screen == lv_screen_active())
+        frame_player_load(player);
+
+    ESP_LOGI(FRAME_PLAYER_TAG, "%u frames %ux%u, %u ms/frame, encoding %u", (unsigned)frame_count,
+             (unsigned)width, (unsigned)height, (unsigned)frame_ms, (unsigned)encoding);
+    return player;
+}
+
+}  // namespace lvgl
+}  // namespace esphome
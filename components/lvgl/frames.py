@@ -0,0 +1,123 @@
+"""
+Build-time encoding of pre-rendered animation frames, played back on the device
+by frame_player.h.
+
+Frames are stored as LV_COLOR_FORMAT_RGB565A8: a plane of little-endian RGB565
+pixels followed by a plane of 8-bit alpha. The whole sequence is one byte array
+with a table of per-frame offsets.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Must match FrameEncoding in frame_player.h
+ENCODING_RAW = "RAW"
+ENCODING_RLE = "RLE"
+ENCODING_DELTA = "DELTA"
+FRAME_ENCODINGS = (ENCODING_RAW, ENCODING_RLE, ENCODING_DELTA)
+
+
+def rle_encode(data):
+    """
+    Compress a byte sequence. A control byte below 0x80 is followed by
+    (control + 1) literal bytes; a control byte of 0x80 or above is followed by a
+    single byte to be repeated (control - 0x80 + 3) times.
+    Must match frame_rle_decode() in frame_player.h.
+    """
+    result = bytearray()
+    pos = 0
+    size = len(data)
+    while pos < size:
+        run = 1
+        while pos + run < size and run < 130 and data[pos + run] == data[pos]:
+            run += 1
+        if run >= 3:
+            result += bytes((0x80 | (run - 3), data[pos]))
+            pos += run
+            continue
+        start = pos
+        while pos < size and pos - start < 128:
+            if pos + 2 < size and data[pos] == data[pos + 1] == data[pos + 2]:
+                break
+            pos += 1
+        result.append(pos - start - 1)
+        result += data[start:pos]
+    return bytes(result)
+
+
+def bgra_to_rgb565a8(buffer, width, height, premultiplied=True):
+    """
+    Convert a frame of 32-bit BGRA pixels, as produced by rlottie and ThorVG, to
+    RGB565A8 bytes
+    :param buffer: width * height * 4 bytes
+    :param premultiplied: Whether the colour channels are premultiplied by alpha
+    """
+    if np is not None:
+        pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(height * width, 4)
+        b, g, r, a = (pixels[:, i].astype(np.uint32) for i in range(4))
+        if premultiplied:
+            scale = np.where(a == 0, 0, 255)
+            divisor = np.maximum(a, 1)
+            r, g, b = (np.minimum(c * scale // divisor, 255) for c in (r, g, b))
+        rgb = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+        return rgb.astype("<u2").tobytes() + a.astype(np.uint8).tobytes()
+    rgb = bytearray()
+    alpha = bytearray()
+    for pos in range(0, width * height * 4, 4):
+        b, g, r, a = buffer[pos : pos + 4]
+        if premultiplied:
+            if a == 0:
+                r = g = b = 0
+            else:
+                r, g, b = (min(c * 255 // a, 255) for c in (r, g, b))
+        rgb565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+        rgb += bytes((rgb565 & 0xFF, rgb565 >> 8))
+        alpha.append(a)
+    return bytes(rgb + alpha)
+
+
+def xor_frames(previous, current):
+    if np is not None:
+        return np.bitwise_xor(
+            np.frombuffer(previous, dtype=np.uint8),
+            np.frombuffer(current, dtype=np.uint8),
+        ).tobytes()
+    return bytes(p ^ c for p, c in zip(previous, current))
+
+
+def encode_frames(frames, encoding):
+    """
+    Encode a sequence of equally sized frames
+    :param frames: List of frame byte strings
+    :param encoding: One of ENCODING_RAW, ENCODING_RLE or ENCODING_DELTA. Delta
+    encoding stores each frame RLE-compressed as the XOR against its predecessor,
+    the first frame against zeros, so unchanged pixels become long zero runs.
+    :return: The concatenated data and a list of the offsets of each frame in it
+    """
+    data = bytearray()
+    offsets = []
+    previous = None
+    for frame in frames:
+        # Raw frames are drawn straight from flash, so keep them word aligned
+        if encoding == ENCODING_RAW:
+            data += bytes(-len(data) % 4)
+        offsets.append(len(data))
+        if encoding == ENCODING_RAW:
+            data += frame
+        elif encoding == ENCODING_RLE or previous is None:
+            data += rle_encode(frame)
+        else:
+            data += rle_encode(xor_frames(previous, frame))
+        previous = frame
+    return bytes(data), offsets
+
+
+def pack_words(data):
+    """
+    Pack bytes into little-endian 32-bit words, so that the array emitted for them
+    is word aligned
+    """
+    data = bytes(data) + bytes(-len(data) % 4)
+    return [int.from_bytes(data[i : i + 4], "little") for i in range(0, len(data), 4)]
@@ -27,5 +27,5 @@ async def to_code(config):
     widget = await get_widgets(config, CONF_WIDGET)
     widget = widget[0]
     await wait_for_widgets()
-    async with LvContext() as ctx:
+    async with LvContext(widget) as ctx:
         ctx.add(var.set_obj(widget.obj))
@@ -27,6 +27,10 @@ class LVLight : public light::LightOutput {
 
   void set_obj(lv_obj_t *obj) {
     this->obj_ = obj;
+    // The widget is deleted if its page is unloaded, and set again when rebuilt
+    lv_obj_add_event_cb(
+        obj, [](lv_event_t *e) { static_cast<LVLight *>(lv_event_get_user_data(e))->obj_ = nullptr; },
+        LV_EVENT_DELETE, this);
     if (this->initial_value_) {
       lv_led_set_color(obj, this->initial_value_.value());
       lv_led_on(obj);
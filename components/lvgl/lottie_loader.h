@@ -13,25 +13,35 @@
 // Needed to null out the dangling anim pointer and to clear the ThorVG canvas
 // before re-pushing the paint.
 #include <src/widgets/lottie/lv_lottie_private.h>
+// lv_cover_check_info_t, to find out whether the widget is fully covered.
+#include <src/core/lv_obj_event_private.h>
+
+#include "render_pool.h"
+
+#ifdef USE_LVGL_LOTTIE_DEFLATE
+// tinfl from the ESP32 ROM
+#include "miniz.h"
+#endif
 
 namespace esphome {
 namespace lvgl {
 
 static const char *const LOTTIE_TAG = "lottie";
-static constexpr size_t LOTTIE_TASK_STACK_SIZE = 64 * 1024;
 
 // Persistent context for each Lottie widget – tracks all PSRAM allocations,
-// the render task, and cached animation parameters for safe re-load.
+// the frame timer, and cached animation parameters for safe re-load.
 struct LottieContext {
     // --- Config (set once, never freed) ---
     lv_obj_t *obj;
     const void *data;           // PROGMEM (embedded) or nullptr
-    size_t data_size;
+    size_t data_size;           // JSON size, excluding the NUL
+    size_t compressed_size;     // zlib stream size if data is compressed, else 0
     const char *file_path;      // string literal or nullptr
     bool loop;
     bool auto_start;
     uint32_t width;
     uint32_t height;
+    uint8_t max_fps;
 
     // --- Animation params (captured on first load, reused on re-loads) ---
     lv_anim_exec_xcb_t exec_cb;
@@ -43,35 +53,171 @@ struct LottieContext {
 
     // --- Runtime state (freed on screen unload) ---
     uint8_t *pixel_buffer;      // PSRAM – width*height*4
-    StackType_t *task_stack;    // PSRAM – 64 KB
-    StaticTask_t *task_tcb;     // internal RAM
-    TaskHandle_t task_handle;
-    volatile bool stop_requested;
+    lv_timer_t *load_timer;     // one-shot, queues the load job
+    lv_timer_t *frame_timer;    // periodic, queues one frame job per tick
+    uint32_t generation;        // bumped on unload – stale jobs drop out
+    volatile bool frame_pending;      // a frame job is queued or running
     volatile bool restart_requested;  // ✅ Flag to restart animation from frame 0
     TickType_t start_tick;            // ✅ Animation start time (can be reset)
+    TickType_t pause_tick;      // when frames were paused for being out of view
+    bool paused;                // not visible – no frames are queued
     bool user_wants_hidden;     // Save user's 'hidden' config from YAML
     bool runtime_hidden;        // Actual visibility at time of unload (captures script changes)
 };
 
+inline void lottie_frame_job(void *param, uint32_t generation);
+
+// True if an opaque, visible object fully covers the area.
+inline bool lottie_obj_covers(lv_obj_t *obj, const lv_area_t *area) {
+    if (lv_obj_has_flag(obj, LV_OBJ_FLAG_HIDDEN)) return false;
+    lv_area_t coords;
+    lv_obj_get_coords(obj, &coords);
+    if (!lv_area_is_in(area, &coords, 0)) return false;
+    lv_cover_check_info_t info;
+    info.res = LV_COVER_RES_COVER;
+    info.area = area;
+    lv_obj_send_event(obj, LV_EVENT_COVER_CHECK, &info);
+    return info.res == LV_COVER_RES_COVER;
+}
+
+// --------------------------------------------------------------------------
+// Whether a frame rendered now could be seen: the widget is on the active
+// screen, not hidden or scrolled out of its parents, and not fully covered
+// by a later sibling of itself or an ancestor, or by the top layer.
+// --------------------------------------------------------------------------
+inline bool lottie_is_on_screen(LottieContext *ctx) {
+    lv_obj_t *obj = ctx->obj;
+    if (lv_obj_get_screen(obj) != lv_screen_active() || !lv_obj_is_visible(obj)) return false;
+
+    lv_area_t area;
+    lv_obj_get_coords(obj, &area);
+    for (lv_obj_t *child = obj, *parent = lv_obj_get_parent(obj); parent != nullptr;
+         child = parent, parent = lv_obj_get_parent(parent)) {
+        uint32_t count = lv_obj_get_child_count(parent);
+        for (uint32_t i = lv_obj_get_index(child) + 1; i < count; i++) {
+            if (lottie_obj_covers(lv_obj_get_child(parent, i), &area)) return false;
+        }
+    }
+    lv_obj_t *top = lv_layer_top();
+    uint32_t count = lv_obj_get_child_count(top);
+    for (uint32_t i = 0; i < count; i++) {
+        if (lottie_obj_covers(lv_obj_get_child(top, i), &area)) return false;
+    }
+    return true;
+}
+
+// --------------------------------------------------------------------------
+// Frame timer – runs in the LVGL task and hands the next frame to the
+// render pool.  At most one frame per widget is in flight, so a slow frame
+// drops ticks rather than queueing a backlog.  While the widget can't be
+// seen no frames are rendered and the animation clock is held, so it
+// carries on from the same frame when it comes back into view.
+// --------------------------------------------------------------------------
+inline void lottie_frame_timer_cb(lv_timer_t *timer) {
+    LottieContext *ctx = (LottieContext *)lv_timer_get_user_data(timer);
+    if (!lottie_is_on_screen(ctx)) {
+        if (!ctx->paused) {
+            ctx->paused = true;
+            ctx->pause_tick = xTaskGetTickCount();
+            ESP_LOGD(LOTTIE_TAG, "Out of view, frames paused");
+        }
+        return;
+    }
+    if (ctx->paused) {
+        ctx->paused = false;
+        ctx->start_tick += xTaskGetTickCount() - ctx->pause_tick;
+        ESP_LOGD(LOTTIE_TAG, "Back in view, frames resumed");
+    }
+    if (ctx->frame_pending) return;
+    ctx->frame_pending = true;
+    if (!render_pool_submit(lottie_frame_job, ctx, ctx->generation)) {
+        ctx->frame_pending = false;
+    }
+}
+
+inline void lottie_stop_timers(LottieContext *ctx) {
+    if (ctx->load_timer)  { lv_timer_delete(ctx->load_timer);  ctx->load_timer = nullptr; }
+    if (ctx->frame_timer) { lv_timer_delete(ctx->frame_timer); ctx->frame_timer = nullptr; }
+}
+
+// Start the frame timer.  Call under lv_lock once the animation is loaded.
+inline void lottie_start_frames(LottieContext *ctx) {
+    int32_t total_frames = ctx->end_frame - ctx->start_frame;
+    uint32_t frame_delay_ms = ctx->duration_ms / (uint32_t)total_frames;
+    // Render at least 10 fps for the animation's own frame rate, but never above max_fps
+    if (frame_delay_ms > 100) frame_delay_ms = 100;
+    uint32_t min_delay_ms = ctx->max_fps != 0 ? 1000 / ctx->max_fps : 16;
+    if (min_delay_ms < 16)    min_delay_ms = 16;
+    if (frame_delay_ms < min_delay_ms) frame_delay_ms = min_delay_ms;
+
+    ESP_LOGI(LOTTIE_TAG, "Render loop: %u ms/frame (max %u fps), loop=%d",
+             (unsigned)frame_delay_ms, (unsigned)ctx->max_fps, (int)ctx->loop);
+
+    ctx->start_tick = xTaskGetTickCount();  // ✅ Store in context for restart capability
+    ctx->restart_requested = false;
+    ctx->paused = false;
+    if (ctx->frame_timer == nullptr) {
+        ctx->frame_timer = lv_timer_create(lottie_frame_timer_cb, frame_delay_ms, ctx);
+    }
+}
+
 // --------------------------------------------------------------------------
-// Render task – runs on 64 KB PSRAM stack.
+// Frame job – runs on a render pool worker (64 KB PSRAM stack).
+// ThorVG renders inside exec_cb, under lv_lock, so the unload callbacks
+// (which also run under lv_lock) can never free the buffer mid-frame.
+// --------------------------------------------------------------------------
+inline void lottie_frame_job(void *param, uint32_t generation) {
+    LottieContext *ctx = (LottieContext *)param;
+
+    lv_lock();
+    if (generation != ctx->generation) {
+        // Widget was unloaded after this frame was queued
+        lv_unlock();
+        return;
+    }
+
+    // ✅ Check if restart requested
+    if (ctx->restart_requested) {
+        ctx->start_tick = xTaskGetTickCount();
+        ctx->restart_requested = false;
+        ESP_LOGI(LOTTIE_TAG, "Animation restarted from frame 0");
+    }
+
+    int32_t total_frames = ctx->end_frame - ctx->start_frame;
+    uint32_t elapsed_ms = (uint32_t)((xTaskGetTickCount() - ctx->start_tick) * portTICK_PERIOD_MS);
+
+    if (ctx->loop) {
+        uint32_t phase = elapsed_ms % ctx->duration_ms;
+        ctx->exec_cb(ctx->anim_var, ctx->start_frame + (int32_t)((int64_t)total_frames * phase / ctx->duration_ms));
+    } else if (elapsed_ms >= ctx->duration_ms) {
+        ctx->exec_cb(ctx->anim_var, ctx->end_frame);
+        if (ctx->frame_timer) { lv_timer_delete(ctx->frame_timer); ctx->frame_timer = nullptr; }
+        ESP_LOGI(LOTTIE_TAG, "Animation complete");
+    } else {
+        ctx->exec_cb(ctx->anim_var, ctx->start_frame + (int32_t)((int64_t)total_frames * elapsed_ms / ctx->duration_ms));
+    }
+    ctx->frame_pending = false;
+    lv_unlock();
+}
+
+// --------------------------------------------------------------------------
+// Load job – runs on a render pool worker (64 KB PSRAM stack).
 //
-// First load:  set buffer → parse data → capture anim params → render loop
-// Re-load:     clear canvas → set buffer (no re-parse) → render loop
+// First load:  set buffer → parse data → capture anim params → start frames
+// Re-load:     clear canvas → set buffer (no re-parse) → start frames
 //
-// lv_lottie_set_buffer() MUST be called from this task (not from an LVGL
+// lv_lottie_set_buffer() MUST be called from a worker (not from an LVGL
 // event callback) because it internally triggers a ThorVG render that
 // needs the large stack.
 // --------------------------------------------------------------------------
-inline void lottie_load_task(void *param) {
+inline void lottie_load_job(void *param, uint32_t generation) {
     LottieContext *ctx = (LottieContext *)param;
 
-    // Wait for LVGL to be ready.
-    // First load needs longer delay (LVGL may still be initialising).
-    // Re-load needs only a short delay (LVGL is already running).
-    vTaskDelay(pdMS_TO_TICKS(ctx->data_loaded ? 100 : 1000));
-
     lv_lock();
+    if (generation != ctx->generation) {
+        lv_unlock();
+        return;
+    }
 
     if (!ctx->data_loaded) {
         // ===== FIRST LOAD =====
@@ -81,6 +227,29 @@ inline void lottie_load_task(void *param) {
         // no data is loaded yet ThorVG has nothing to render (safe).
         lv_lottie_set_buffer(ctx->obj, ctx->width, ctx->height, ctx->pixel_buffer);
 
+#ifdef USE_LVGL_LOTTIE_DEFLATE
+        // Inflate once into PSRAM; the JSON is kept for the life of the widget
+        // (tinfl needs ~11 KB of stack, another reason to do this here).
+        if (ctx->data != nullptr && ctx->compressed_size != 0) {
+            char *json = (char *)heap_caps_malloc(ctx->data_size + 1, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
+            size_t inflated = TINFL_DECOMPRESS_MEM_TO_MEM_FAILED;
+            if (json != nullptr) {
+                inflated = tinfl_decompress_mem_to_mem(json, ctx->data_size, ctx->data, ctx->compressed_size,
+                                                       TINFL_FLAG_PARSE_ZLIB_HEADER);
+            }
+            if (inflated != ctx->data_size) {
+                ESP_LOGE(LOTTIE_TAG, "Inflating %u bytes failed", (unsigned)ctx->compressed_size);
+                if (json) heap_caps_free(json);
+                ctx->data = nullptr;
+            } else {
+                json[inflated] = '\0';
+                ESP_LOGI(LOTTIE_TAG, "Inflated %u -> %u bytes", (unsigned)ctx->compressed_size, (unsigned)inflated);
+                ctx->data = json;
+                ctx->compressed_size = 0;
+            }
+        }
+#endif
+
         // Parse lottie data (heavy ThorVG work – needs 64 KB stack)
         if (ctx->data != nullptr) {
             lv_lottie_set_src_data(ctx->obj, ctx->data, ctx->data_size);
@@ -103,7 +272,7 @@ inline void lottie_load_task(void *param) {
                      (int)ctx->start_frame, (int)ctx->end_frame, (unsigned)ctx->duration_ms);
 
             // Delete the LVGL animation – we drive rendering ourselves
-            // from this PSRAM task instead of the main task (small stack).
+            // from the render pool instead of the main task (small stack).
             lv_anim_delete(ctx->anim_var, ctx->exec_cb);
 
             // CRITICAL: null out the dangling pointer in lv_lottie_t.
@@ -113,7 +282,7 @@ inline void lottie_load_task(void *param) {
             lottie->anim = NULL;
 
             ctx->data_loaded = true;
-            ESP_LOGI(LOTTIE_TAG, "LVGL anim removed – rendering from PSRAM task");
+            ESP_LOGI(LOTTIE_TAG, "LVGL anim removed – rendering from render pool");
         } else {
             ESP_LOGE(LOTTIE_TAG, "Animation INVALID – parsing may have failed!");
         }
@@ -142,95 +311,48 @@ inline void lottie_load_task(void *param) {
         lv_obj_remove_flag(ctx->obj, LV_OBJ_FLAG_HIDDEN);
     }
 
-    lv_unlock();
-
     // Validate animation parameters
     if (!ctx->data_loaded || ctx->exec_cb == nullptr ||
         ctx->duration_ms == 0 || ctx->end_frame <= ctx->start_frame) {
-        ESP_LOGW(LOTTIE_TAG, "No valid animation, task suspending");
-        vTaskSuspend(NULL);
-        return;
-    }
-    if (!ctx->auto_start) {
-        ESP_LOGI(LOTTIE_TAG, "auto_start=false, task suspending");
-        vTaskSuspend(NULL);
-        return;
+        ESP_LOGW(LOTTIE_TAG, "No valid animation, not starting frames");
+    } else if (!ctx->auto_start) {
+        ESP_LOGI(LOTTIE_TAG, "auto_start=false, not starting frames");
+    } else {
+        lottie_start_frames(ctx);
     }
 
-    // --- Frame render loop (64 KB PSRAM stack) ---
-    int32_t total_frames = ctx->end_frame - ctx->start_frame;
-    uint32_t frame_delay_ms = ctx->duration_ms / (uint32_t)total_frames;
-    if (frame_delay_ms < 16)  frame_delay_ms = 16;
-    if (frame_delay_ms > 100) frame_delay_ms = 100;
-
-    ESP_LOGI(LOTTIE_TAG, "Render loop: %u ms/frame, loop=%d",
-             (unsigned)frame_delay_ms, (int)ctx->loop);
-
-    ctx->start_tick = xTaskGetTickCount();  // ✅ Store in context for restart capability
-
-    while (!ctx->stop_requested) {
-        // ✅ Check if restart requested
-        if (ctx->restart_requested) {
-            ctx->start_tick = xTaskGetTickCount();
-            ctx->restart_requested = false;
-            ESP_LOGI(LOTTIE_TAG, "Animation restarted from frame 0");
-        }
-
-        uint32_t elapsed_ms = (uint32_t)((xTaskGetTickCount() - ctx->start_tick) * portTICK_PERIOD_MS);
-
-        int32_t frame;
-        if (ctx->loop) {
-            uint32_t phase = elapsed_ms % ctx->duration_ms;
-            frame = ctx->start_frame + (int32_t)((int64_t)total_frames * phase / ctx->duration_ms);
-        } else {
-            if (elapsed_ms >= ctx->duration_ms) {
-                lv_lock();
-                ctx->exec_cb(ctx->anim_var, ctx->end_frame);
-                lv_unlock();
-                ESP_LOGI(LOTTIE_TAG, "Animation complete");
-                break;
-            }
-            frame = ctx->start_frame + (int32_t)((int64_t)total_frames * elapsed_ms / ctx->duration_ms);
-        }
-
-        lv_lock();
-        ctx->exec_cb(ctx->anim_var, frame);
-        lv_unlock();
-
-        vTaskDelay(pdMS_TO_TICKS(frame_delay_ms));
-    }
+    lv_unlock();
+}
 
-    if (ctx->stop_requested) {
-        ESP_LOGI(LOTTIE_TAG, "Stop requested – task suspending");
+// One-shot timer: give LVGL time to settle, then queue the load job.
+// First load needs longer delay (LVGL may still be initialising).
+// Re-load needs only a short delay (LVGL is already running).
+inline void lottie_load_timer_cb(lv_timer_t *timer) {
+    LottieContext *ctx = (LottieContext *)lv_timer_get_user_data(timer);
+    if (!render_pool_submit(lottie_load_job, ctx, ctx->generation)) {
+        return;  // queue full – retry on the next period
     }
-
-    // Suspend (NOT delete) – cleanup callback will delete us safely
-    vTaskSuspend(NULL);
+    lv_timer_delete(timer);
+    ctx->load_timer = nullptr;
 }
 
 // --------------------------------------------------------------------------
-// Free all PSRAM/internal-RAM resources for one Lottie widget.
+// Free all PSRAM resources for one Lottie widget.  Call under lv_lock.
 // --------------------------------------------------------------------------
 inline void lottie_free_resources(LottieContext *ctx) {
-    ctx->stop_requested = true;
-    if (ctx->task_handle) {
-        vTaskDelete(ctx->task_handle);
-        ctx->task_handle = nullptr;
-    }
-    if (ctx->task_stack)    { heap_caps_free(ctx->task_stack);    ctx->task_stack = nullptr; }
-    if (ctx->task_tcb)      { heap_caps_free(ctx->task_tcb);      ctx->task_tcb = nullptr; }
+    ctx->generation++;
+    lottie_stop_timers(ctx);
     if (ctx->pixel_buffer)  { heap_caps_free(ctx->pixel_buffer);  ctx->pixel_buffer = nullptr; }
-    ctx->stop_requested = false;
 
-    ESP_LOGI(LOTTIE_TAG, "Lottie PSRAM freed (%ux%u = %u KB + 64 KB stack)",
+    ESP_LOGI(LOTTIE_TAG, "Lottie PSRAM freed (%ux%u = %u KB)",
              (unsigned)ctx->width, (unsigned)ctx->height,
              (unsigned)(ctx->width * ctx->height * 4 / 1024));
 }
 
 // --------------------------------------------------------------------------
-// (Re-)allocate pixel buffer and launch the render task.
-// lv_lottie_set_buffer is NOT called here – it is called inside the task
-// because it triggers ThorVG rendering which needs the 64 KB stack.
+// (Re-)allocate pixel buffer and schedule the load job.
+// lv_lottie_set_buffer is NOT called here – it is called from the render
+// pool because it triggers ThorVG rendering which needs the 64 KB stack.
 // --------------------------------------------------------------------------
 inline bool lottie_launch(LottieContext *ctx) {
     // NOTE: Do NOT re-capture runtime_hidden here!
@@ -254,29 +376,10 @@ inline bool lottie_launch(LottieContext *ctx) {
     // Hide temporarily during async load (pixel buffer is blank)
     lv_obj_add_flag(ctx->obj, LV_OBJ_FLAG_HIDDEN);
 
-    // Allocate task stack + TCB
-    ctx->task_stack = (StackType_t *)heap_caps_malloc(
-        LOTTIE_TASK_STACK_SIZE, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
-    ctx->task_tcb = (StaticTask_t *)heap_caps_malloc(
-        sizeof(StaticTask_t), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
-    if (!ctx->task_stack || !ctx->task_tcb) {
-        ESP_LOGE(LOTTIE_TAG, "Task alloc failed");
-        lottie_free_resources(ctx);
-        return false;
-    }
+    ctx->frame_pending = false;
+    ctx->load_timer = lv_timer_create(lottie_load_timer_cb, ctx->data_loaded ? 100 : 1000, ctx);
 
-    ctx->stop_requested = false;
-    ctx->task_handle = xTaskCreateStatic(
-        lottie_load_task, "lottie_anim",
-        LOTTIE_TASK_STACK_SIZE / sizeof(StackType_t),
-        ctx, 5, ctx->task_stack, ctx->task_tcb);
-
-    if (!ctx->task_handle) {
-        lottie_free_resources(ctx);
-        return false;
-    }
-
-    ESP_LOGI(LOTTIE_TAG, "Lottie launched (runtime_hidden=%d, PSRAM: %u KB buf + 64 KB stack, free PSRAM: %u KB, free SRAM: %u KB)",
+    ESP_LOGI(LOTTIE_TAG, "Lottie launched (runtime_hidden=%d, PSRAM: %u KB buf, free PSRAM: %u KB, free SRAM: %u KB)",
              (int)ctx->runtime_hidden,
              (unsigned)(buf_bytes / 1024),
              (unsigned)(heap_caps_get_free_size(MALLOC_CAP_SPIRAM) / 1024),
@@ -288,7 +391,7 @@ inline bool lottie_launch(LottieContext *ctx) {
 // Screen event callbacks – two-phase unload to avoid drawing freed buffer
 // during screen transition animation.
 //
-//   SCREEN_UNLOAD_START  → stop task + hide widget (LVGL still draws screen)
+//   SCREEN_UNLOAD_START  → stop frames + hide widget (LVGL still draws screen)
 //   SCREEN_UNLOADED      → free PSRAM (screen no longer visible)
 //   SCREEN_LOADED        → re-allocate and re-launch
 // --------------------------------------------------------------------------
@@ -299,29 +402,23 @@ inline void lottie_screen_unload_start_cb(lv_event_t *e) {
     // show/hide from user scripts (e.g. weather widget selection).
     ctx->runtime_hidden = lv_obj_has_flag(ctx->obj, LV_OBJ_FLAG_HIDDEN);
 
-    // Stop the render task immediately
-    ctx->stop_requested = true;
-    if (ctx->task_handle) {
-        vTaskDelete(ctx->task_handle);
-        ctx->task_handle = nullptr;
-    }
+    // Stop rendering immediately – queued jobs see the new generation and drop out
+    ctx->generation++;
+    lottie_stop_timers(ctx);
 
     // Hide widget so LVGL won't try to draw the image during transition
     lv_obj_add_flag(ctx->obj, LV_OBJ_FLAG_HIDDEN);
 
-    ESP_LOGI(LOTTIE_TAG, "Lottie task stopped, widget hidden (was_hidden=%d)", (int)ctx->runtime_hidden);
+    ESP_LOGI(LOTTIE_TAG, "Lottie frames stopped, widget hidden (was_hidden=%d)", (int)ctx->runtime_hidden);
 }
 
 inline void lottie_screen_unloaded_cb(lv_event_t *e) {
     LottieContext *ctx = (LottieContext *)lv_event_get_user_data(e);
 
     // Now safe to free – screen is no longer visible
-    if (ctx->task_stack)    { heap_caps_free(ctx->task_stack);    ctx->task_stack = nullptr; }
-    if (ctx->task_tcb)      { heap_caps_free(ctx->task_tcb);      ctx->task_tcb = nullptr; }
     if (ctx->pixel_buffer)  { heap_caps_free(ctx->pixel_buffer);  ctx->pixel_buffer = nullptr; }
-    ctx->stop_requested = false;
 
-    ESP_LOGI(LOTTIE_TAG, "Lottie FREED (%ux%u = %u KB buf + 64 KB stack) → free PSRAM: %u KB, free SRAM: %u KB",
+    ESP_LOGI(LOTTIE_TAG, "Lottie FREED (%ux%u = %u KB buf) → free PSRAM: %u KB, free SRAM: %u KB",
              (unsigned)ctx->width, (unsigned)ctx->height,
              (unsigned)(ctx->width * ctx->height * 4 / 1024),
              (unsigned)(heap_caps_get_free_size(MALLOC_CAP_SPIRAM) / 1024),
@@ -337,23 +434,28 @@ inline void lottie_screen_loaded_cb(lv_event_t *e) {
 
 // --------------------------------------------------------------------------
 // Public API: Restart animation from frame 0 (preserves loop/hidden state)
-// Safe to call at any time – sets a flag checked by the render loop.
+// Call from the LVGL task; a finished one-shot animation is started again.
 // --------------------------------------------------------------------------
 inline void lottie_restart(LottieContext *ctx) {
-    if (ctx && ctx->task_handle) {
+    if (ctx == nullptr || ctx->pixel_buffer == nullptr || !ctx->data_loaded) return;
+    if (ctx->frame_timer) {
         ctx->restart_requested = true;
         ESP_LOGI(LOTTIE_TAG, "Restart requested (will reset on next frame)");
+    } else if (ctx->load_timer == nullptr && ctx->exec_cb != nullptr &&
+               ctx->duration_ms != 0 && ctx->end_frame > ctx->start_frame) {
+        lottie_start_frames(ctx);
     }
 }
 
 // --------------------------------------------------------------------------
 // Public API: initialise Lottie widget – allocate buffer, register screen
-// events, and launch the load/render task.
+// events; loading is scheduled on the render pool when the page is shown.
 // Call under lv_lock (from LVGL init code).
 // --------------------------------------------------------------------------
 inline bool lottie_init(lv_obj_t *obj, const void *data, size_t data_size,
                          const char *file_path, uint32_t width, uint32_t height,
-                         bool loop, bool auto_start, bool user_wants_hidden) {
+                         bool loop, bool auto_start, bool user_wants_hidden,
+                         uint8_t max_fps, size_t compressed_size = 0) {
     LottieContext *ctx = (LottieContext *)heap_caps_malloc(
         sizeof(LottieContext), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
     if (!ctx) return false;
@@ -362,11 +464,13 @@ inline bool lottie_init(lv_obj_t *obj, const void *data, size_t data_size,
     ctx->obj       = obj;
     ctx->data      = data;
     ctx->data_size = data_size;
+    ctx->compressed_size = compressed_size;
     ctx->file_path = file_path;
     ctx->loop      = loop;
     ctx->auto_start = auto_start;
     ctx->width     = width;
     ctx->height    = height;
+    ctx->max_fps   = max_fps;
     ctx->user_wants_hidden = user_wants_hidden;  // Save user's 'hidden' config from YAML
     ctx->runtime_hidden = user_wants_hidden;    // Initially matches YAML config
 
@@ -1,4 +1,6 @@
 import abc
+from pathlib import Path
+import re
 from typing import TYPE_CHECKING
 
 from esphome import codegen as cg
@@ -18,6 +20,7 @@ from esphome.cpp_generator import (
     VariableDeclarationExpression,
     statement,
 )
+from esphome.helpers import write_file_if_changed
 from esphome.yaml_util import ESPHomeDataBase
 
 from .defines import literal, lvgl_ns
@@ -185,13 +188,22 @@ class LvContext(LambdaContext):
 
     added_lambda_count = 0
 
-    def __init__(self):
-        super().__init__(parameters=LVGL_COMP_ARG)
+    def __init__(self, widget=None):
+        """
+        :param widget: The widget the code binds to. If it is on a lazily built page the
+        code is instead run by the page each time the widget is created.
+        """
+        self.page = widget.lazy_page if widget is not None else None
+        super().__init__(parameters=LVGL_COMP_ARG if self.page is None else [])
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await super().__aexit__(exc_type, exc_val, exc_tb)
+        if self.page is not None:
+            cg.add(self.page.add_binder(await self.get_lambda()))
 
     def add(self, expression: Expression | Statement):
+        if self.page is not None:
+            return super().add(expression)
         cg.add(expression)
         return expression
 
@@ -333,6 +345,106 @@ lvgl_comp = MockObj(LVGL_COMP, "->")
 lvgl_static = MockObj("LvglComponent", "::")
 
 
+def declaration_of(stmt):
+    if isinstance(stmt, ExpressionStatement):
+        stmt = stmt.expression
+    return stmt
+
+
+def is_declaration(stmt) -> bool:
+    return isinstance(declaration_of(stmt), VariableDeclarationExpression)
+
+
+def is_shared_global(stmt) -> bool:
+    """
+    Globals that stay in main.cpp when code moves to another source file: variables,
+    which that file declares extern, and includes and using directives, which it
+    repeats.
+    """
+    if is_declaration(stmt):
+        return True
+    return str(statement(stmt)).lstrip().startswith(("#include", "using namespace"))
+
+
+class SourceFile:
+    """
+    Moves the setup code generated within it to a separate source file, with its own
+    init function called in its place, so it can be compiled in parallel with main.cpp
+    and is only recompiled when it changes. Other globals generated within it, such as
+    constant arrays, move with the code.
+    """
+
+    enabled = False
+    written = set()
+
+    def __init__(self, name: str):
+        self.name = name
+        self.main_start = 0
+        self.global_start = 0
+
+    def __enter__(self):
+        self.main_start = len(CORE.main_statements)
+        self.global_start = len(CORE.global_statements)
+        return self
+
+    def __exit__(self, *args):
+        if not SourceFile.enabled or args[0] is not None:
+            return
+        code = CORE.main_statements[self.main_start :]
+        if not code:
+            return
+        new_globals = CORE.global_statements[self.global_start :]
+        moved = [x for x in new_globals if not is_shared_global(x)]
+        CORE.global_statements[self.global_start :] = [
+            x for x in new_globals if is_shared_global(x)
+        ]
+        del CORE.main_statements[self.main_start :]
+        body = [str(statement(x)).rstrip() for x in (*moved, *code)]
+        # Declare only the variables used, so the file does not change with the rest
+        # of the configuration
+        names = set(re.findall(r"\w+", "\n".join(body)))
+        includes = []
+        externs = []
+        for exp in CORE.global_statements:
+            text = str(statement(exp)).rstrip()
+            if is_declaration(exp):
+                if str(declaration_of(exp).name) in names:
+                    externs.append("extern " + text)
+            elif is_shared_global(exp):
+                includes.append(text)
+        func = f"lvgl_{self.name}_init"
+        lines = [
+            "// Auto generated code by esphome lvgl",
+            '#include "esphome.h"',
+            *includes,
+            *externs,
+            *body[: len(moved)],
+            "",
+            f"void {func}() {{",
+            *body[len(moved) :],
+            "}",
+            "",
+        ]
+        filename = f"lvgl_{self.name}.cpp"
+        write_file_if_changed(CORE.relative_src_path(filename), "\n".join(lines))
+        SourceFile.written.add(filename)
+        cg.add_global(RawStatement(f"void {func}();"))
+        cg.add(RawExpression(f"{func}()"))
+
+    @staticmethod
+    def remove_stale():
+        """
+        Remove files left by pages that no longer exist, which would otherwise still be
+        compiled
+        """
+        src_dir = Path(CORE.relative_src_path())
+        if not src_dir.is_dir():
+            return
+        for path in src_dir.glob("lvgl_*.cpp"):
+            if path.name not in SourceFile.written:
+                path.unlink()
+
+
 # equivalent to cg.add() for the current code context
 def lv_add(expression: Expression | Statement):
     return CodeContext.append(expression)
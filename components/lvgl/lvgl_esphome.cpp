@@ -5,6 +5,14 @@
 #include "lvgl_esphome.h"
 
 #include "core/lv_obj_class_private.h"
+#include "display/lv_display_private.h"
+
+#ifdef USE_ESP32
+#include "esp_memory_utils.h"
+#ifdef LVGL_MEM_POOL_SIZE
+#include "freertos/FreeRTOS.h"
+#endif
+#endif
 
 #ifdef USE_LVGL_PPA
 extern "C" {
@@ -12,6 +20,7 @@ void lv_draw_ppa_init(void);
 }
 #endif
 
+#include <algorithm>
 #include <cstring>
 #include <numeric>
 
@@ -19,6 +28,15 @@ namespace esphome::lvgl {
 static const char *const TAG = "lvgl";
 
 static const size_t MIN_BUFFER_FRAC = 8;
+// Edge length in pixels of the square tiles used by the software rotation, sized so a source and destination
+// tile both stay in the data cache
+static const lv_coord_t ROTATE_TILE_SIZE = 32;
+#ifdef USE_ESP32
+// Internal RAM left free for the rest of the system when placing draw buffers there
+static const size_t INTERNAL_RAM_RESERVE = 64 * 1024;
+static const uint32_t FLUSH_TASK_STACK_SIZE = 8192;
+static const UBaseType_t FLUSH_TASK_PRIORITY = 5;
+#endif
 
 static const char *const EVENT_NAMES[] = {
     "NONE",
@@ -85,6 +103,7 @@ std::string lv_event_code_name_for(lv_event_t *event) {
 static void rounder_cb(lv_event_t *event) {
   auto *comp = static_cast<LvglComponent *>(lv_event_get_user_data(event));
   auto *area = static_cast<lv_area_t *>(lv_event_get_param(event));
+  comp->apply_invalidation_policy(area);
   // cater for display driver chips with special requirements for bounds of partial
   // draw areas. Extend the draw area to satisfy:
   // * Coordinates must be a multiple of draw_rounding
@@ -97,8 +116,58 @@ static void rounder_cb(lv_event_t *event) {
   area->y2 = (area->y2 + draw_rounding) / draw_rounding * draw_rounding - 1;
 }
 
+/**
+ * Grow a newly invalidated area before LVGL stores it. Pending dirty areas within merge_distance_ pixels are
+ * merged into it, and once the dirty areas cover more than full_refresh_threshold_ percent of the screen it
+ * becomes the whole screen. LVGL drops the pending areas the result contains when it joins areas before
+ * rendering, so each frame is flushed in fewer, larger transactions. Coverage counts overlaps twice, so
+ * it is an upper bound.
+ */
+void LvglComponent::apply_invalidation_policy(lv_area_t *area) {
+  auto *disp = this->disp_;
+  if (this->full_refresh_threshold_ < 100) {
+    int32_t width = lv_display_get_horizontal_resolution(disp);
+    int32_t height = lv_display_get_vertical_resolution(disp);
+    uint32_t dirty = lv_area_get_size(area);
+    for (uint32_t i = 0; i != disp->inv_p; i++)
+      dirty += lv_area_get_size(&disp->inv_areas[i]);
+    if (dirty * 100 > (uint32_t) width * height * this->full_refresh_threshold_) {
+      lv_area_set(area, 0, 0, width - 1, height - 1);
+#ifdef USE_LVGL_STATS
+      this->stats_.merged_areas += disp->inv_p;
+#endif
+      return;
+    }
+  }
+  if (this->merge_distance_ == 0)
+    return;
+  int32_t distance = this->merge_distance_;
+  for (uint32_t i = 0; i != disp->inv_p; i++) {
+    const lv_area_t &other = disp->inv_areas[i];
+    if (other.x1 - distance > area->x2 || area->x1 > other.x2 + distance || other.y1 - distance > area->y2 ||
+        area->y1 > other.y2 + distance)
+      continue;
+    area->x1 = std::min(area->x1, other.x1);
+    area->y1 = std::min(area->y1, other.y1);
+    area->x2 = std::max(area->x2, other.x2);
+    area->y2 = std::max(area->y2, other.y2);
+#ifdef USE_LVGL_STATS
+    this->stats_.merged_areas++;
+#endif
+  }
+}
+
 void LvglComponent::render_end_cb(lv_event_t *event) {
   auto *comp = static_cast<LvglComponent *>(lv_event_get_user_data(event));
+#ifdef USE_LVGL_STATS
+  comp->stats_.frames++;
+  // Time spent flushing, or waiting for a flush to finish, is not rendering
+  comp->stats_.render_us += micros() - comp->frame_start_us_ - comp->frame_flush_us_;
+  if (comp->first_frame_ms_ == 0) {
+    comp->first_frame_ms_ = millis();
+    ESP_LOGI(TAG, "First frame rendered %" PRIu32 " ms after boot", comp->first_frame_ms_);
+  }
+#endif
   comp->draw_end_();
 }
 
@@ -108,6 +177,17 @@ void LvglComponent::render_start_cb(lv_event_t *event) {
   comp->draw_start_();
 }
 
+#ifdef USE_LVGL_STATS
+void LvglComponent::flush_wait_cb(lv_event_t *event) {
+  auto *comp = static_cast<LvglComponent *>(lv_event_get_user_data(event));
+  if (lv_event_get_code(event) == LV_EVENT_FLUSH_WAIT_START) {
+    comp->flush_wait_start_us_ = micros();
+  } else {
+    comp->frame_flush_us_ += micros() - comp->flush_wait_start_us_;
+  }
+}
+#endif
+
 lv_event_code_t lv_api_event;     // NOLINT
 lv_event_code_t lv_update_event;  // NOLINT
 void LvglComponent::dump_config() {
@@ -115,9 +195,14 @@ void LvglComponent::dump_config() {
                 "LVGL:\n"
                 "  Display width/height: %d x %d\n"
                 "  Buffer size: %zu%%\n"
+                "  Double buffered: %s\n"
                 "  Rotation: %d\n"
-                "  Draw rounding: %d",
-                this->width_, this->height_, 100 / this->buffer_frac_, this->rotation, (int) this->draw_rounding);
+                "  Draw rounding: %d\n"
+                "  Merge distance: %d\n"
+                "  Full refresh threshold: %d%%",
+                this->width_, this->height_, 100 / this->buffer_frac_, YESNO(this->draw_buf2_ != nullptr),
+                this->rotation, (int) this->draw_rounding, (int) this->merge_distance_,
+                (int) this->full_refresh_threshold_);
 }
 
 void LvglComponent::set_paused(bool paused, bool show_snow) {
@@ -174,6 +259,7 @@ void LvglComponent::show_page(size_t index, lv_scr_load_anim_t anim, uint32_t ti
   if (index >= this->pages_.size())
     return;
   this->current_page_ = index;
+  this->pages_[index]->build();
   lv_scr_load_anim(this->pages_[this->current_page_]->obj, anim, time, 0, false);
 }
 
@@ -198,43 +284,164 @@ void LvglComponent::show_prev_page(lv_scr_load_anim_t anim, uint32_t time) {
 size_t LvglComponent::get_current_page() const { return this->current_page_; }
 bool LvPageType::is_showing() const { return this->parent_->get_current_page() == this->index; }
 
-void LvglComponent::draw_buffer_(const lv_area_t *area, lv_color_data *ptr) {
+void LvPageType::set_builder(std::function<void()> &&builder, bool unload) {
+  this->builder_ = std::move(builder);
+  this->unload_ = unload;
+  if (unload) {
+    // Wait until the page is off screen, after any load animation has finished
+    lv_obj_add_event_cb(
+        this->obj, [](lv_event_t *e) { static_cast<LvPageType *>(lv_event_get_user_data(e))->unload(); },
+        LV_EVENT_SCREEN_UNLOADED, this);
+  }
+}
+
+void LvPageType::add_binder(std::function<void()> &&binder) {
+  if (this->built_)
+    binder();
+  this->binders_.push_back(std::move(binder));
+}
+
+static void save_widget_state(LvWidgetState &widget) {
+  lv_obj_t *obj = *widget.var;
+  widget.saved = obj != nullptr;
+  if (obj == nullptr)
+    return;
+  widget.state = lv_obj_get_state(obj);
+#if LV_USE_ARC
+  if (lv_obj_check_type(obj, &lv_arc_class))
+    widget.value = lv_arc_get_value(obj);
+#endif
+#if LV_USE_BAR
+  if (lv_obj_check_type(obj, &lv_bar_class))
+    widget.value = lv_bar_get_value(obj);
+#endif
+#if LV_USE_SLIDER
+  if (lv_obj_check_type(obj, &lv_slider_class))
+    widget.value = lv_slider_get_value(obj);
+#endif
+#if LV_USE_DROPDOWN
+  if (lv_obj_check_type(obj, &lv_dropdown_class))
+    widget.value = lv_dropdown_get_selected(obj);
+#endif
+#if LV_USE_ROLLER
+  if (lv_obj_check_type(obj, &lv_roller_class))
+    widget.value = lv_roller_get_selected(obj);
+#endif
+#if LV_USE_SPINBOX
+  if (lv_obj_check_type(obj, &lv_spinbox_class))
+    widget.value = lv_spinbox_get_value(obj);
+#endif
+#if LV_USE_LABEL
+  if (lv_obj_check_type(obj, &lv_label_class))
+    widget.text = lv_label_get_text(obj);
+#endif
+#if LV_USE_TEXTAREA
+  if (lv_obj_check_type(obj, &lv_textarea_class))
+    widget.text = lv_textarea_get_text(obj);
+#endif
+}
+
+static void restore_widget_state(const LvWidgetState &widget) {
+  lv_obj_t *obj = *widget.var;
+  if (!widget.saved || obj == nullptr)
+    return;
+  // Only states the user or automations set; the rest follow from input and focus
+  constexpr lv_state_t kept = LV_STATE_CHECKED | LV_STATE_DISABLED;
+  lv_obj_set_state(obj, widget.state & kept, true);
+  lv_obj_set_state(obj, (lv_state_t) (~widget.state & kept), false);
+#if LV_USE_ARC
+  if (lv_obj_check_type(obj, &lv_arc_class))
+    lv_arc_set_value(obj, widget.value);
+#endif
+#if LV_USE_BAR
+  if (lv_obj_check_type(obj, &lv_bar_class))
+    lv_bar_set_value(obj, widget.value, LV_ANIM_OFF);
+#endif
+#if LV_USE_SLIDER
+  if (lv_obj_check_type(obj, &lv_slider_class))
+    lv_slider_set_value(obj, widget.value, LV_ANIM_OFF);
+#endif
+#if LV_USE_DROPDOWN
+  if (lv_obj_check_type(obj, &lv_dropdown_class))
+    lv_dropdown_set_selected(obj, widget.value);
+#endif
+#if LV_USE_ROLLER
+  if (lv_obj_check_type(obj, &lv_roller_class))
+    lv_roller_set_selected(obj, widget.value, LV_ANIM_OFF);
+#endif
+#if LV_USE_SPINBOX
+  if (lv_obj_check_type(obj, &lv_spinbox_class))
+    lv_spinbox_set_value(obj, widget.value);
+#endif
+#if LV_USE_LABEL
+  if (lv_obj_check_type(obj, &lv_label_class))
+    lv_label_set_text(obj, widget.text.c_str());
+#endif
+#if LV_USE_TEXTAREA
+  if (lv_obj_check_type(obj, &lv_textarea_class))
+    lv_textarea_set_text(obj, widget.text.c_str());
+#endif
+}
+
+void LvPageType::build() {
+  if (this->is_built())
+    return;
+  uint32_t start = millis();
+  lv_mem_monitor_t before;
+  lv_mem_monitor(&before);
+  this->builder_();
+  this->built_ = true;
+  for (auto &widget : this->widgets_)
+    restore_widget_state(widget);
+  for (auto &binder : this->binders_)
+    binder();
+  lv_mem_monitor_t after;
+  lv_mem_monitor(&after);
+  ESP_LOGD(TAG, "Page %u built in %" PRIu32 " ms, using %d bytes", (unsigned) this->index, millis() - start,
+           (int) (before.free_size - after.free_size));
+}
+
+void LvPageType::unload() {
+  if (!this->built_ || this->is_showing())
+    return;
+  for (auto &widget : this->widgets_) {
+    save_widget_state(widget);
+    *widget.var = nullptr;
+  }
+  lv_obj_clean(this->obj);
+  this->built_ = false;
+  ESP_LOGD(TAG, "Page %u unloaded", (unsigned) this->index);
+}
+
+/**
+ * Write an area of the draw buffer to the displays, rotating it first if needed.
+ * @return The microseconds spent rotating.
+ */
+uint32_t LvglComponent::draw_buffer_(const lv_area_t *area, lv_color_data *ptr) {
   auto width = lv_area_get_width(area);
   auto height = lv_area_get_height(area);
   auto height_rounded = (height + this->draw_rounding - 1) / this->draw_rounding * this->draw_rounding;
   auto x1 = area->x1;
   auto y1 = area->y1;
   lv_color_data *dst = reinterpret_cast<lv_color_data *>(this->rotate_buf_);
+  auto rotate_start = micros();
   switch (this->rotation) {
     case display::DISPLAY_ROTATION_90_DEGREES:
-      for (lv_coord_t x = height; x-- != 0;) {
-        for (lv_coord_t y = 0; y != width; y++) {
-          dst[y * height_rounded + x] = *ptr++;
-        }
-      }
+      this->rotate_area_(ptr, dst, width, height, height_rounded);
       y1 = x1;
       x1 = this->height_ - area->y1 - height;
-      width = height;
       height = width;
       width = height_rounded;
       break;
 
     case display::DISPLAY_ROTATION_180_DEGREES:
-      for (lv_coord_t y = height; y-- != 0;) {
-        for (lv_coord_t x = width; x-- != 0;) {
-          dst[y * width + x] = *ptr++;
-        }
-      }
+      this->rotate_area_(ptr, dst, width, height, width);
       x1 = this->width_ - x1 - width;
       y1 = this->height_ - y1 - height;
       break;
 
     case display::DISPLAY_ROTATION_270_DEGREES:
-      for (lv_coord_t x = 0; x != height; x++) {
-        for (lv_coord_t y = width; y-- != 0;) {
-          dst[y * height_rounded + x] = *ptr++;
-        }
-      }
+      this->rotate_area_(ptr, dst, width, height, height_rounded);
       x1 = y1;
       y1 = this->width_ - area->x1 - width;
       height = width;
@@ -245,22 +452,180 @@ void LvglComponent::draw_buffer_(const lv_area_t *area, lv_color_data *ptr) {
       dst = ptr;
       break;
   }
+  uint32_t rotate_us = micros() - rotate_start;
   for (auto *display : this->displays_) {
     display->draw_pixels_at(x1, y1, width, height, (const uint8_t *) dst, display::COLOR_ORDER_RGB, LV_BITNESS,
                             this->big_endian_);
   }
+  return rotate_us;
+}
+
+/**
+ * Rotate a width x height block of pixels from src into dst according to the display rotation.
+ * dst_stride is the row length of the destination in pixels, which may include padding for draw rounding.
+ * Uses the PPA when available, otherwise a tiled copy that keeps source and destination accesses within
+ * a cache-sized block rather than striding across the whole destination for every source pixel.
+ */
+void LvglComponent::rotate_area_(const lv_color_data *src, lv_color_data *dst, lv_coord_t width, lv_coord_t height,
+                                 lv_coord_t dst_stride) {
+#ifdef USE_LVGL_PPA
+  if (this->rotate_ppa_(src, dst, width, height, dst_stride))
+    return;
+#endif
+  for (lv_coord_t ty = 0; ty < height; ty += ROTATE_TILE_SIZE) {
+    lv_coord_t ty_end = std::min<lv_coord_t>(ty + ROTATE_TILE_SIZE, height);
+    for (lv_coord_t tx = 0; tx < width; tx += ROTATE_TILE_SIZE) {
+      lv_coord_t tx_end = std::min<lv_coord_t>(tx + ROTATE_TILE_SIZE, width);
+      for (lv_coord_t y = ty; y != ty_end; y++) {
+        const lv_color_data *row = src + y * width;
+        switch (this->rotation) {
+          case display::DISPLAY_ROTATION_90_DEGREES:
+            for (lv_coord_t x = tx; x != tx_end; x++)
+              dst[x * dst_stride + height - 1 - y] = row[x];
+            break;
+          case display::DISPLAY_ROTATION_180_DEGREES:
+            for (lv_coord_t x = tx; x != tx_end; x++)
+              dst[(height - 1 - y) * dst_stride + width - 1 - x] = row[x];
+            break;
+          case display::DISPLAY_ROTATION_270_DEGREES:
+            for (lv_coord_t x = tx; x != tx_end; x++)
+              dst[(width - 1 - x) * dst_stride + y] = row[x];
+            break;
+          default:
+            break;
+        }
+      }
+    }
+  }
+}
+
+#ifdef USE_LVGL_PPA
+/**
+ * Rotate using the PPA scale-rotate-mirror engine. PPA angles are counter-clockwise, display rotations clockwise.
+ * @return false if the PPA is unavailable or the operation failed, in which case the caller rotates in software.
+ */
+bool LvglComponent::rotate_ppa_(const lv_color_data *src, lv_color_data *dst, lv_coord_t width, lv_coord_t height,
+                                lv_coord_t dst_stride) {
+  if (this->ppa_srm_client_ == nullptr)
+    return false;
+  ppa_srm_rotation_angle_t angle;
+  uint32_t out_w = width;
+  uint32_t out_h = height;
+  switch (this->rotation) {
+    case display::DISPLAY_ROTATION_90_DEGREES:
+      angle = PPA_SRM_ROTATION_ANGLE_270;
+      out_w = dst_stride;
+      out_h = width;
+      break;
+    case display::DISPLAY_ROTATION_180_DEGREES:
+      angle = PPA_SRM_ROTATION_ANGLE_180;
+      out_w = dst_stride;
+      break;
+    case display::DISPLAY_ROTATION_270_DEGREES:
+      angle = PPA_SRM_ROTATION_ANGLE_90;
+      out_w = dst_stride;
+      out_h = width;
+      break;
+    default:
+      return false;
+  }
+  ppa_srm_oper_config_t config{};
+  config.in.buffer = src;
+  config.in.pic_w = width;
+  config.in.pic_h = height;
+  config.in.block_w = width;
+  config.in.block_h = height;
+  config.in.srm_cm = PPA_SRM_COLOR_MODE_RGB565;
+  config.out.buffer = dst;
+  config.out.buffer_size = LV_ALIGN_UP(this->buf_bytes_, 64);
+  config.out.pic_w = out_w;
+  config.out.pic_h = out_h;
+  config.out.srm_cm = PPA_SRM_COLOR_MODE_RGB565;
+  config.rotation_angle = angle;
+  config.scale_x = 1.0f;
+  config.scale_y = 1.0f;
+  config.mode = PPA_TRANS_MODE_BLOCKING;
+  return ppa_do_scale_rotate_mirror(this->ppa_srm_client_, &config) == ESP_OK;
+}
+#endif  // USE_LVGL_PPA
+
+/**
+ * Write an area to the displays, unless paused. May run on the flush task, so touches no shared state.
+ * @return The microseconds taken, 0 if nothing was written.
+ */
+uint32_t LvglComponent::flush_area_(const lv_area_t *area, uint8_t *color_p) {
+  if (this->is_paused())
+    return 0;
+  auto start_us = micros();
+  auto rotate_us = this->draw_buffer_(area, reinterpret_cast<lv_color_data *>(color_p));
+  uint32_t flush_us = std::max<uint32_t>(micros() - start_us, 1);
+  ESP_LOGV(TAG, "flush_cb, area=%d/%d, %d/%d took %uus (rotate %uus)", area->x1, area->y1, lv_area_get_width(area),
+           lv_area_get_height(area), (unsigned) flush_us, (unsigned) rotate_us);
+  return flush_us;
+}
+
+void LvglComponent::count_flush_(uint32_t pixels, uint32_t flush_us) {
+#ifdef USE_LVGL_STATS
+  if (flush_us == 0)
+    return;
+  this->stats_.flush_us += flush_us;
+  this->stats_.dirty_pixels += pixels;
+  this->stats_.flushes++;
+#endif
 }
 
 void LvglComponent::flush_cb_(lv_display_t *disp_drv, const lv_area_t *area, uint8_t *color_p) {
-  if (!this->is_paused()) {
-    auto now = millis();
-    this->draw_buffer_(area, reinterpret_cast<lv_color_data *>(color_p));
-    ESP_LOGV(TAG, "flush_cb, area=%d/%d, %d/%d took %dms", area->x1, area->y1, lv_area_get_width(area),
-             lv_area_get_height(area), (int) (millis() - now));
+#ifdef USE_LVGL_STATS
+  uint32_t start_us = micros();
+#endif
+#ifdef USE_ESP32
+  // When double buffered, hand the area to the flush task so LVGL can render into the other buffer meanwhile.
+  if (this->flush_queue_ != nullptr) {
+    this->collect_flushes_(false);
+    FlushRequest request{disp_drv, *area, color_p};
+    xQueueSend(this->flush_queue_, &request, portMAX_DELAY);
+    this->flushes_pending_++;
+#ifdef USE_LVGL_STATS
+    this->frame_flush_us_ += micros() - start_us;
+#endif
+    return;
   }
+#endif
+  this->count_flush_(lv_area_get_size(area), this->flush_area_(area, color_p));
+#ifdef USE_LVGL_STATS
+  this->frame_flush_us_ += micros() - start_us;
+#endif
   lv_disp_flush_ready(disp_drv);
 }
 
+#ifdef USE_ESP32
+void LvglComponent::flush_task(void *arg) {
+  auto *comp = static_cast<LvglComponent *>(arg);
+  FlushRequest request;
+  for (;;) {
+    if (xQueueReceive(comp->flush_queue_, &request, portMAX_DELAY) == pdTRUE) {
+      FlushResult result{(uint32_t) lv_area_get_size(&request.area), comp->flush_area_(&request.area, request.color_p)};
+      // Report before releasing the buffer, so the result is queued by the time LVGL flushes again
+      xQueueSend(comp->flush_done_queue_, &result, portMAX_DELAY);
+      lv_display_flush_ready(request.disp);
+    }
+  }
+}
+
+/**
+ * Take the results of finished flushes on the loop task. With wait set, block until none are in flight, so the
+ * flush task never writes to a display, or its bus, while other components run.
+ */
+void LvglComponent::collect_flushes_(bool wait) {
+  FlushResult result;
+  while (this->flushes_pending_ != 0 &&
+         xQueueReceive(this->flush_done_queue_, &result, wait ? portMAX_DELAY : 0) == pdTRUE) {
+    this->flushes_pending_--;
+    this->count_flush_(result.pixels, result.flush_us);
+  }
+}
+#endif
+
 IdleTrigger::IdleTrigger(LvglComponent *parent, TemplatableValue<uint32_t> timeout) : timeout_(std::move(timeout)) {
   parent->add_on_idle_callback([this](uint32_t idle_time) {
     if (!this->is_idle_ && idle_time > this->timeout_.value()) {
@@ -465,6 +830,15 @@ void LvKeyboardType::set_obj(lv_obj_t *lv_obj) {
 }
 #endif  // USE_LVGL_KEYBOARD
 
+void LvglComponent::draw_start_() {
+#ifdef USE_LVGL_STATS
+  this->frame_start_us_ = micros();
+  this->frame_flush_us_ = 0;
+#endif
+  if (this->draw_start_callback_ != nullptr)
+    this->draw_start_callback_->trigger();
+}
+
 void LvglComponent::draw_end_() {
   if (this->draw_end_callback_ != nullptr)
     this->draw_end_callback_->trigger();
@@ -557,15 +931,12 @@ void LvglComponent::setup() {
   if (frac == 0)
     frac = 1;
   auto buf_bytes = width * height / frac * LV_COLOR_DEPTH / 8;
-  void *buffer = nullptr;
-  // CRITICAL: Always use lv_malloc_core() which guarantees 64-byte alignment
-  // Don't use malloc() as it may not be aligned correctly for LVGL 9.4
-  buffer = lv_malloc_core(buf_bytes);  // NOLINT
+  void *buffer = this->allocate_draw_buffers_(buf_bytes);
   // if specific buffer size not set and can't get 100%, try for a smaller one
   if (buffer == nullptr && this->buffer_frac_ == 0) {
     frac = MIN_BUFFER_FRAC;
     buf_bytes /= MIN_BUFFER_FRAC;
-    buffer = lv_malloc_core(buf_bytes);  // NOLINT
+    buffer = this->allocate_draw_buffers_(buf_bytes);
   }
   this->buffer_frac_ = frac;
   if (buffer == nullptr) {
@@ -586,19 +957,38 @@ void LvglComponent::setup() {
   this->buf_bytes_ = buf_bytes;
   this->rotation = display->get_rotation();
   if (this->rotation != display::DISPLAY_ROTATION_0_DEGREES) {
-    this->rotate_buf_ = static_cast<lv_color_t *>(lv_malloc_core(buf_bytes));  // NOLINT
+    // Round up so the PPA can write whole cache lines into the rotation buffer
+    this->rotate_buf_ = static_cast<lv_color_t *>(lv_malloc_core(LV_ALIGN_UP(buf_bytes, 64)));  // NOLINT
     if (this->rotate_buf_ == nullptr) {
       this->status_set_error(LOG_STR("Memory allocation failure"));
       this->mark_failed();
       return;
     }
+#if defined(USE_LVGL_PPA) && LV_COLOR_DEPTH == 16
+    ppa_client_config_t ppa_config{};
+    ppa_config.oper_type = PPA_OPERATION_SRM;
+    ppa_config.max_pending_trans_num = 1;
+    if (ppa_register_client(&ppa_config, &this->ppa_srm_client_) != ESP_OK) {
+      ESP_LOGW(TAG, "Could not register PPA client, rotating in software");
+      this->ppa_srm_client_ = nullptr;
+    }
+#endif
   }
-  if (this->draw_start_callback_ != nullptr) {
+#ifdef USE_LVGL_STATS
+  const bool stats = true;
+#else
+  const bool stats = false;
+#endif
+  if (this->draw_start_callback_ != nullptr || stats) {
     lv_display_add_event_cb(this->disp_, render_start_cb, LV_EVENT_RENDER_START, this);
   }
-  if (this->draw_end_callback_ != nullptr || this->update_when_display_idle_) {
+  if (this->draw_end_callback_ != nullptr || this->update_when_display_idle_ || stats) {
     lv_display_add_event_cb(this->disp_, render_end_cb, LV_EVENT_REFR_READY, this);
   }
+#ifdef USE_LVGL_STATS
+  lv_display_add_event_cb(this->disp_, flush_wait_cb, LV_EVENT_FLUSH_WAIT_START, this);
+  lv_display_add_event_cb(this->disp_, flush_wait_cb, LV_EVENT_FLUSH_WAIT_FINISH, this);
+#endif
 #if LV_USE_LOG
   lv_log_register_print_cb([](lv_log_level_t level, const char *buf) {
     auto next = strchr(buf, ')');
@@ -619,11 +1009,138 @@ void LvglComponent::setup() {
 
   // CRITICAL: Configure buffers at the VERY END of setup()
   // This avoids deadlock while ensuring buffers are ready before any callbacks execute
-  lv_display_set_buffers(this->disp_, this->draw_buf_, nullptr, this->buf_bytes_,
+#ifdef USE_ESP32
+  if (this->draw_buf2_ != nullptr) {
+    this->flush_queue_ = xQueueCreate(1, sizeof(FlushRequest));
+    this->flush_done_queue_ = xQueueCreate(2, sizeof(FlushResult));
+    if (this->flush_queue_ == nullptr || this->flush_done_queue_ == nullptr ||
+        xTaskCreate(flush_task, "lvgl_flush", FLUSH_TASK_STACK_SIZE, this, FLUSH_TASK_PRIORITY, nullptr) != pdPASS) {
+      ESP_LOGW(TAG, "Could not start flush task, flushing synchronously");
+      if (this->flush_queue_ != nullptr)
+        vQueueDelete(this->flush_queue_);
+      if (this->flush_done_queue_ != nullptr)
+        vQueueDelete(this->flush_done_queue_);
+      this->flush_queue_ = nullptr;
+      this->flush_done_queue_ = nullptr;
+    }
+  }
+#endif
+  lv_display_set_buffers(this->disp_, this->draw_buf_, this->draw_buf2_, this->buf_bytes_,
                          this->full_refresh_ ? LV_DISPLAY_RENDER_MODE_FULL : LV_DISPLAY_RENDER_MODE_PARTIAL);
   this->buffers_configured_ = true;
 }
 
+/**
+ * Allocate the draw buffer, and a second one if double buffering is enabled.
+ * Double buffers go to internal DMA-capable RAM if both fit there with headroom to spare, otherwise
+ * to the default LVGL heap (PSRAM first). Failing to get a second buffer falls back to single buffering.
+ * @return The first buffer, or nullptr if it could not be allocated.
+ */
+void *LvglComponent::allocate_draw_buffers_(size_t buf_bytes) {
+  void *buffer = nullptr;
+  this->draw_buf2_ = nullptr;
+#ifdef USE_ESP32
+  const uint32_t internal_caps = MALLOC_CAP_INTERNAL | MALLOC_CAP_DMA | MALLOC_CAP_8BIT;
+  if (this->double_buffer_ && heap_caps_get_free_size(internal_caps) >= 2 * buf_bytes + INTERNAL_RAM_RESERVE &&
+      heap_caps_get_largest_free_block(internal_caps) >= buf_bytes) {
+    buffer = heap_caps_aligned_alloc(64, buf_bytes, internal_caps);
+    void *buffer2 = heap_caps_aligned_alloc(64, buf_bytes, internal_caps);
+    if (buffer != nullptr && buffer2 != nullptr) {
+      this->draw_buf2_ = static_cast<uint8_t *>(buffer2);
+      return buffer;
+    }
+    heap_caps_free(buffer);
+    heap_caps_free(buffer2);
+    buffer = nullptr;
+  }
+#endif
+  // CRITICAL: Always use lv_malloc_core() which guarantees 64-byte alignment
+  // Don't use malloc() as it may not be aligned correctly for LVGL 9.4
+  buffer = lv_malloc_core(buf_bytes);  // NOLINT
+  if (buffer != nullptr && this->double_buffer_) {
+    this->draw_buf2_ = static_cast<uint8_t *>(lv_malloc_core(buf_bytes));  // NOLINT
+    if (this->draw_buf2_ == nullptr)
+      ESP_LOGW(TAG, "Could not allocate second draw buffer, using a single buffer");
+  }
+  return buffer;
+}
+
+#ifdef USE_LVGL_STATS
+void LvglStats::dump_config() {
+  ESP_LOGCONFIG(TAG, "LVGL Stats:");
+  LOG_UPDATE_INTERVAL(this);
+  LOG_SENSOR("  ", "FPS", this->fps_sensor_);
+  LOG_SENSOR("  ", "Render time", this->render_time_sensor_);
+  LOG_SENSOR("  ", "Flush time", this->flush_time_sensor_);
+  LOG_SENSOR("  ", "Dirty pixels", this->dirty_pixels_sensor_);
+  LOG_SENSOR("  ", "Flushes", this->flushes_sensor_);
+  LOG_SENSOR("  ", "Merged areas", this->merged_areas_sensor_);
+  LOG_SENSOR("  ", "Heap used", this->heap_used_sensor_);
+  LOG_SENSOR("  ", "Heap free", this->heap_free_sensor_);
+  LOG_SENSOR("  ", "Heap fragmentation", this->heap_fragmentation_sensor_);
+  LOG_SENSOR("  ", "Small allocations", this->small_allocations_sensor_);
+  LOG_SENSOR("  ", "Large allocations", this->large_allocations_sensor_);
+  LOG_SENSOR("  ", "Internal blocks", this->internal_blocks_sensor_);
+  LOG_SENSOR("  ", "PSRAM blocks", this->psram_blocks_sensor_);
+  LOG_SENSOR("  ", "Pool blocks", this->pool_blocks_sensor_);
+}
+
+/**
+ * Publish averages over the window since the last update. Times, dirty pixels, flushes and merged areas are
+ * per frame.
+ */
+void LvglStats::update() {
+  auto now = millis();
+  auto elapsed = now - this->last_update_;
+  this->last_update_ = now;
+  auto stats = this->parent_->take_stats();
+  // The first window starts at boot, so skip it rather than report a skewed rate
+  if (elapsed == now)
+    return;
+  float frames = stats.frames;
+  if (this->fps_sensor_ != nullptr && elapsed != 0)
+    this->fps_sensor_->publish_state(frames * 1000.0f / elapsed);
+  if (stats.frames != 0) {
+    if (this->render_time_sensor_ != nullptr)
+      this->render_time_sensor_->publish_state(stats.render_us / frames / 1000.0f);
+    if (this->flush_time_sensor_ != nullptr)
+      this->flush_time_sensor_->publish_state(stats.flush_us / frames / 1000.0f);
+    if (this->dirty_pixels_sensor_ != nullptr)
+      this->dirty_pixels_sensor_->publish_state(stats.dirty_pixels / frames);
+    if (this->flushes_sensor_ != nullptr)
+      this->flushes_sensor_->publish_state(stats.flushes / frames);
+    if (this->merged_areas_sensor_ != nullptr)
+      this->merged_areas_sensor_->publish_state(stats.merged_areas / frames);
+  }
+  if (this->heap_used_sensor_ != nullptr || this->heap_free_sensor_ != nullptr ||
+      this->heap_fragmentation_sensor_ != nullptr) {
+    lv_mem_monitor_t mon;
+    lv_mem_monitor(&mon);
+    if (this->heap_used_sensor_ != nullptr)
+      this->heap_used_sensor_->publish_state(mon.total_size - mon.free_size);
+    if (this->heap_free_sensor_ != nullptr)
+      this->heap_free_sensor_->publish_state(mon.free_size);
+    if (this->heap_fragmentation_sensor_ != nullptr)
+      this->heap_fragmentation_sensor_->publish_state(mon.frag_pct);
+  }
+#ifdef USE_LVGL_MEM_COUNTERS
+  LvglMemCounters counters = mem_counters;
+  if (this->small_allocations_sensor_ != nullptr)
+    this->small_allocations_sensor_->publish_state(counters.small_allocs - this->last_small_allocs_);
+  if (this->large_allocations_sensor_ != nullptr)
+    this->large_allocations_sensor_->publish_state(counters.large_allocs - this->last_large_allocs_);
+  if (this->internal_blocks_sensor_ != nullptr)
+    this->internal_blocks_sensor_->publish_state(counters.internal_blocks);
+  if (this->psram_blocks_sensor_ != nullptr)
+    this->psram_blocks_sensor_->publish_state(counters.psram_blocks);
+  if (this->pool_blocks_sensor_ != nullptr)
+    this->pool_blocks_sensor_->publish_state(counters.pool_blocks);
+  this->last_small_allocs_ = counters.small_allocs;
+  this->last_large_allocs_ = counters.large_allocs;
+#endif  // USE_LVGL_MEM_COUNTERS
+}
+#endif  // USE_LVGL_STATS
+
 void LvglComponent::update() {
   // update indicators
   if (this->is_paused()) {
@@ -645,6 +1162,11 @@ void LvglComponent::loop() {
   } else {
     lv_timer_handler();
   }
+#ifdef USE_ESP32
+  // Flushes overlap rendering only within lv_timer_handler(); finish them before other components use the bus
+  if (this->flush_queue_ != nullptr)
+    this->collect_flushes_(true);
+#endif
 }
 
 #ifdef USE_LVGL_ANIMIMG
@@ -753,6 +1275,33 @@ lv_obj_t *lv_container_create(lv_obj_t *parent) {
   return obj;
 }
 
+#ifdef USE_LVGL_WIDGET_TABLE
+/**
+ * Create widgets from a descriptor table. Parents precede their children, and the styles of each widget
+ * follow those of the previous one in the style table. Anything not in the table is set up afterwards by
+ * generated code.
+ */
+void lv_build_widgets(const LvWidgetDesc *widgets, size_t count, const LvStyleRef *styles, lv_obj_t *root) {
+  for (size_t i = 0; i != count; i++) {
+    const LvWidgetDesc &desc = widgets[i];
+    lv_obj_t *parent = desc.parent < 0 ? root : *widgets[desc.parent].obj;
+    lv_obj_t *obj = desc.create(parent);
+    *desc.obj = obj;
+    for (size_t j = 0; j != desc.style_count; j++, styles++)
+      lv_obj_add_style(obj, *styles->style, styles->selector);
+    if (desc.add_flags != 0)
+      lv_obj_add_flag(obj, (lv_obj_flag_t) desc.add_flags);
+    if (desc.clear_flags != 0)
+      lv_obj_remove_flag(obj, (lv_obj_flag_t) desc.clear_flags);
+#if LV_USE_LABEL
+    // Copied rather than set static, since a label may write dots into its text
+    if (desc.text != nullptr)
+      lv_label_set_text(obj, desc.text);
+#endif
+  }
+}
+#endif  // USE_LVGL_WIDGET_TABLE
+
 }  // namespace esphome::lvgl
 
 lv_result_t lv_mem_test_core() { return LV_RESULT_OK; }
@@ -825,9 +1374,41 @@ void *lv_realloc_core(void *ptr, size_t size) {
 void lv_mem_monitor_core(lv_mem_monitor_t *mon_p) { memset(mon_p, 0, sizeof(lv_mem_monitor_t)); }
 
 #endif
+#ifdef USE_LVGL_MEM_COUNTERS
+esphome::lvgl::LvglMemCounters esphome::lvgl::mem_counters{};  // NOLINT
+#endif
+
 #ifdef USE_ESP32
 static unsigned cap_bits = MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT;  // NOLINT
 
+// Requests up to this size are placed in internal RAM, larger ones in PSRAM. Keeping small, frequently
+// created object structs out of the heap used for draw and canvas buffers stops them fragmenting it.
+// 0 places everything in PSRAM first.
+#ifndef LVGL_MEM_SMALL_SIZE
+#define LVGL_MEM_SMALL_SIZE 0
+#endif
+// Internal RAM left to the rest of the system; small requests go to PSRAM once free memory drops below it
+#ifndef LVGL_MEM_INTERNAL_RESERVE
+#define LVGL_MEM_INTERNAL_RESERVE (32 * 1024)
+#endif
+
+static constexpr unsigned INTERNAL_CAPS = MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT;
+
+#ifdef USE_LVGL_MEM_COUNTERS
+static void count_block(void *ptr, int32_t delta) {
+  if (esp_ptr_external_ram(ptr)) {
+    esphome::lvgl::mem_counters.psram_blocks += delta;
+  } else {
+    esphome::lvgl::mem_counters.internal_blocks += delta;
+  }
+}
+#endif
+
+#ifdef LVGL_MEM_POOL_SIZE
+// Uses cap_bits, INTERNAL_CAPS and LVGL_MEM_INTERNAL_RESERVE from above
+#include "lvgl_mem_pool.h"
+#endif  // LVGL_MEM_POOL_SIZE
+
 void lv_mem_monitor_core(lv_mem_monitor_t *mon_p) {
   multi_heap_info_t heap_info;
   heap_caps_get_info(&heap_info, cap_bits);
@@ -838,7 +1419,8 @@ void lv_mem_monitor_core(lv_mem_monitor_t *mon_p) {
   mon_p->used_cnt = heap_info.allocated_blocks;
   mon_p->free_cnt = heap_info.free_blocks;
   mon_p->used_pct = heap_info.allocated_blocks * 100 / (heap_info.allocated_blocks + heap_info.free_blocks);
-  mon_p->frag_pct = 0;
+  mon_p->frag_pct =
+      heap_info.total_free_bytes == 0 ? 0 : 100 - heap_info.largest_free_block * 100 / heap_info.total_free_bytes;
 }
 
 void *lv_malloc_core(size_t size) {
@@ -848,6 +1430,44 @@ void *lv_malloc_core(size_t size) {
   // internal stack/static buffers, but heap allocations use 64-byte alignment.
   constexpr size_t LVGL_ALIGNMENT = 64;
 
+#ifdef LVGL_MEM_POOL_SIZE
+  // Requests of pool size are never draw buffers; when the pool is full they take the heap paths below
+  if ((ptr = pool_alloc(size)) != nullptr) {
+#ifdef USE_LVGL_MEM_COUNTERS
+    esphome::lvgl::mem_counters.small_allocs++;
+    esphome::lvgl::mem_counters.pool_blocks++;
+#endif
+    return ptr;
+  }
+#endif
+
+  if (LVGL_MEM_SMALL_SIZE != 0 && size <= LVGL_MEM_SMALL_SIZE) {
+#ifdef USE_LVGL_MEM_COUNTERS
+    esphome::lvgl::mem_counters.small_allocs++;
+#endif
+    // Small blocks are never draw buffers, so the heap's natural alignment is enough
+    ptr = nullptr;
+    if (heap_caps_get_free_size(INTERNAL_CAPS) >= size + LVGL_MEM_INTERNAL_RESERVE)
+      ptr = heap_caps_malloc(size, INTERNAL_CAPS);
+    if (ptr == nullptr) {
+      ptr = heap_caps_aligned_alloc(LVGL_ALIGNMENT, size, cap_bits);
+#ifdef USE_LVGL_MEM_COUNTERS
+      esphome::lvgl::mem_counters.fallbacks++;
+#endif
+    }
+    if (ptr == nullptr) {
+      ESP_LOGE(esphome::lvgl::TAG, "Failed to allocate %zu bytes", size);
+      return nullptr;
+    }
+#ifdef USE_LVGL_MEM_COUNTERS
+    count_block(ptr, 1);
+#endif
+    return ptr;
+  }
+#ifdef USE_LVGL_MEM_COUNTERS
+  esphome::lvgl::mem_counters.large_allocs++;
+#endif
+
   // BUGFIX: Don't modify global cap_bits - use local variable
   unsigned caps = cap_bits;
 
@@ -857,12 +1477,18 @@ void *lv_malloc_core(size_t size) {
     // Fallback to internal RAM if PSRAM allocation fails
     caps = MALLOC_CAP_8BIT;
     ptr = heap_caps_aligned_alloc(LVGL_ALIGNMENT, size, caps);
+#ifdef USE_LVGL_MEM_COUNTERS
+    esphome::lvgl::mem_counters.fallbacks++;
+#endif
   }
 
   if (ptr == nullptr) {
     ESP_LOGE(esphome::lvgl::TAG, "Failed to allocate %zu bytes (64-byte aligned)", size);
     return nullptr;
   }
+#ifdef USE_LVGL_MEM_COUNTERS
+  count_block(ptr, 1);
+#endif
 
   // Log only very large buffers (>1MB) for debugging
   if (size > 1000000) {
@@ -876,6 +1502,18 @@ void lv_free_core(void *ptr) {
   ESP_LOGV(esphome::lvgl::TAG, "free %p", ptr);
   if (ptr == nullptr)
     return;
+#ifdef LVGL_MEM_POOL_SIZE
+  if (pool_owns(ptr)) {
+#ifdef USE_LVGL_MEM_COUNTERS
+    esphome::lvgl::mem_counters.pool_blocks--;
+#endif
+    pool_free(ptr);
+    return;
+  }
+#endif
+#ifdef USE_LVGL_MEM_COUNTERS
+  count_block(ptr, -1);
+#endif
   heap_caps_free(ptr);
 }
 
@@ -889,14 +1527,26 @@ void *lv_realloc_core(void *ptr, size_t size) {
     return nullptr;
   }
 
+  size_t old_size;
+#ifdef LVGL_MEM_POOL_SIZE
+  if (pool_owns(ptr)) {
+    // The class size is known, so a block that still fits stays where it is
+    old_size = pool_block_size(ptr);
+    if (size <= old_size)
+      return ptr;
+  } else
+#endif
+  {
+    old_size = heap_caps_get_allocated_size(ptr);
+  }
+
   // CRITICAL: heap_caps_realloc does NOT preserve 64-byte alignment!
   // We must allocate a new aligned buffer and copy the data
   void *new_ptr = lv_malloc_core(size);
   if (new_ptr == nullptr)
     return nullptr;
 
-  // Copy data to new buffer (we don't know old size, copy 'size' bytes)
-  memcpy(new_ptr, ptr, size);
+  memcpy(new_ptr, ptr, std::min(old_size, size));
   lv_free_core(ptr);
 
   return new_ptr;
@@ -20,6 +20,17 @@
 #include "esphome/components/display/display_color_utils.h"
 #include "esphome/core/component.h"
 
+#ifdef USE_ESP32
+#include <freertos/FreeRTOS.h>
+#include <freertos/queue.h>
+#endif  // USE_ESP32
+#ifdef USE_LVGL_PPA
+#include <driver/ppa.h>
+#endif  // USE_LVGL_PPA
+#ifdef USE_LVGL_STATS
+#include "esphome/components/sensor/sensor.h"
+#endif  // USE_LVGL_STATS
+
 #include <list>
 #include <lvgl.h>
 #include <map>
@@ -111,6 +122,15 @@ class LvCompound {
 
 class LvglComponent;
 
+// Widget values kept while a lazy page is unloaded
+struct LvWidgetState {
+  lv_obj_t **var;
+  lv_state_t state;
+  int32_t value;
+  std::string text;
+  bool saved;
+};
+
 class LvPageType : public Parented<LvglComponent> {
  public:
   LvPageType(bool skip) : skip(skip) {}
@@ -122,9 +142,29 @@ class LvPageType : public Parented<LvglComponent> {
 
   bool is_showing() const;
 
+  /**
+   * Make the page lazy: its widgets are created by the builder when it is first shown and, if unload is set,
+   * deleted again once another page has replaced it.
+   */
+  void set_builder(std::function<void()> &&builder, bool unload);
+  // Add code binding triggers or entities to the page's widgets, run each time they are created
+  void add_binder(std::function<void()> &&binder);
+  // Add a widget variable to be cleared when the page unloads, keeping the widget's value
+  void add_widget(lv_obj_t **var) { this->widgets_.push_back({var}); }
+  bool is_built() const { return this->builder_ == nullptr || this->built_; }
+  void build();
+  void unload();
+
   lv_obj_t *obj{};
   size_t index{};
   bool skip;
+
+ protected:
+  std::function<void()> builder_{};
+  std::vector<std::function<void()>> binders_{};
+  std::vector<LvWidgetState> widgets_{};
+  bool unload_{};
+  bool built_{};
 };
 
 using LvLambdaType = std::function<void(lv_obj_t *)>;
@@ -145,6 +185,53 @@ template<typename... Ts> class ObjUpdateAction : public Action<Ts...> {
 void lv_animimg_stop(lv_obj_t *obj);
 #endif  // USE_LVGL_ANIMIMG
 
+#ifdef USE_LVGL_WIDGET_TABLE
+// A style added to a widget built from a descriptor table
+struct LvStyleRef {
+  lv_style_t *const *style;  // variable holding the style, set before the table is built
+  lv_style_selector_t selector;
+};
+
+// The static part of a widget, built by lv_build_widgets()
+struct LvWidgetDesc {
+  lv_obj_t **obj;                         // variable receiving the widget
+  lv_obj_t *(*create)(lv_obj_t *parent);  // LVGL creation function
+  int16_t parent;                         // index of the parent in the table, or -1 for the root
+  uint16_t style_count;                   // entries taken from the style table
+  uint32_t add_flags;
+  uint32_t clear_flags;
+  const char *text;  // static label text, or nullptr
+};
+
+void lv_build_widgets(const LvWidgetDesc *widgets, size_t count, const LvStyleRef *styles, lv_obj_t *root);
+#endif  // USE_LVGL_WIDGET_TABLE
+
+#ifdef USE_LVGL_STATS
+// Rendering counters accumulated since the last reset
+struct LvglFrameStats {
+  uint32_t frames{};
+  uint32_t render_us{};
+  uint32_t flush_us{};
+  uint32_t dirty_pixels{};
+  uint32_t flushes{};
+  uint32_t merged_areas{};
+};
+#endif  // USE_LVGL_STATS
+
+#ifdef USE_LVGL_MEM_COUNTERS
+// Counts kept by lv_malloc_core(), for tuning small_alloc_size. Updated without locking, so approximate
+// when draw threads allocate concurrently.
+struct LvglMemCounters {
+  uint32_t small_allocs;  // requests up to small_alloc_size
+  uint32_t large_allocs;
+  uint32_t fallbacks;     // served from the other heap
+  int32_t internal_blocks;  // live blocks per heap
+  int32_t psram_blocks;
+  int32_t pool_blocks;  // live blocks in the small object pool
+};
+extern LvglMemCounters mem_counters;  // NOLINT
+#endif  // USE_LVGL_MEM_COUNTERS
+
 class LvglComponent : public PollingComponent {
   constexpr static const char *const TAG = "lvgl";
 
@@ -163,6 +250,9 @@ class LvglComponent : public PollingComponent {
 
   static void render_end_cb(lv_event_t *event);
   static void render_start_cb(lv_event_t *event);
+#ifdef USE_LVGL_STATS
+  static void flush_wait_cb(lv_event_t *event);
+#endif
   void dump_config() override;
   lv_disp_t *get_disp() { return this->disp_; }
   lv_obj_t *get_screen_active() { return lv_display_get_screen_active(this->disp_); }
@@ -195,6 +285,15 @@ class LvglComponent : public PollingComponent {
   void show_prev_page(lv_scr_load_anim_t anim, uint32_t time);
   void set_page_wrap(bool wrap) { this->page_wrap_ = wrap; }
   void set_big_endian(bool big_endian) { this->big_endian_ = big_endian; }
+  // Render into two draw buffers so that flushing one overlaps with rendering into the other.
+  void set_double_buffer(bool double_buffer) { this->double_buffer_ = double_buffer; }
+  // Merge dirty areas within merge_distance pixels of each other, and redraw the whole screen once they
+  // cover more than full_refresh_threshold percent of it.
+  void set_invalidation_policy(uint16_t merge_distance, uint8_t full_refresh_threshold) {
+    this->merge_distance_ = merge_distance;
+    this->full_refresh_threshold_ = full_refresh_threshold;
+  }
+  void apply_invalidation_policy(lv_area_t *area);
   size_t get_current_page() const;
   void set_focus_mark(lv_group_t *group) { this->focus_marks_[group] = lv_group_get_focused(group); }
   void restore_focus_mark(lv_group_t *group) {
@@ -213,16 +312,49 @@ class LvglComponent : public PollingComponent {
   void set_draw_end_trigger(Trigger<> *trigger) { this->draw_end_callback_ = trigger; }
   // Check if loop() has started - safe to perform LVGL operations
   bool is_loop_started() const { return this->loop_started_; }
+#ifdef USE_LVGL_STATS
+  // Return the counters gathered since the previous call and start a new window
+  LvglFrameStats take_stats() {
+    LvglFrameStats stats = this->stats_;
+    this->stats_ = {};
+    return stats;
+  }
+#endif  // USE_LVGL_STATS
 
  protected:
   void draw_end_();
-  // Not checking for non-null callback since the
-  // LVGL callback that calls it is not set in that case
-  void draw_start_() const { this->draw_start_callback_->trigger(); }
+  void draw_start_();
 
   void write_random_();
-  void draw_buffer_(const lv_area_t *area, lv_color_data *ptr);
+  uint32_t draw_buffer_(const lv_area_t *area, lv_color_data *ptr);
+  void rotate_area_(const lv_color_data *src, lv_color_data *dst, lv_coord_t width, lv_coord_t height,
+                    lv_coord_t dst_stride);
+#ifdef USE_LVGL_PPA
+  bool rotate_ppa_(const lv_color_data *src, lv_color_data *dst, lv_coord_t width, lv_coord_t height,
+                   lv_coord_t dst_stride);
+  ppa_client_handle_t ppa_srm_client_{};
+#endif  // USE_LVGL_PPA
   void flush_cb_(lv_display_t *disp_drv, const lv_area_t *area, uint8_t *color_p);
+  uint32_t flush_area_(const lv_area_t *area, uint8_t *color_p);
+  void count_flush_(uint32_t pixels, uint32_t flush_us);
+  void *allocate_draw_buffers_(size_t buf_bytes);
+#ifdef USE_ESP32
+  struct FlushRequest {
+    lv_display_t *disp;
+    lv_area_t area;
+    uint8_t *color_p;
+  };
+  // Returned by the flush task for each request, so only the loop task updates the statistics
+  struct FlushResult {
+    uint32_t pixels;
+    uint32_t flush_us;
+  };
+  static void flush_task(void *arg);
+  void collect_flushes_(bool wait);
+  QueueHandle_t flush_queue_{};
+  QueueHandle_t flush_done_queue_{};
+  size_t flushes_pending_{};
+#endif  // USE_ESP32
 
   std::vector<display::Display *> displays_{};
   size_t buffer_frac_{1};
@@ -231,10 +363,15 @@ class LvglComponent : public PollingComponent {
   bool update_when_display_idle_{};
 
   uint8_t *draw_buf_{};
+  uint8_t *draw_buf2_{};
+  bool double_buffer_{};
+  uint16_t merge_distance_{};
+  uint8_t full_refresh_threshold_{100};
   lv_display_t *disp_{};
   uint16_t width_{};
   uint16_t height_{};
   bool paused_{};
+  uint32_t first_frame_ms_{};
   std::vector<LvPageType *> pages_{};
   size_t current_page_{0};
   bool show_snow_{};
@@ -251,7 +388,56 @@ class LvglComponent : public PollingComponent {
   bool buffers_configured_{false};  // Track if lv_display_set_buffers() has been called
   size_t buf_bytes_{0};              // Store buffer size for delayed configuration
   bool loop_started_{false};         // Track if loop() has been called - safe for LVGL ops
+#ifdef USE_LVGL_STATS
+  LvglFrameStats stats_{};
+  uint32_t frame_start_us_{};
+  uint32_t frame_flush_us_{};       // flush and flush wait time within the current frame
+  uint32_t flush_wait_start_us_{};
+#endif  // USE_LVGL_STATS
+};
+
+#ifdef USE_LVGL_STATS
+class LvglStats : public PollingComponent, public Parented<LvglComponent> {
+ public:
+  void update() override;
+  void dump_config() override;
+  void set_fps_sensor(sensor::Sensor *sensor) { this->fps_sensor_ = sensor; }
+  void set_render_time_sensor(sensor::Sensor *sensor) { this->render_time_sensor_ = sensor; }
+  void set_flush_time_sensor(sensor::Sensor *sensor) { this->flush_time_sensor_ = sensor; }
+  void set_dirty_pixels_sensor(sensor::Sensor *sensor) { this->dirty_pixels_sensor_ = sensor; }
+  void set_flushes_sensor(sensor::Sensor *sensor) { this->flushes_sensor_ = sensor; }
+  void set_merged_areas_sensor(sensor::Sensor *sensor) { this->merged_areas_sensor_ = sensor; }
+  void set_heap_used_sensor(sensor::Sensor *sensor) { this->heap_used_sensor_ = sensor; }
+  void set_heap_free_sensor(sensor::Sensor *sensor) { this->heap_free_sensor_ = sensor; }
+  void set_heap_fragmentation_sensor(sensor::Sensor *sensor) { this->heap_fragmentation_sensor_ = sensor; }
+  void set_small_allocations_sensor(sensor::Sensor *sensor) { this->small_allocations_sensor_ = sensor; }
+  void set_large_allocations_sensor(sensor::Sensor *sensor) { this->large_allocations_sensor_ = sensor; }
+  void set_internal_blocks_sensor(sensor::Sensor *sensor) { this->internal_blocks_sensor_ = sensor; }
+  void set_psram_blocks_sensor(sensor::Sensor *sensor) { this->psram_blocks_sensor_ = sensor; }
+  void set_pool_blocks_sensor(sensor::Sensor *sensor) { this->pool_blocks_sensor_ = sensor; }
+
+ protected:
+  uint32_t last_update_{};
+  sensor::Sensor *fps_sensor_{};
+  sensor::Sensor *render_time_sensor_{};
+  sensor::Sensor *flush_time_sensor_{};
+  sensor::Sensor *dirty_pixels_sensor_{};
+  sensor::Sensor *flushes_sensor_{};
+  sensor::Sensor *merged_areas_sensor_{};
+  sensor::Sensor *heap_used_sensor_{};
+  sensor::Sensor *heap_free_sensor_{};
+  sensor::Sensor *heap_fragmentation_sensor_{};
+  sensor::Sensor *small_allocations_sensor_{};
+  sensor::Sensor *large_allocations_sensor_{};
+  sensor::Sensor *internal_blocks_sensor_{};
+  sensor::Sensor *psram_blocks_sensor_{};
+  sensor::Sensor *pool_blocks_sensor_{};
+#ifdef USE_LVGL_MEM_COUNTERS
+  uint32_t last_small_allocs_{};
+  uint32_t last_large_allocs_{};
+#endif
 };
+#endif  // USE_LVGL_STATS
 
 class IdleTrigger : public Trigger<> {
  public:
@@ -0,0 +1,151 @@
+#pragma once
+
+/**
+ * Small object pool for lv_malloc_core() on ESP32, enabled by LVGL_MEM_POOL_SIZE.
+ *
+ * Only included by the allocator section of lvgl_esphome.cpp, which provides cap_bits, INTERNAL_CAPS,
+ * LVGL_MEM_INTERNAL_RESERVE, the heap_caps_* functions and the FreeRTOS critical section macros.
+ * tools/alloc_bench.cpp provides host versions of those to replay allocation traces against this code.
+ */
+
+// Small object pool: a fixed arena of pages, each carved into equal blocks of one size class. Styles, event
+// descriptors and draw tasks come from per-page free lists with 8-byte alignment, instead of each paying
+// for 64-byte alignment and a heap header. A page goes back to the arena when its last block is freed, so
+// a size class does not keep memory after the objects using it are deleted.
+static constexpr size_t POOL_PAGE_SIZE = 4096;
+static constexpr uint16_t POOL_CLASSES[] = {16, 24, 32, 48, 64, 96, 128, 192, 256};
+static constexpr size_t POOL_CLASS_COUNT = sizeof(POOL_CLASSES) / sizeof(POOL_CLASSES[0]);
+static constexpr size_t POOL_MAX_SIZE = POOL_CLASSES[POOL_CLASS_COUNT - 1];
+
+struct PoolPage {
+  PoolPage *prev;  // neighbours in the class's partial list, or the arena's free page list
+  PoolPage *next;
+  void *free_list;
+  uint16_t used;
+  uint8_t size_class;
+};
+
+struct MemPool {
+  uint8_t *arena;
+  size_t page_count;
+  PoolPage *pages;
+  PoolPage *free_pages;
+  PoolPage *partial[POOL_CLASS_COUNT];  // pages of each class with at least one free block
+  bool failed;
+  portMUX_TYPE lock;
+};
+
+static MemPool mem_pool{nullptr, 0, nullptr, nullptr, {}, false, portMUX_INITIALIZER_UNLOCKED};  // NOLINT
+
+static void pool_unlink(PoolPage **head, PoolPage *page) {
+  if (page->prev != nullptr) {
+    page->prev->next = page->next;
+  } else {
+    *head = page->next;
+  }
+  if (page->next != nullptr)
+    page->next->prev = page->prev;
+  page->prev = page->next = nullptr;
+}
+
+static void pool_push(PoolPage **head, PoolPage *page) {
+  page->prev = nullptr;
+  page->next = *head;
+  if (*head != nullptr)
+    (*head)->prev = page;
+  *head = page;
+}
+
+// Reserve the arena on first use, in internal RAM when there is room for it beside the reserve
+static bool pool_init() {
+  if (mem_pool.arena != nullptr)
+    return true;
+  if (mem_pool.failed)
+    return false;
+  size_t page_count = LVGL_MEM_POOL_SIZE / POOL_PAGE_SIZE;
+  size_t size = page_count * POOL_PAGE_SIZE;
+  uint8_t *arena = nullptr;
+  if (heap_caps_get_free_size(INTERNAL_CAPS) >= size + LVGL_MEM_INTERNAL_RESERVE)
+    arena = static_cast<uint8_t *>(heap_caps_aligned_alloc(8, size, INTERNAL_CAPS));
+  if (arena == nullptr)
+    arena = static_cast<uint8_t *>(heap_caps_aligned_alloc(8, size, cap_bits));
+  auto *pages = static_cast<PoolPage *>(heap_caps_calloc(page_count, sizeof(PoolPage), MALLOC_CAP_8BIT));
+  if (page_count == 0 || arena == nullptr || pages == nullptr) {
+    heap_caps_free(arena);
+    heap_caps_free(pages);
+    mem_pool.failed = true;
+    ESP_LOGW(esphome::lvgl::TAG, "Small object pool of %zu bytes could not be allocated", size);
+    return false;
+  }
+  for (size_t i = page_count; i-- != 0;)
+    pool_push(&mem_pool.free_pages, &pages[i]);
+  mem_pool.pages = pages;
+  mem_pool.page_count = page_count;
+  mem_pool.arena = arena;
+  ESP_LOGD(esphome::lvgl::TAG, "Small object pool: %zu pages at %p", page_count, arena);
+  return true;
+}
+
+static inline bool pool_owns(const void *ptr) {
+  auto *addr = static_cast<const uint8_t *>(ptr);
+  return addr >= mem_pool.arena && addr < mem_pool.arena + mem_pool.page_count * POOL_PAGE_SIZE;
+}
+
+static inline PoolPage *pool_page_of(const void *ptr) {
+  return &mem_pool.pages[(static_cast<const uint8_t *>(ptr) - mem_pool.arena) / POOL_PAGE_SIZE];
+}
+
+// Returns nullptr when the request is too large for the pool or the pool is full
+static void *pool_alloc(size_t size) {
+  if (size > POOL_MAX_SIZE || !pool_init())
+    return nullptr;
+  size_t cls = 0;
+  while (POOL_CLASSES[cls] < size)
+    cls++;
+  void *block = nullptr;
+  portENTER_CRITICAL(&mem_pool.lock);
+  PoolPage *page = mem_pool.partial[cls];
+  if (page == nullptr && (page = mem_pool.free_pages) != nullptr) {
+    // Carve a fresh page into blocks of this class
+    pool_unlink(&mem_pool.free_pages, page);
+    uint8_t *base = mem_pool.arena + (page - mem_pool.pages) * POOL_PAGE_SIZE;
+    size_t block_size = POOL_CLASSES[cls];
+    void *list = nullptr;
+    for (size_t offset = POOL_PAGE_SIZE / block_size * block_size; offset != 0;) {
+      offset -= block_size;
+      *static_cast<void **>(static_cast<void *>(base + offset)) = list;
+      list = base + offset;
+    }
+    page->free_list = list;
+    page->used = 0;
+    page->size_class = cls;
+    pool_push(&mem_pool.partial[cls], page);
+  }
+  if (page != nullptr) {
+    block = page->free_list;
+    page->free_list = *static_cast<void **>(block);
+    page->used++;
+    if (page->free_list == nullptr)
+      pool_unlink(&mem_pool.partial[cls], page);
+  }
+  portEXIT_CRITICAL(&mem_pool.lock);
+  return block;
+}
+
+static void pool_free(void *ptr) {
+  PoolPage *page = pool_page_of(ptr);
+  portENTER_CRITICAL(&mem_pool.lock);
+  bool was_full = page->free_list == nullptr;
+  *static_cast<void **>(ptr) = page->free_list;
+  page->free_list = ptr;
+  if (--page->used == 0) {
+    if (!was_full)
+      pool_unlink(&mem_pool.partial[page->size_class], page);
+    pool_push(&mem_pool.free_pages, page);
+  } else if (was_full) {
+    pool_push(&mem_pool.partial[page->size_class], page);
+  }
+  portEXIT_CRITICAL(&mem_pool.lock);
+}
+
+static inline size_t pool_block_size(const void *ptr) { return POOL_CLASSES[pool_page_of(ptr)->size_class]; }
@@ -1,7 +1,7 @@
 import esphome.codegen as cg
 from esphome.components import number
 import esphome.config_validation as cv
-from esphome.const import CONF_RESTORE_VALUE
+from esphome.const import CONF_ID, CONF_RESTORE_VALUE
 from esphome.cpp_generator import MockObj
 
 from ..defines import CONF_ANIMATED, CONF_UPDATE_ON_RELEASE, CONF_WIDGET
@@ -11,12 +11,14 @@ from ..lvcode import (
     EVENT_ARG,
     UPDATE_EVENT,
     LambdaContext,
+    LvConditional,
+    LvContext,
     ReturnStatement,
     lv,
     lvgl_static,
 )
 from ..types import LV_EVENT, LvNumber, lvgl_ns
-from ..widgets import get_widgets, wait_for_widgets
+from ..widgets import get_widgets, lazy_condition, wait_for_widgets
 
 LVGLNumber = lvgl_ns.class_("LVGLNumber", number.Number, cg.Component)
 
@@ -35,12 +37,19 @@ async def to_code(config):
     widget = widget[0]
     await wait_for_widgets()
     async with LambdaContext([], return_type=cg.float_) as value:
+        if widget.lazy_page is not None:
+            # Keep the last value while the widget's page is unloaded
+            with LvConditional(f"{widget.obj} == nullptr"):
+                value.add(ReturnStatement(MockObj(config[CONF_ID], "->").state))
         value.add(ReturnStatement(widget.get_value()))
     async with LambdaContext([(cg.float_, "v")]) as control:
-        await widget.set_property(
-            "value", MockObj("v") * MockObj(widget.get_scale()), config[CONF_ANIMATED]
-        )
-        lv.event_send(widget.obj, API_EVENT, cg.nullptr)
+        with LvConditional(lazy_condition(widget)):
+            await widget.set_property(
+                "value",
+                MockObj("v") * MockObj(widget.get_scale()),
+                config[CONF_ANIMATED],
+            )
+            lv.event_send(widget.obj, API_EVENT, cg.nullptr)
     event_code = (
         LV_EVENT.VALUE_CHANGED
         if not config[CONF_UPDATE_ON_RELEASE]
@@ -59,8 +68,9 @@ async def to_code(config):
     async with LambdaContext(EVENT_ARG) as event:
         event.add(var.on_value())
     await cg.register_component(var, config)
-    cg.add(
-        lvgl_static.add_event_cb(
-            widget.obj, await event.get_lambda(), UPDATE_EVENT, event_code
+    async with LvContext(widget) as ctx:
+        ctx.add(
+            lvgl_static.add_event_cb(
+                widget.obj, await event.get_lambda(), UPDATE_EVENT, event_code
+            )
         )
-    )
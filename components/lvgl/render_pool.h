@@ -0,0 +1,106 @@
+#pragma once
+
+#ifdef USE_ESP32
+
+#include "freertos/FreeRTOS.h"
+#include "freertos/queue.h"
+#include "freertos/task.h"
+#include "esp_heap_caps.h"
+#include "esp_log.h"
+#include "esphome/core/defines.h"
+
+namespace esphome {
+namespace lvgl {
+
+static const char *const RENDER_POOL_TAG = "render_pool";
+// ThorVG parsing and rasterisation need a large stack
+static constexpr size_t RENDER_WORKER_STACK_SIZE = 64 * 1024;
+static constexpr size_t RENDER_QUEUE_LENGTH = 16;
+
+#ifndef LVGL_RENDER_WORKERS
+#define LVGL_RENDER_WORKERS 1
+#endif
+// Core to pin all workers to, or -1 to spread them across cores
+#ifndef LVGL_RENDER_CORE
+#define LVGL_RENDER_CORE -1
+#endif
+
+// A unit of work for the pool: one Lottie frame, a Lottie load, or one SVG
+// rasterisation.  The generation lets a job notice that its widget was
+// unloaded (and possibly re-loaded) after the job was queued.
+struct RenderJob {
+    void (*run)(void *ctx, uint32_t generation);
+    void *ctx;
+    uint32_t generation;
+};
+
+// --------------------------------------------------------------------------
+// Shared render worker pool – a fixed number of tasks with PSRAM stacks
+// servicing one job queue.  Replaces a task and stack per widget, so the
+// memory and scheduling cost scales with the number of workers rather than
+// the number of Lottie/SVG widgets.
+// --------------------------------------------------------------------------
+struct RenderPool {
+    QueueHandle_t queue;
+    size_t workers;
+};
+
+inline void render_worker_task(void *param) {
+    QueueHandle_t queue = (QueueHandle_t)param;
+    RenderJob job;
+    for (;;) {
+        if (xQueueReceive(queue, &job, portMAX_DELAY) == pdTRUE) {
+            job.run(job.ctx, job.generation);
+        }
+    }
+}
+
+// Create the pool on first use.  Must be called from the LVGL task.
+inline RenderPool *render_pool_get() {
+    static RenderPool pool{};
+    if (pool.queue != nullptr) return &pool;
+
+    pool.queue = xQueueCreate(RENDER_QUEUE_LENGTH, sizeof(RenderJob));
+    if (pool.queue == nullptr) {
+        ESP_LOGE(RENDER_POOL_TAG, "Queue alloc failed");
+        return nullptr;
+    }
+    for (size_t i = 0; i != LVGL_RENDER_WORKERS; i++) {
+        StackType_t *stack = (StackType_t *)heap_caps_malloc(
+            RENDER_WORKER_STACK_SIZE, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
+        StaticTask_t *tcb = (StaticTask_t *)heap_caps_malloc(
+            sizeof(StaticTask_t), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
+        BaseType_t core = LVGL_RENDER_CORE >= 0 ? LVGL_RENDER_CORE : (BaseType_t)(i % portNUM_PROCESSORS);
+        TaskHandle_t handle = nullptr;
+        if (stack && tcb) {
+            handle = xTaskCreateStaticPinnedToCore(
+                render_worker_task, "lvgl_render",
+                RENDER_WORKER_STACK_SIZE / sizeof(StackType_t),
+                pool.queue, 5, stack, tcb, core);
+        }
+        if (!handle) {
+            ESP_LOGE(RENDER_POOL_TAG, "Worker %u alloc failed", (unsigned)i);
+            if (stack) heap_caps_free(stack);
+            if (tcb) heap_caps_free(tcb);
+            break;
+        }
+        pool.workers++;
+    }
+    ESP_LOGI(RENDER_POOL_TAG, "Render pool started: %u workers, %u KB PSRAM stack each",
+             (unsigned)pool.workers, (unsigned)(RENDER_WORKER_STACK_SIZE / 1024));
+    return &pool;
+}
+
+// Queue a job without blocking.  Returns false if the pool is unavailable
+// or the queue is full; callers retry on their next tick.
+inline bool render_pool_submit(void (*run)(void *, uint32_t), void *ctx, uint32_t generation) {
+    RenderPool *pool = render_pool_get();
+    if (pool == nullptr || pool->workers == 0) return false;
+    RenderJob job{run, ctx, generation};
+    return xQueueSend(pool->queue, &job, 0) == pdTRUE;
+}
+
+}  // namespace lvgl
+}  // namespace esphome
+
+#endif  // USE_ESP32
@@ -5,7 +5,7 @@ from esphome.const import CONF_ID, CONF_OPTIONS, CONF_RESTORE_VALUE
 
 from ..defines import CONF_ANIMATED, CONF_WIDGET, literal
 from ..types import LvSelect, lvgl_ns
-from ..widgets import get_widgets
+from ..widgets import get_widgets, wait_for_widgets
 
 LVGLSelect = lvgl_ns.class_("LVGLSelect", select.Select, cg.Component)
 
@@ -21,6 +21,12 @@ CONFIG_SCHEMA = select.select_schema(LVGLSelect).extend(
 async def to_code(config):
     widget = await get_widgets(config, CONF_WIDGET)
     widget = widget[0]
+    await wait_for_widgets()
+    if widget.lazy_page is not None:
+        raise cv.Invalid(
+            f"Select {config[CONF_ID]} cannot use widget {config[CONF_WIDGET]}, "
+            "which is on a lazy page"
+        )
     options = widget.config.get(CONF_OPTIONS, [])
     animated = literal("LV_ANIM_ON" if config[CONF_ANIMATED] else "LV_ANIM_OFF")
     selector = cg.new_Pvariable(
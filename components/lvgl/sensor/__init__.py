@@ -1,27 +1,125 @@
+import esphome.codegen as cg
 from esphome.components.sensor import Sensor, new_sensor, sensor_schema
 import esphome.config_validation as cv
+from esphome.const import (
+    CONF_ID,
+    ENTITY_CATEGORY_DIAGNOSTIC,
+    ICON_COUNTER,
+    ICON_TIMER,
+    STATE_CLASS_MEASUREMENT,
+    UNIT_BYTES,
+    UNIT_MILLISECOND,
+    UNIT_PERCENT,
+)
 
-from ..defines import CONF_WIDGET
+from ..defines import CONF_LVGL_ID, CONF_WIDGET, lvgl_ns
 from ..lvcode import (
     API_EVENT,
     EVENT_ARG,
     UPDATE_EVENT,
     LambdaContext,
     LvContext,
+    LvglComponent,
     lv_add,
     lvgl_static,
 )
 from ..types import LV_EVENT, LvNumber
 from ..widgets import Widget, get_widgets, wait_for_widgets
 
-CONFIG_SCHEMA = sensor_schema(Sensor).extend(
+CONF_DIRTY_PIXELS = "dirty_pixels"
+CONF_FLUSH_TIME = "flush_time"
+CONF_FLUSHES = "flushes"
+CONF_FPS = "fps"
+CONF_HEAP_FRAGMENTATION = "heap_fragmentation"
+CONF_HEAP_FREE = "heap_free"
+CONF_HEAP_USED = "heap_used"
+CONF_INTERNAL_BLOCKS = "internal_blocks"
+CONF_LARGE_ALLOCATIONS = "large_allocations"
+CONF_POOL_BLOCKS = "pool_blocks"
+CONF_PSRAM_BLOCKS = "psram_blocks"
+CONF_SMALL_ALLOCATIONS = "small_allocations"
+CONF_MERGED_AREAS = "merged_areas"
+CONF_RENDER_TIME = "render_time"
+
+LvglStats = lvgl_ns.class_("LvglStats", cg.PollingComponent)
+
+WIDGET_SCHEMA = sensor_schema(Sensor).extend(
     {
         cv.Required(CONF_WIDGET): cv.use_id(LvNumber),
     }
 )
 
 
+def stat_schema(unit, icon, accuracy):
+    return sensor_schema(
+        unit_of_measurement=unit,
+        icon=icon,
+        accuracy_decimals=accuracy,
+        state_class=STATE_CLASS_MEASUREMENT,
+        entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+    )
+
+
+# Rendering statistics, aggregated over each update interval
+STATS = {
+    CONF_FPS: stat_schema("fps", "mdi:speedometer", 1),
+    CONF_RENDER_TIME: stat_schema(UNIT_MILLISECOND, ICON_TIMER, 1),
+    CONF_FLUSH_TIME: stat_schema(UNIT_MILLISECOND, ICON_TIMER, 1),
+    CONF_DIRTY_PIXELS: stat_schema("px", ICON_COUNTER, 0),
+    CONF_FLUSHES: stat_schema(None, ICON_COUNTER, 1),
+    CONF_MERGED_AREAS: stat_schema(None, ICON_COUNTER, 1),
+    CONF_HEAP_USED: stat_schema(UNIT_BYTES, "mdi:memory", 0),
+    CONF_HEAP_FREE: stat_schema(UNIT_BYTES, "mdi:memory", 0),
+    CONF_HEAP_FRAGMENTATION: stat_schema(UNIT_PERCENT, "mdi:memory", 0),
+    CONF_SMALL_ALLOCATIONS: stat_schema(None, ICON_COUNTER, 0),
+    CONF_LARGE_ALLOCATIONS: stat_schema(None, ICON_COUNTER, 0),
+    CONF_INTERNAL_BLOCKS: stat_schema(None, "mdi:memory", 0),
+    CONF_PSRAM_BLOCKS: stat_schema(None, "mdi:memory", 0),
+    CONF_POOL_BLOCKS: stat_schema(None, "mdi:memory", 0),
+}
+# Statistics that need allocation counting in lv_malloc_core()
+MEM_COUNTER_STATS = (
+    CONF_SMALL_ALLOCATIONS,
+    CONF_LARGE_ALLOCATIONS,
+    CONF_INTERNAL_BLOCKS,
+    CONF_PSRAM_BLOCKS,
+    CONF_POOL_BLOCKS,
+)
+
+STATS_SCHEMA = cv.All(
+    cv.Schema(
+        {
+            cv.GenerateID(): cv.declare_id(LvglStats),
+            cv.GenerateID(CONF_LVGL_ID): cv.use_id(LvglComponent),
+            **{cv.Optional(key): schema for key, schema in STATS.items()},
+        }
+    ).extend(cv.polling_component_schema("10s")),
+    cv.has_at_least_one_key(*STATS),
+)
+
+
+# A sensor either tracks the value of a widget, or reports rendering statistics
+# for an LVGL instance when no widget is given.
+CONFIG_SCHEMA = cv.Any(WIDGET_SCHEMA, STATS_SCHEMA)
+
+
+async def stats_to_code(config):
+    cg.add_define("USE_LVGL_STATS")
+    if any(key in config for key in MEM_COUNTER_STATS):
+        cg.add_define("USE_LVGL_MEM_COUNTERS")
+    var = cg.new_Pvariable(config[CONF_ID])
+    await cg.register_component(var, config)
+    await cg.register_parented(var, config[CONF_LVGL_ID])
+    for key in STATS:
+        if conf := config.get(key):
+            sens = await new_sensor(conf)
+            cg.add(getattr(var, f"set_{key}_sensor")(sens))
+
+
 async def to_code(config):
+    if CONF_WIDGET not in config:
+        await stats_to_code(config)
+        return
     sensor = await new_sensor(config)
     widget = await get_widgets(config, CONF_WIDGET)
     widget = widget[0]
@@ -29,7 +127,7 @@ async def to_code(config):
     await wait_for_widgets()
     async with LambdaContext(EVENT_ARG) as lamb:
         lv_add(sensor.publish_state(widget.get_value()))
-    async with LvContext():
+    async with LvContext(widget):
         lv_add(
             lvgl_static.add_event_cb(
                 widget.obj,
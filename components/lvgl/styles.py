@@ -1,20 +1,24 @@
+import re
+
 from esphome import automation
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.const import CONF_ID
-from esphome.core import ID
+from esphome.core import CORE, ID, Lambda
+from esphome.cpp_generator import MockObj
 
 from .defines import (
     CONF_STYLE_DEFINITIONS,
     CONF_THEME,
     CONF_TOP_LAYER,
+    LOGGER,
     LValidator,
     literal,
 )
 from .helpers import add_lv_use
-from .lvcode import LambdaContext, LocalVariable, lv
+from .lvcode import LambdaContext, LocalVariable, MainContext, lv
 from .schemas import ALL_STYLES, FULL_STYLE_SCHEMA, remap_property
-from .types import ObjUpdateAction, lv_obj_t, lv_style_t
+from .types import ObjUpdateAction, lv_obj_t, lv_style_const_prop_t, lv_style_t
 from .widgets import (
     Widget,
     add_widgets,
@@ -40,8 +44,119 @@ async def style_set(svar, style):
             lv.call(f"style_set_{remap_property(prop)}", svar, literal(value))
 
 
+# Style setters with no LV_STYLE_CONST_ equivalent, and the properties they set
+CONST_STYLE_SHORTHANDS = {
+    "pad_all": ("pad_top", "pad_bottom", "pad_left", "pad_right"),
+    "transform_scale": ("transform_scale_x", "transform_scale_y"),
+}
+CONST_STYLE_VALUE = re.compile(
+    r"-?\d+|true|false|&lv_font_\w+|LV_\w+(\s*\|\s*LV_\w+)*"
+)
+
+
+def const_style_value(value):
+    """
+    Convert a processed style value to a constant expression, or None if it is only
+    known at runtime, e.g. an ESPHome font or image.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, (str, MockObj)):
+        return None
+    value = str(value).strip()
+    if match := re.fullmatch(r"lv_color_make\((\d+), (\d+), (\d+)\)", value):
+        return f"LV_COLOR_MAKE({match[1]}, {match[2]}, {match[3]})"
+    if match := re.fullmatch(r"lv_pct\((-?\d+)\)", value):
+        return f"LV_PCT({match[1]})"
+    if CONST_STYLE_VALUE.fullmatch(value):
+        return f"({value})" if "|" in value else value
+    return None
+
+
+class ConstStyles:
+    """
+    Places styles that never change after boot in flash, as LV_STYLE_CONST_INIT
+    property tables, instead of building them on the heap in setup().
+    """
+
+    enabled = False
+    mutable = None
+    count = 0
+    total = 0
+
+    @staticmethod
+    def _find_mutable(node, found):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "lvgl.style.update" and isinstance(value, dict):
+                    found.add(str(value.get(CONF_ID)))
+                ConstStyles._find_mutable(value, found)
+        elif isinstance(node, (list, tuple)):
+            for value in node:
+                ConstStyles._find_mutable(value, found)
+        elif isinstance(node, Lambda):
+            found.update(str(x) for x in node.requires_ids)
+
+    @classmethod
+    def is_mutable(cls, id_name):
+        """
+        A style is mutable if it is the target of lvgl.style.update, or is referenced
+        from a lambda, which could change it.
+        """
+        if cls.mutable is None:
+            cls.mutable = set()
+            cls._find_mutable(CORE.config, cls.mutable)
+        return id_name in cls.mutable
+
+    @classmethod
+    async def create(cls, style_id, style):
+        """
+        Create a constant style, or return None if any of its values is not constant
+        """
+        props = []
+        for prop, validator in ALL_STYLES.items():
+            if (value := style.get(prop)) is None:
+                continue
+            if isinstance(value, Lambda):
+                return None
+            if isinstance(validator, LValidator):
+                value = await validator.process(value)
+            if isinstance(value, list):
+                value = "|".join(value)
+            if (value := const_style_value(value)) is None:
+                return None
+            prop = remap_property(prop)
+            for name in CONST_STYLE_SHORTHANDS.get(prop, (prop,)):
+                props.append(f"LV_STYLE_CONST_{name.upper()}({value})")
+        props.append("LV_STYLE_CONST_PROPS_END")
+        props_id = ID(f"{style_id.id}_props", True, lv_style_const_prop_t)
+        cg.static_const_array(props_id, cg.RawExpression("{" + ", ".join(props) + "}"))
+        const_name = f"{style_id.id}_const"
+        cg.add_global(
+            cg.RawStatement(f"static LV_STYLE_CONST_INIT({const_name}, {props_id});")
+        )
+        # LVGL never writes to a style flagged as constant, so the cast is safe
+        return cg.Pvariable(style_id, cg.RawExpression(f"(lv_style_t *) &{const_name}"))
+
+    @classmethod
+    def report(cls):
+        if cls.enabled and cls.total:
+            LOGGER.info(
+                "Const styles: %d of %d styles placed in flash", cls.count, cls.total
+            )
+
+
 async def create_style(id_name, style=None):
     style_id = ID(id_name, True, lv_style_t)
+    if style and ConstStyles.enabled:
+        ConstStyles.total += 1
+        if not ConstStyles.is_mutable(id_name) and (
+            svar := await ConstStyles.create(style_id, style)
+        ):
+            ConstStyles.count += 1
+            return svar
     svar = cg.new_Pvariable(style_id)
     lv.style_init(svar)
     if style:
@@ -63,7 +178,12 @@ class LVStyle:
 
     async def get_var(self):
         if self._style_var is None:
-            self._style_var = await create_style(self.id_name + "_style", self.style)
+            # Initialise once in setup, even when first used by code run repeatedly,
+            # such as the builder of a lazy page
+            async with MainContext():
+                self._style_var = await create_style(
+                    self.id_name + "_style", self.style
+                )
         return self._style_var
 
     @classmethod
@@ -71,6 +191,54 @@ class LVStyle:
         return cls.named_styles.setdefault(id_name, LVStyle(id_name))
 
 
+class SharedStyles:
+    """
+    Replaces the local styles LVGL creates for inline widget properties with one
+    shared style per distinct set of static properties. Each local style is a heap
+    allocation on its object, so identical cards styled inline cost memory and setup
+    time per widget.
+    """
+
+    enabled = False
+    styles = {}
+    local_styles = 0
+    local_props = 0
+
+    @staticmethod
+    def _key(props):
+        return tuple(
+            (prop, str(value) if isinstance(value, ID) else repr(value))
+            for prop, value in sorted(props.items())
+        )
+
+    @classmethod
+    async def get_var(cls, props):
+        """
+        Get the shared style for a set of properties, creating it on first use. The
+        style is initialised in setup() even when the first widget using it is built
+        elsewhere, so it is ready before any widget refers to it.
+        """
+        key = cls._key(props)
+        cls.local_styles += 1
+        cls.local_props += len(props)
+        if (svar := cls.styles.get(key)) is None:
+            async with MainContext():
+                svar = await create_style(f"_lv_shared_style_{len(cls.styles)}", props)
+            cls.styles[key] = svar
+        return svar
+
+    @classmethod
+    def report(cls):
+        if cls.local_styles:
+            LOGGER.info(
+                "Shared styles: %d local styles (%d properties) replaced by %d "
+                "shared styles",
+                cls.local_styles,
+                cls.local_props,
+                len(cls.styles),
+            )
+
+
 async def styles_to_code(config):
     """Convert styles to C__ code."""
     for style in config.get(CONF_STYLE_DEFINITIONS, ()):
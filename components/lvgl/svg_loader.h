@@ -9,15 +9,145 @@
 #include <cstdio>
 #include <cstring>
 #include <lvgl.h>
+#include <vector>
 
 // ThorVG C API – compiled into LVGL when LV_USE_THORVG_INTERNAL=1.
 #include <src/libs/thorvg/thorvg_capi.h>
 
+#include "render_pool.h"
+
 namespace esphome {
 namespace lvgl {
 
 static const char *const SVG_TAG = "svg";
-static constexpr size_t SVG_TASK_STACK_SIZE = 64 * 1024;
+
+// PSRAM bytes kept for rasters of SVGs on pages that are not shown, 0 to free them on unload
+#ifndef LVGL_SVG_CACHE_SIZE
+#define LVGL_SVG_CACHE_SIZE 0
+#endif
+
+// --------------------------------------------------------------------------
+// Raster cache – rendered pixel buffers keyed by source and size, shared by
+// widgets showing the same icon.  Buffers in use are never evicted; unused
+// ones are kept, least recently used first out, while they fit the budget,
+// so switching back to a page does not re-read and re-render its SVGs.
+// All functions are called under lv_lock.
+// --------------------------------------------------------------------------
+struct SvgRaster {
+    const void *key;            // file path, or pointer to embedded data
+    bool key_is_path;
+    uint32_t width;
+    uint32_t height;
+    uint32_t *pixels;
+    size_t bytes;
+    uint32_t last_used;
+    uint16_t users;
+    bool valid;                 // fully rendered
+    bool rendering;             // a render job for one of the users is writing it
+};
+
+struct SvgRasterCache {
+    std::vector<SvgRaster> entries;
+    size_t unused_bytes;
+    uint32_t clock;
+};
+
+inline SvgRasterCache &svg_cache() {
+    static SvgRasterCache cache{};
+    return cache;
+}
+
+inline SvgRaster *svg_cache_find_pixels(const uint32_t *pixels) {
+    for (auto &entry : svg_cache().entries) {
+        if (entry.pixels == pixels) return &entry;
+    }
+    return nullptr;
+}
+
+// Free unused rasters, oldest first, until `needed` more unused bytes fit the budget.
+inline void svg_cache_evict(size_t needed) {
+    auto &cache = svg_cache();
+    while (cache.unused_bytes + needed > LVGL_SVG_CACHE_SIZE) {
+        auto victim = cache.entries.end();
+        for (auto it = cache.entries.begin(); it != cache.entries.end(); ++it) {
+            if (it->users == 0 && (victim == cache.entries.end() || it->last_used < victim->last_used))
+                victim = it;
+        }
+        if (victim == cache.entries.end()) return;
+        heap_caps_free(victim->pixels);
+        cache.unused_bytes -= victim->bytes;
+        cache.entries.erase(victim);
+    }
+}
+
+// Get a raster for the source and size, setting *valid if it is already rendered.
+inline uint32_t *svg_cache_acquire(const void *key, bool key_is_path, uint32_t width, uint32_t height,
+                                   bool *valid) {
+    auto &cache = svg_cache();
+    for (auto &entry : cache.entries) {
+        if (entry.width != width || entry.height != height || entry.key_is_path != key_is_path) continue;
+        if (key_is_path ? strcmp((const char *)entry.key, (const char *)key) != 0 : entry.key != key) continue;
+        if (entry.users++ == 0) cache.unused_bytes -= entry.bytes;
+        entry.last_used = ++cache.clock;
+        *valid = entry.valid;
+        return entry.pixels;
+    }
+    size_t bytes = (size_t)width * height * sizeof(uint32_t);
+    uint32_t *pixels = (uint32_t *)heap_caps_malloc(bytes, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
+    if (pixels == nullptr) {
+        // Make room by dropping every unused raster and try once more
+        svg_cache_evict(LVGL_SVG_CACHE_SIZE + 1);
+        pixels = (uint32_t *)heap_caps_malloc(bytes, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
+        if (pixels == nullptr) return nullptr;
+    }
+    memset(pixels, 0, bytes);
+    cache.entries.push_back({key, key_is_path, width, height, pixels, bytes, ++cache.clock, 1, false, false});
+    *valid = false;
+    return pixels;
+}
+
+// Claim the raster for rendering; false if another widget's job already is.
+inline bool svg_cache_begin_render(const uint32_t *pixels) {
+    SvgRaster *entry = svg_cache_find_pixels(pixels);
+    if (entry == nullptr || entry->rendering) return false;
+    entry->rendering = true;
+    return true;
+}
+
+inline void svg_cache_end_render(const uint32_t *pixels, bool rendered) {
+    if (SvgRaster *entry = svg_cache_find_pixels(pixels)) {
+        entry->rendering = false;
+        entry->valid = rendered;
+    }
+}
+
+inline bool svg_cache_is_valid(const uint32_t *pixels) {
+    SvgRaster *entry = svg_cache_find_pixels(pixels);
+    return entry != nullptr && entry->valid;
+}
+
+// Give up a raster; it stays cached if it is complete and fits the budget.
+inline void svg_cache_release(const uint32_t *pixels) {
+    auto &cache = svg_cache();
+    SvgRaster *entry = svg_cache_find_pixels(pixels);
+    if (entry == nullptr) return;
+    if (entry->users > 1) {
+        entry->users--;
+        return;
+    }
+    if (!entry->valid || entry->bytes > LVGL_SVG_CACHE_SIZE) {
+        heap_caps_free(entry->pixels);
+        cache.entries.erase(cache.entries.begin() + (entry - cache.entries.data()));
+        return;
+    }
+    // Make room while the entry is still in use, so it is not evicted itself
+    svg_cache_evict(entry->bytes);
+    // eviction may have moved the entry
+    entry = svg_cache_find_pixels(pixels);
+    if (entry == nullptr) return;
+    entry->users = 0;
+    cache.unused_bytes += entry->bytes;
+}
 
 // Persistent context for each SVG widget – tracks all PSRAM allocations
 // so they can be freed on screen unload and re-created on screen load.
@@ -30,30 +160,55 @@ struct SvgContext {
     uint32_t width;
     uint32_t height;
 
-    // --- Runtime state (freed on screen unload) ---
-    uint32_t *pixel_buffer;     // PSRAM – width*height*4 bytes
+    // --- Runtime state (released to the raster cache on screen unload) ---
+    uint32_t *pixel_buffer;     // PSRAM – width*height*4 bytes, owned by the raster cache
     lv_draw_buf_t *draw_buf;    // internal RAM
-    StackType_t *task_stack;    // PSRAM – 64 KB
-    StaticTask_t *task_tcb;     // internal RAM
-    TaskHandle_t task_handle;
-    volatile bool task_done;    // set by render task when finished
+    lv_timer_t *render_timer;   // one-shot, queues the render job
+    uint32_t generation;        // bumped on unload – stale jobs skip the result
+    portMUX_TYPE lock;          // guards busy/free_pending
+    bool busy;                  // a render job is writing to pixel_buffer
+    bool free_pending;          // unloaded while busy – the job frees on completion
+    bool render_claimed;        // this widget's job is the one rendering the cached raster
     bool user_wants_hidden;     // Save user's 'hidden' config before forcing hide during render
 };
 
+inline void svg_show(SvgContext *ctx) {
+    if (!ctx->user_wants_hidden) {
+        lv_obj_remove_flag(ctx->canvas_obj, LV_OBJ_FLAG_HIDDEN);
+    }
+    lv_obj_invalidate(ctx->canvas_obj);
+}
+
+inline void svg_release_buffers(SvgContext *ctx) {
+    if (ctx->render_claimed) {
+        // queued job went stale before it ran
+        svg_cache_end_render(ctx->pixel_buffer, false);
+        ctx->render_claimed = false;
+    }
+    if (ctx->pixel_buffer) { svg_cache_release(ctx->pixel_buffer); ctx->pixel_buffer = nullptr; }
+    if (ctx->draw_buf)     { heap_caps_free(ctx->draw_buf);     ctx->draw_buf = nullptr; }
+}
+
 // --------------------------------------------------------------------------
-// Render task – rasterises SVG via ThorVG, then suspends itself.
-// The task does NOT self-delete; the cleanup code deletes it so that
-// the stack/TCB can be safely freed afterwards.
+// Render job – rasterises SVG via ThorVG on a render pool worker.
+// Rasterisation runs without lv_lock, so the buffers are pinned with the
+// busy flag; an unload in the meantime defers freeing to the end of the job.
 // --------------------------------------------------------------------------
-inline void svg_render_task(void *param) {
+inline void svg_render_job(void *param, uint32_t generation) {
     SvgContext *ctx = (SvgContext *)param;
 
-    vTaskDelay(pdMS_TO_TICKS(500));
+    taskENTER_CRITICAL(&ctx->lock);
+    bool stale = generation != ctx->generation || ctx->pixel_buffer == nullptr;
+    if (!stale) ctx->busy = true;
+    taskEXIT_CRITICAL(&ctx->lock);
+    if (stale) return;
 
     // --- Resolve SVG data ---
     const char *svg_data = ctx->svg_data;
     size_t svg_data_size = ctx->svg_data_size;
     char *file_buf = nullptr;
+    bool rendered = false;
+    bool release;
 
     if (svg_data == nullptr && ctx->file_path != nullptr) {
         ESP_LOGI(SVG_TAG, "Reading SVG from %s ...", ctx->file_path);
@@ -121,66 +276,100 @@ inline void svg_render_task(void *param) {
         tvg_canvas_destroy(tc);
 
         ESP_LOGI(SVG_TAG, "SVG rendered OK");
+        rendered = true;
     }
 
-    // Restore user's 'hidden' configuration (only show if user didn't set hidden: true)
+done:
+    if (file_buf) heap_caps_free(file_buf);
+
     lv_lock();
-    if (!ctx->user_wants_hidden) {
-        lv_obj_remove_flag(ctx->canvas_obj, LV_OBJ_FLAG_HIDDEN);
+    taskENTER_CRITICAL(&ctx->lock);
+    ctx->busy = false;
+    release = ctx->free_pending;
+    ctx->free_pending = false;
+    taskEXIT_CRITICAL(&ctx->lock);
+    svg_cache_end_render(ctx->pixel_buffer, rendered);
+    ctx->render_claimed = false;
+    if (release) {
+        svg_release_buffers(ctx);
+    } else if (rendered && generation == ctx->generation) {
+        // Restore user's 'hidden' configuration (only show if user didn't set hidden: true)
+        svg_show(ctx);
     }
-    lv_obj_invalidate(ctx->canvas_obj);
     lv_unlock();
+}
 
-done:
-    if (file_buf) heap_caps_free(file_buf);
-    ctx->task_done = true;
-    // Suspend – do NOT vTaskDelete; the cleanup callback will delete us
-    // so it can safely free stack + TCB afterwards.
-    vTaskSuspend(NULL);
+// One-shot timer: give LVGL time to settle, then queue the render job.
+inline void svg_render_timer_cb(lv_timer_t *timer) {
+    SvgContext *ctx = (SvgContext *)lv_timer_get_user_data(timer);
+    // Another widget showing the same SVG may have rendered it meanwhile
+    if (!ctx->busy && svg_cache_is_valid(ctx->pixel_buffer)) {
+        lv_timer_delete(timer);
+        ctx->render_timer = nullptr;
+        svg_show(ctx);
+        return;
+    }
+    // Wait for a render from before an unload/re-load to let go of the buffer,
+    // or for another widget's render of the same raster, and retry on the next
+    // period if the queue is full
+    if (ctx->busy || !svg_cache_begin_render(ctx->pixel_buffer)) {
+        return;
+    }
+    ctx->render_claimed = true;
+    if (!render_pool_submit(svg_render_job, ctx, ctx->generation)) {
+        svg_cache_end_render(ctx->pixel_buffer, false);
+        ctx->render_claimed = false;
+        return;
+    }
+    lv_timer_delete(timer);
+    ctx->render_timer = nullptr;
+}
+
+inline void svg_stop_render(SvgContext *ctx) {
+    ctx->generation++;
+    if (ctx->render_timer) { lv_timer_delete(ctx->render_timer); ctx->render_timer = nullptr; }
 }
 
 // --------------------------------------------------------------------------
 // Free all PSRAM/internal-RAM resources for one SVG widget.
 // Called from the screen-unload event callback (runs under lv_lock).
+// If a render job is still writing the buffer, it frees them when done.
 // --------------------------------------------------------------------------
 inline void svg_free_resources(SvgContext *ctx) {
-    // Delete the task first (it is either suspended or blocked on lv_lock)
-    if (ctx->task_handle) {
-        vTaskDelete(ctx->task_handle);
-        ctx->task_handle = nullptr;
-    }
-    if (ctx->task_stack)   { heap_caps_free(ctx->task_stack);   ctx->task_stack = nullptr; }
-    if (ctx->task_tcb)     { heap_caps_free(ctx->task_tcb);     ctx->task_tcb = nullptr; }
-    if (ctx->pixel_buffer) { heap_caps_free(ctx->pixel_buffer); ctx->pixel_buffer = nullptr; }
-    if (ctx->draw_buf)     { heap_caps_free(ctx->draw_buf);     ctx->draw_buf = nullptr; }
-    ctx->task_done = false;
-
-    ESP_LOGI(SVG_TAG, "SVG PSRAM freed (%ux%u = %u KB)",
+    svg_stop_render(ctx);
+    taskENTER_CRITICAL(&ctx->lock);
+    bool busy = ctx->busy;
+    if (busy) ctx->free_pending = true;
+    taskEXIT_CRITICAL(&ctx->lock);
+    if (!busy) svg_release_buffers(ctx);
+
+    ESP_LOGI(SVG_TAG, "SVG PSRAM released (%ux%u = %u KB)%s",
              (unsigned)ctx->width, (unsigned)ctx->height,
-             (unsigned)(ctx->width * ctx->height * 4 / 1024));
+             (unsigned)(ctx->width * ctx->height * 4 / 1024),
+             busy ? " after render completes" : "");
 }
 
 // --------------------------------------------------------------------------
-// (Re-)allocate buffers and launch the render task.
+// (Re-)allocate buffers and schedule the render job.
 // Called from svg_setup_and_render (first time) and screen-load callback.
 // Must be called under lv_lock.
 // --------------------------------------------------------------------------
 inline bool svg_launch(SvgContext *ctx) {
-    // Allocate pixel buffer in PSRAM
+    // Get the pixel buffer from the raster cache, possibly already rendered
     size_t buf_bytes = (size_t)ctx->width * ctx->height * sizeof(uint32_t);
-    ctx->pixel_buffer = (uint32_t *)heap_caps_malloc(
-        buf_bytes, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
+    bool cached = false;
+    const void *key = ctx->file_path != nullptr ? (const void *)ctx->file_path : (const void *)ctx->svg_data;
+    ctx->pixel_buffer = svg_cache_acquire(key, ctx->file_path != nullptr, ctx->width, ctx->height, &cached);
     if (!ctx->pixel_buffer) {
         ESP_LOGE(SVG_TAG, "PSRAM alloc failed (%u bytes)", (unsigned)buf_bytes);
         return false;
     }
-    memset(ctx->pixel_buffer, 0, buf_bytes);
 
     // Create draw-buf and attach to canvas
     ctx->draw_buf = (lv_draw_buf_t *)heap_caps_malloc(
         sizeof(lv_draw_buf_t), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
     if (!ctx->draw_buf) {
-        heap_caps_free(ctx->pixel_buffer); ctx->pixel_buffer = nullptr;
+        svg_cache_release(ctx->pixel_buffer); ctx->pixel_buffer = nullptr;
         return false;
     }
     lv_draw_buf_init(ctx->draw_buf, ctx->width, ctx->height,
@@ -189,33 +378,18 @@ inline bool svg_launch(SvgContext *ctx) {
     lv_draw_buf_set_flag(ctx->draw_buf, LV_IMAGE_FLAGS_MODIFIABLE);
     lv_canvas_set_draw_buf(ctx->canvas_obj, ctx->draw_buf);
 
-    // Hide temporarily during async render (user's config is already saved in ctx->user_wants_hidden)
-    lv_obj_add_flag(ctx->canvas_obj, LV_OBJ_FLAG_HIDDEN);
-
-    // Allocate task stack + TCB
-    ctx->task_stack = (StackType_t *)heap_caps_malloc(
-        SVG_TASK_STACK_SIZE, MALLOC_CAP_SPIRAM | MALLOC_CAP_8BIT);
-    ctx->task_tcb = (StaticTask_t *)heap_caps_malloc(
-        sizeof(StaticTask_t), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
-    if (!ctx->task_stack || !ctx->task_tcb) {
-        ESP_LOGE(SVG_TAG, "Task alloc failed");
-        svg_free_resources(ctx);
-        return false;
+    if (cached) {
+        svg_show(ctx);
+        ESP_LOGI(SVG_TAG, "SVG shown from raster cache (%u KB)", (unsigned)(buf_bytes / 1024));
+        return true;
     }
 
-    ctx->task_done = false;
-    ctx->task_handle = xTaskCreateStatic(
-        svg_render_task, "svg_render",
-        SVG_TASK_STACK_SIZE / sizeof(StackType_t),
-        ctx, 5, ctx->task_stack, ctx->task_tcb);
+    // Hide temporarily during async render (user's config is already saved in ctx->user_wants_hidden)
+    lv_obj_add_flag(ctx->canvas_obj, LV_OBJ_FLAG_HIDDEN);
 
-    if (!ctx->task_handle) {
-        svg_free_resources(ctx);
-        return false;
-    }
+    ctx->render_timer = lv_timer_create(svg_render_timer_cb, 500, ctx);
 
-    ESP_LOGI(SVG_TAG, "SVG render task launched (%u KB PSRAM)",
-             (unsigned)(SVG_TASK_STACK_SIZE / 1024));
+    ESP_LOGI(SVG_TAG, "SVG render scheduled (%u KB PSRAM)", (unsigned)(buf_bytes / 1024));
     return true;
 }
 
@@ -223,43 +397,39 @@ inline bool svg_launch(SvgContext *ctx) {
 // Screen event callbacks – two-phase unload to avoid drawing freed buffer
 // during screen transition animation.
 //
-//   SCREEN_UNLOAD_START  → stop task + hide widget (LVGL still draws screen)
-//   SCREEN_UNLOADED      → free PSRAM (screen no longer visible)
+//   SCREEN_UNLOAD_START  → cancel render + hide widget (LVGL still draws screen)
+//   SCREEN_UNLOADED      → release PSRAM to the raster cache (screen no longer visible)
 //   SCREEN_LOADED        → re-allocate and re-launch
 // --------------------------------------------------------------------------
 inline void svg_screen_unload_start_cb(lv_event_t *e) {
     SvgContext *ctx = (SvgContext *)lv_event_get_user_data(e);
 
-    // Stop the render task immediately
-    if (ctx->task_handle) {
-        vTaskDelete(ctx->task_handle);
-        ctx->task_handle = nullptr;
-    }
+    // Cancel any pending render – a job already running finishes but won't show its result
+    svg_stop_render(ctx);
 
     // Hide widget so LVGL won't try to draw the canvas during transition
     lv_obj_add_flag(ctx->canvas_obj, LV_OBJ_FLAG_HIDDEN);
 
-    ESP_LOGI(SVG_TAG, "SVG task stopped, widget hidden (transition starting)");
+    ESP_LOGI(SVG_TAG, "SVG render cancelled, widget hidden (transition starting)");
 }
 
 inline void svg_screen_unloaded_cb(lv_event_t *e) {
     SvgContext *ctx = (SvgContext *)lv_event_get_user_data(e);
 
     // Now safe to free – screen is no longer visible
-    if (ctx->task_stack)   { heap_caps_free(ctx->task_stack);   ctx->task_stack = nullptr; }
-    if (ctx->task_tcb)     { heap_caps_free(ctx->task_tcb);     ctx->task_tcb = nullptr; }
-    if (ctx->pixel_buffer) { heap_caps_free(ctx->pixel_buffer); ctx->pixel_buffer = nullptr; }
-    if (ctx->draw_buf)     { heap_caps_free(ctx->draw_buf);     ctx->draw_buf = nullptr; }
-    ctx->task_done = false;
-
-    ESP_LOGI(SVG_TAG, "SVG PSRAM freed (%ux%u = %u KB)",
-             (unsigned)ctx->width, (unsigned)ctx->height,
-             (unsigned)(ctx->width * ctx->height * 4 / 1024));
+    svg_free_resources(ctx);
 }
 
 inline void svg_screen_loaded_cb(lv_event_t *e) {
     SvgContext *ctx = (SvgContext *)lv_event_get_user_data(e);
-    if (ctx->pixel_buffer == nullptr) {
+    taskENTER_CRITICAL(&ctx->lock);
+    bool reuse = ctx->free_pending;
+    ctx->free_pending = false;
+    taskEXIT_CRITICAL(&ctx->lock);
+    if (reuse) {
+        // The previous render is still running – keep its buffers and render again after it
+        ctx->render_timer = lv_timer_create(svg_render_timer_cb, 500, ctx);
+    } else if (ctx->pixel_buffer == nullptr) {
         svg_launch(ctx);
     }
 }
@@ -274,6 +444,7 @@ inline bool svg_setup_and_render(lv_obj_t *canvas_obj,
         sizeof(SvgContext), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
     if (!ctx) return false;
     memset(ctx, 0, sizeof(SvgContext));
+    portMUX_INITIALIZE(&ctx->lock);
 
     ctx->canvas_obj    = canvas_obj;
     ctx->svg_data      = svg_data;
@@ -305,6 +476,7 @@ inline bool svg_setup_and_render_file(lv_obj_t *canvas_obj,
         sizeof(SvgContext), MALLOC_CAP_INTERNAL | MALLOC_CAP_8BIT);
     if (!ctx) return false;
     memset(ctx, 0, sizeof(SvgContext));
+    portMUX_INITIALIZE(&ctx->lock);
 
     ctx->canvas_obj    = canvas_obj;
     ctx->svg_data      = nullptr;
@@ -18,7 +18,7 @@ from ..lvcode import (
     lvgl_static,
 )
 from ..types import LV_EVENT, LV_STATE, lv_pseudo_button_t, lvgl_ns
-from ..widgets import get_widgets, wait_for_widgets
+from ..widgets import get_widgets, lazy_condition, wait_for_widgets
 
 LVGLSwitch = lvgl_ns.class_("LVGLSwitch", Switch, Component)
 CONFIG_SCHEMA = switch_schema(LVGLSwitch).extend(
@@ -35,18 +35,19 @@ async def to_code(config):
     switch_id = MockObj(config[CONF_ID], "->")
     v = literal("v")
     async with LambdaContext([(cg.bool_, "v")]) as control:
-        with LvConditional(v) as cond:
-            widget.add_state(LV_STATE.CHECKED)
-            cond.else_()
-            widget.clear_state(LV_STATE.CHECKED)
-        lv.event_send(widget.obj, API_EVENT, cg.nullptr)
+        with LvConditional(lazy_condition(widget)):
+            with LvConditional(v) as cond:
+                widget.add_state(LV_STATE.CHECKED)
+                cond.else_()
+                widget.clear_state(LV_STATE.CHECKED)
+            lv.event_send(widget.obj, API_EVENT, cg.nullptr)
         control.add(switch_id.publish_state(v))
     switch = cg.new_Pvariable(config[CONF_ID], await control.get_lambda())
     await cg.register_component(switch, config)
     await register_switch(switch, config)
     async with LambdaContext(EVENT_ARG) as checked_ctx:
         checked_ctx.add(switch.publish_state(widget.get_value()))
-    async with LvContext() as ctx:
+    async with LvContext(widget) as ctx:
         ctx.add(
             lvgl_static.add_event_cb(
                 widget.obj,
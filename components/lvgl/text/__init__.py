@@ -9,13 +9,14 @@ from ..lvcode import (
     EVENT_ARG,
     UPDATE_EVENT,
     LambdaContext,
+    LvConditional,
     LvContext,
     lv,
     lv_add,
     lvgl_static,
 )
 from ..types import LV_EVENT, LvText, lvgl_ns
-from ..widgets import get_widgets, wait_for_widgets
+from ..widgets import get_widgets, lazy_condition, wait_for_widgets
 
 LVGLText = lvgl_ns.class_("LVGLText", text.Text)
 
@@ -32,12 +33,13 @@ async def to_code(config):
     widget = widget[0]
     await wait_for_widgets()
     async with LambdaContext([(cg.std_string, "text_value")]) as control:
-        await widget.set_property("text", "text_value.c_str()")
-        lv.event_send(widget.obj, API_EVENT, cg.nullptr)
-        control.add(textvar.publish_state(widget.get_value()))
+        with LvConditional(lazy_condition(widget)):
+            await widget.set_property("text", "text_value.c_str()")
+            lv.event_send(widget.obj, API_EVENT, cg.nullptr)
+            control.add(textvar.publish_state(widget.get_value()))
     async with LambdaContext(EVENT_ARG) as lamb:
         lv_add(textvar.publish_state(widget.get_value()))
-    async with LvContext():
+    async with LvContext(widget):
         lv_add(textvar.set_control_lambda(await control.get_lambda()))
         lv_add(
             lvgl_static.add_event_cb(
@@ -31,7 +31,7 @@ async def to_code(config):
     await wait_for_widgets()
     async with LambdaContext(EVENT_ARG) as pressed_ctx:
         pressed_ctx.add(sensor.publish_state(widget.get_value()))
-    async with LvContext() as ctx:
+    async with LvContext(widget) as ctx:
         ctx.add(
             lvgl_static.add_event_cb(
                 widget.obj,
@@ -0,0 +1,155 @@
+// Host benchmark for the LVGL small object pool in lvgl_mem_pool.h.
+//
+// Replays an allocation trace twice: once through the pool, with the fallback used by lv_malloc_core() for larger
+// requests, and once with every block 64-byte aligned from the heap, as without the pool. Build and run with:
+//
+//   g++ -O2 -std=c++17 -o alloc_bench alloc_bench.cpp && ./alloc_bench alloc_trace.txt
+//
+// Add -DLVGL_MEM_POOL_SIZE=<bytes> to try another pool size. Trace lines are "a <id> <size>" to allocate,
+// "r <id> <size>" to reallocate and "f <id>" to free; lines starting with # are ignored.
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <sstream>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// Host versions of what lvgl_esphome.cpp provides to the pool
+#ifndef LVGL_MEM_POOL_SIZE
+#define LVGL_MEM_POOL_SIZE (32 * 1024)
+#endif
+#define LVGL_MEM_INTERNAL_RESERVE 0
+#define MALLOC_CAP_8BIT 0
+#define portMUX_INITIALIZER_UNLOCKED 0
+#define portENTER_CRITICAL(lock) (void) (lock)
+#define portEXIT_CRITICAL(lock) (void) (lock)
+#define ESP_LOGW(tag, ...) (fprintf(stderr, __VA_ARGS__), fputc('\n', stderr))
+#define ESP_LOGD(tag, ...) (void) (tag)
+using portMUX_TYPE = int;
+namespace esphome::lvgl {
+static const char *const TAG = "lvgl";
+}
+static constexpr unsigned INTERNAL_CAPS = 0;
+static unsigned cap_bits = 0;  // NOLINT
+static size_t heap_caps_get_free_size(unsigned caps) { return SIZE_MAX / 2; }
+static void *heap_caps_aligned_alloc(size_t alignment, size_t size, unsigned caps) {
+  return aligned_alloc(alignment, (size + alignment - 1) / alignment * alignment);
+}
+static void *heap_caps_calloc(size_t count, size_t size, unsigned caps) { return calloc(count, size); }
+static void heap_caps_free(void *ptr) { free(ptr); }
+
+#include "../lvgl_mem_pool.h"
+
+static const size_t HEAP_ALIGNMENT = 64;
+static const int ROUNDS = 200;
+
+struct Op {
+  char kind;
+  uint32_t id;
+  size_t size;
+};
+
+struct Allocator {
+  bool pooled;
+  size_t live_bytes{};  // bytes held outside the pool
+  size_t peak_bytes{};
+
+  void *alloc(size_t size) {
+    if (this->pooled) {
+      if (void *ptr = pool_alloc(size))
+        return ptr;
+    }
+    this->live_bytes += heap_size(size);
+    this->peak_bytes = std::max(this->peak_bytes, this->live_bytes + pool_pages_used() * POOL_PAGE_SIZE);
+    return heap_caps_aligned_alloc(HEAP_ALIGNMENT, size, 0);
+  }
+
+  void release(void *ptr, size_t size) {
+    if (this->pooled && pool_owns(ptr)) {
+      pool_free(ptr);
+      return;
+    }
+    this->live_bytes -= heap_size(size);
+    heap_caps_free(ptr);
+  }
+
+  // As lv_realloc_core()
+  void *realloc(void *ptr, size_t old_size, size_t size) {
+    if (this->pooled && pool_owns(ptr)) {
+      old_size = pool_block_size(ptr);
+      if (size <= old_size)
+        return ptr;
+    }
+    void *new_ptr = this->alloc(size);
+    memcpy(new_ptr, ptr, std::min(old_size, size));
+    this->release(ptr, old_size);
+    return new_ptr;
+  }
+
+  static size_t heap_size(size_t size) { return (size + HEAP_ALIGNMENT - 1) / HEAP_ALIGNMENT * HEAP_ALIGNMENT; }
+
+  static size_t pool_pages_used() {
+    size_t free_pages = 0;
+    for (PoolPage *page = mem_pool.free_pages; page != nullptr; page = page->next)
+      free_pages++;
+    return mem_pool.page_count - free_pages;
+  }
+};
+
+static double replay(const std::vector<Op> &trace, Allocator &allocator) {
+  std::unordered_map<uint32_t, std::pair<void *, size_t>> live;
+  auto start = std::chrono::steady_clock::now();
+  for (int round = 0; round != ROUNDS; round++) {
+    for (const auto &op : trace) {
+      auto &block = live[op.id];
+      if (op.kind == 'a') {
+        block = {allocator.alloc(op.size), op.size};
+        memset(block.first, 0, op.size);
+      } else if (op.kind == 'r') {
+        block = {allocator.realloc(block.first, block.second, op.size), op.size};
+      } else {
+        allocator.release(block.first, block.second);
+        live.erase(op.id);
+      }
+    }
+  }
+  std::chrono::duration<double, std::nano> elapsed = std::chrono::steady_clock::now() - start;
+  if (!live.empty())
+    fprintf(stderr, "%zu blocks still allocated at the end of the trace\n", live.size());
+  return elapsed.count() / (double(ROUNDS) * trace.size());
+}
+
+int main(int argc, char **argv) {
+  std::ifstream file(argc > 1 ? argv[1] : "alloc_trace.txt");
+  if (!file) {
+    fprintf(stderr, "usage: %s <trace file>\n", argv[0]);
+    return 1;
+  }
+  std::vector<Op> trace;
+  std::string line;
+  while (std::getline(file, line)) {
+    if (line.empty() || line[0] == '#')
+      continue;
+    std::istringstream fields(line);
+    Op op{};
+    fields >> op.kind >> op.id >> op.size;
+    trace.push_back(op);
+  }
+
+  Allocator heap{false};
+  Allocator pooled{true};
+  double heap_ns = replay(trace, heap);
+  double pool_ns = replay(trace, pooled);
+  printf("%zu operations, %d rounds, pool of %zu pages\n", trace.size(), ROUNDS, mem_pool.page_count);
+  printf("heap only   %6.1f ns/op, peak %zu bytes\n", heap_ns, heap.peak_bytes);
+  printf("pool        %6.1f ns/op, peak %zu bytes including whole pool pages\n", pool_ns, pooled.peak_bytes);
+  size_t pages_left = Allocator::pool_pages_used();
+  printf("pool pages still in use: %zu\n", pages_left);
+  return pages_left == 0 ? 0 : 1;
+}
@@ -24,6 +24,7 @@ from .lvcode import (
     UPDATE_EVENT,
     LambdaContext,
     LvConditional,
+    LvContext,
     lv,
     lv_add,
     lv_event_t_ptr,
@@ -33,9 +34,15 @@ from .types import LV_EVENT
 from .widgets import LvScrActType, get_screen_active, widget_map
 
 
-async def add_on_boot_triggers(triggers):
+async def add_on_boot_triggers(triggers, w=None):
     for conf in triggers:
         trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], 390)
+        if w is not None and w.lazy_page is not None:
+            # The widget does not exist at boot, so trigger each time its page is built
+            await automation.build_automation(trigger, [], conf)
+            async with LvContext(w):
+                lv_add(trigger.trigger())
+            continue
         await cg.register_component(trigger, conf)
         await automation.build_automation(trigger, [], conf)
 
@@ -57,7 +64,8 @@ async def generate_triggers():
                 if event in LV_EVENT_TRIGGERS
             }.items():
                 conf = conf[0]
-                w.add_flag("LV_OBJ_FLAG_CLICKABLE")
+                async with LvContext(w):
+                    w.add_flag("LV_OBJ_FLAG_CLICKABLE")
                 event = literal("LV_EVENT_" + LV_EVENT_MAP[event[3:].upper()])
                 await add_trigger(conf, w, event)
 
@@ -70,7 +78,8 @@ async def generate_triggers():
                 dir = event[9:].upper()
                 dir = {"UP": "TOP", "DOWN": "BOTTOM"}.get(dir, dir)
                 dir = DIRECTIONS.mapper(dir)
-                w.clear_flag("LV_OBJ_FLAG_SCROLLABLE")
+                async with LvContext(w):
+                    w.clear_flag("LV_OBJ_FLAG_SCROLLABLE")
                 selected = literal(
                     f"lv_indev_get_gesture_dir(lv_indev_get_act()) == {dir}"
                 )
@@ -87,7 +96,7 @@ async def generate_triggers():
                     UPDATE_EVENT,
                 )
 
-            await add_on_boot_triggers(w.config.get(CONF_ON_BOOT, ()))
+            await add_on_boot_triggers(w.config.get(CONF_ON_BOOT, ()), w)
 
             # Generate align to directives while we're here
             if align_to := w.config.get(CONF_ALIGN_TO):
@@ -95,7 +104,8 @@ async def generate_triggers():
                 align = literal(align_to[CONF_ALIGN])
                 x = align_to[CONF_X]
                 y = align_to[CONF_Y]
-                lv.obj_align_to(w.obj, target, align, x, y)
+                async with LvContext(w):
+                    lv.obj_align_to(w.obj, target, align, x, y)
 
 
 async def add_trigger(conf, w, *events, is_selected=None):
@@ -108,4 +118,6 @@ async def add_trigger(conf, w, *events, is_selected=None):
     async with LambdaContext(EVENT_ARG, where=tid) as context:
         with LvConditional(is_selected):
             lv_add(trigger.trigger(*value, literal("event")))
-    lv_add(lvgl_static.add_event_cb(w.obj, await context.get_lambda(), *events))
+    # Bindings to widgets on lazy pages are made each time the page is built
+    async with LvContext(w):
+        lv_add(lvgl_static.add_event_cb(w.obj, await context.get_lambda(), *events))
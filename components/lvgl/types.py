@@ -55,6 +55,9 @@ lv_lambda_t = lvgl_ns.class_("LvLambdaType")
 LvCompound = lvgl_ns.class_("LvCompound")
 lv_font_t = cg.global_ns.class_("lv_font_t")
 lv_style_t = cg.global_ns.struct("lv_style_t")
+lv_style_const_prop_t = cg.global_ns.struct("lv_style_const_prop_t")
+LvWidgetDesc = lvgl_ns.struct("LvWidgetDesc")
+LvStyleRef = lvgl_ns.struct("LvStyleRef")
 # fake parent class for first class widgets and matrix buttons
 lv_pseudo_button_t = lvgl_ns.class_("LvPseudoButton")
 lv_obj_base_t = cg.global_ns.class_("lv_obj_t", lv_pseudo_button_t)
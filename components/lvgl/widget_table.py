@@ -0,0 +1,198 @@
+"""
+Table driven widget construction. The static part of a widget tree - types, parents,
+styles, flags and label text - is written to const descriptor tables that
+lv_build_widgets() instantiates in one call, instead of a run of statements per
+widget in setup(). Everything else, such as lambdas, groups and triggers, is still
+generated as code after the table has been built.
+"""
+
+import esphome.codegen as cg
+import esphome.config_validation as cv
+from esphome.const import CONF_DEFAULT, CONF_ID, CONF_TEXT
+from esphome.core import ID
+from esphome.helpers import cpp_string_escape
+
+from .defines import (
+    CONF_MAIN,
+    CONF_STYLES,
+    CONF_WIDGETS,
+    LOGGER,
+    OBJ_FLAGS,
+    join_enums,
+    lvgl_ns,
+)
+from .helpers import add_lv_use
+from .lvcode import lv_add, lv_Pvariable
+from .schemas import ALL_STYLES, WIDGET_TYPES, remap_property
+from .styles import SharedStyles
+from .types import LvStyleRef, LvWidgetDesc, lv_obj_t
+from .widgets import WidgetType, collect_parts, styles_used, theme_widget_map
+
+
+def get_selector(part, state):
+    part = "LV_PART_" + part.upper()
+    state = "LV_STATE_" + state.upper()
+    if state == "LV_STATE_DEFAULT":
+        return part
+    if part == "LV_PART_MAIN":
+        return state
+    return str(join_enums((state, part)))
+
+
+def is_static(value):
+    return not isinstance(value, cv.Lambda)
+
+
+def is_table_type(spec: WidgetType, config):
+    """
+    A widget can be built from a table if it is created by a plain lv_<type>_create()
+    call. A custom on_create() then runs after the table is built, so is only allowed
+    when that cannot reorder the widget's children.
+    """
+    cls = type(spec)
+    if spec.is_compound():
+        return False
+    if (
+        cls.create_to_code is not WidgetType.create_to_code
+        or cls.obj_creator is not WidgetType.obj_creator
+    ):
+        return False
+    return cls.on_create is WidgetType.on_create or CONF_WIDGETS not in config
+
+
+class WidgetTable:
+    """
+    Tracks the widgets already created by a table, so create_to_code() only generates
+    the rest of their setup.
+    """
+
+    enabled = False
+    prebuilt = {}
+    tables = 0
+    total = 0
+
+    @classmethod
+    def get(cls, wid):
+        return cls.prebuilt.get(str(wid))
+
+    @classmethod
+    def report(cls):
+        if cls.enabled and cls.total:
+            LOGGER.info(
+                "Widget tables: %d of %d widgets built from %d tables",
+                len(cls.prebuilt),
+                cls.total,
+                cls.tables,
+            )
+
+
+async def widget_row(spec: WidgetType, config, parent_index, style_refs):
+    """
+    Create the descriptor row for a widget, adding its styles to style_refs
+    :return: The row initialiser
+    """
+    wid = config[CONF_ID]
+    var = lv_Pvariable(lv_obj_t, wid)
+    WidgetTable.prebuilt[str(wid)] = var
+    count = len(style_refs)
+    if theme := theme_widget_map.get(spec.w_type.name):
+        for part, states in theme.items():
+            for state, style in states.items():
+                style_refs.append(f"{{&{style}, {get_selector(part, state)}}}")
+    parts = collect_parts(config)
+    for part, states in parts.items():
+        for state, props in states.items():
+            selector = get_selector(part, state)
+            for style_id in props.get(CONF_STYLES, ()):
+                style_refs.append(f"{{&{style_id}, {selector}}}")
+            if SharedStyles.enabled and (shared := table_style_props(props)):
+                styles_used.update(remap_property(k) for k in shared)
+                style = await SharedStyles.get_var(shared)
+                style_refs.append(f"{{&{style}, {selector}}}")
+    flags = table_flags(parts)
+    text = "nullptr"
+    if (value := static_text(spec, config)) is not None:
+        text = cpp_string_escape(value)
+    return (
+        f"{{&{var}, lv_{spec.lv_name}_create, {parent_index}, "
+        f"{len(style_refs) - count}, {flags[0]}, {flags[1]}, {text}}}"
+    )
+
+
+def static_text(spec: WidgetType, config):
+    """
+    :return: The text of a label, if it is fixed and so can be kept in the table
+    """
+    if spec.name == "label" and isinstance(value := config.get(CONF_TEXT), str):
+        return value
+    return None
+
+
+def table_style_props(props):
+    """
+    The static style properties of a part and state, which are set through a shared
+    style when the widget is built from a table with share_styles enabled. Otherwise
+    they are set as local style properties after the table is built, so keep their
+    precedence over added styles.
+    """
+    return {k: v for k, v in props.items() if k in ALL_STYLES and is_static(v)}
+
+
+def table_flags(parts):
+    """
+    :return: The static flags to add and clear, as C++ expressions
+    """
+    props = parts[CONF_MAIN][CONF_DEFAULT]
+    flags = {k: v for k, v in props.items() if k in OBJ_FLAGS and is_static(v)}
+    adds = [k for k, v in flags.items() if v]
+    clears = [k for k, v in flags.items() if not v]
+    return (
+        join_enums(adds, "LV_OBJ_FLAG_") if adds else "0",
+        join_enums(clears, "LV_OBJ_FLAG_") if clears else "0",
+    )
+
+
+async def build_widget_table(parent, config):
+    """
+    Build the leading run of table-capable children of a widget, with their own
+    leading runs of children, from a single table. Collection stops at the first
+    widget that needs code to create it, so siblings are still created in order.
+    :param parent: The parent Widget
+    :param config: The parent configuration
+    """
+    rows = []
+    style_refs = []
+
+    async def collect(children, parent_index):
+        for child in children:
+            w_type, w_config = next(iter(child.items()))
+            spec = WIDGET_TYPES[w_type]
+            if WidgetTable.get(w_config[CONF_ID]) is not None or not is_table_type(
+                spec, w_config
+            ):
+                return
+            add_lv_use(spec.name)
+            index = len(rows)
+            rows.append(await widget_row(spec, w_config, parent_index, style_refs))
+            await collect(w_config.get(CONF_WIDGETS, ()), index)
+
+    await collect(config.get(CONF_WIDGETS, ()), -1)
+    if not rows:
+        return
+    cg.add_define("USE_LVGL_WIDGET_TABLE")
+    name = f"_lv_widget_table_{WidgetTable.tables}"
+    WidgetTable.tables += 1
+    table = cg.static_const_array(
+        ID(name, True, LvWidgetDesc), cg.RawExpression("{" + ", ".join(rows) + "}")
+    )
+    styles = "nullptr"
+    if style_refs:
+        styles = cg.static_const_array(
+            ID(f"{name}_styles", True, LvStyleRef),
+            cg.RawExpression("{" + ", ".join(style_refs) + "}"),
+        )
+    lv_add(
+        lvgl_ns.lv_build_widgets(
+            table, len(rows), cg.RawExpression(str(styles)), parent.obj
+        )
+    )
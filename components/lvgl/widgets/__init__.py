@@ -12,6 +12,7 @@ from esphome.const import (
     CONF_MAX_VALUE,
     CONF_MIN_VALUE,
     CONF_STATE,
+    CONF_TEXT,
     CONF_TYPE,
 )
 from esphome.core import ID, EsphomeError, TimePeriod
@@ -143,10 +144,15 @@ class WidgetType:
         :param parent: The parent to which it should be attached
         """
 
-        creator = await self.obj_creator(parent, config)
-        add_lv_use(self.name)
-        add_lv_use(*self.get_uses())
+        from ..widget_table import WidgetTable
+
         wid = config[CONF_ID]
+        if WidgetTable.enabled:
+            WidgetTable.total += 1
+            if (var := WidgetTable.get(wid)) is not None:
+                return await self.prebuilt_to_code(var, config)
+        creator = await self.obj_creator(parent, config)
+        add_lv_use(*self.get_lv_uses(config))
         add_line_marks(wid)
         if self.is_compound():
             var = cg.new_Pvariable(wid)
@@ -170,8 +176,28 @@ class WidgetType:
                     else:
                         lv_state = join_enums((state, part))
                     w.add_style(style, lv_state)
-        await set_obj_properties(w, config)
+        await set_obj_properties(w, config, create=True)
+        await add_widgets(w, config)
+        await self.to_code(w, config)
+        return w
+
+    async def prebuilt_to_code(self, var, config: dict) -> "Widget":
+        """
+        Generate the rest of the setup for a widget already created from a table
+        :param var: The widget variable, set by the table
+        :param config: The configuration for the widget
+        """
+        from ..widget_table import static_text
+
+        add_lv_use(*self.get_uses())
+        wid = config[CONF_ID]
+        add_line_marks(wid)
+        await self.on_create(var, config)
+        w = Widget.create(wid, var, self, config)
+        await set_obj_properties(w, config, create=True, prebuilt=True)
         await add_widgets(w, config)
+        if static_text(self, config) is not None:
+            config = {k: v for k, v in config.items() if k != CONF_TEXT}
         await self.to_code(w, config)
         return w
 
@@ -205,6 +231,14 @@ class WidgetType:
         """
         return ()
 
+    def get_lv_uses(self, config: dict):
+        """
+        Get the LVGL features needed to create a widget
+        :param config: Its configuration
+        :return: This widget type and the other widgets it uses
+        """
+        return self.name, *self.get_uses()
+
     def get_max(self, config: dict):
         return sys.maxsize
 
@@ -256,6 +290,8 @@ class Widget:
             self.obj = var
         self.outer = None
         self.move_to_foreground = False
+        # The page variable, if the widget is on a lazily built page
+        self.lazy_page = None
         # Properties for linear equations
         self.slope = None
         self.y_int = None
@@ -467,6 +503,16 @@ async def get_widgets(config: Union[dict, list], id: str = CONF_ID) -> list[Widg
     return [await get_widget_(c[id]) for c in config if id in c]
 
 
+def lazy_condition(w: Widget):
+    """
+    :return: A condition that a widget on a lazily built page currently exists, or None
+    for a widget that always does
+    """
+    if w.lazy_page is None:
+        return None
+    return literal(f"{w.obj} != nullptr")
+
+
 def collect_props(config):
     """
     Collect all properties from a configuration
@@ -513,10 +559,22 @@ def collect_parts(config):
     return parts
 
 
-async def set_obj_properties(w: Widget, config):
-    """Generate a list of C++ statements to apply properties to an lv_obj_t"""
+async def set_obj_properties(
+    w: Widget, config, create: bool = False, prebuilt: bool = False
+):
+    """
+    Generate a list of C++ statements to apply properties to an lv_obj_t
+    :param w: The widget
+    :param config: Its configuration
+    :param create: True when the widget is being created, so static style properties
+        may be applied through a shared style rather than a local one
+    :param prebuilt: True when the widget was created from a table, which has already
+        added its styles and static flags, and its static style properties as a shared
+        style if share_styles is enabled
+    """
 
     from ..schemas import ALL_STYLES, OBJ_PROPERTIES, remap_property
+    from ..styles import SharedStyles
 
     if layout := config.get(CONF_LAYOUT):
         layout_type: str = layout[CONF_TYPE]
@@ -562,11 +620,27 @@ async def set_obj_properties(w: Widget, config):
                 lv_state = literal(state)
             else:
                 lv_state = join_enums((state, part))
-            for style_id in props.get(CONF_STYLES, ()):
-                w.add_style(style_id, lv_state)
-            for prop, value in {
-                k: v for k, v in props.items() if k in ALL_STYLES
-            }.items():
+            style_props = {k: v for k, v in props.items() if k in ALL_STYLES}
+            if not prebuilt:
+                for style_id in props.get(CONF_STYLES, ()):
+                    w.add_style(style_id, lv_state)
+            elif SharedStyles.enabled:
+                style_props = {
+                    k: v for k, v in style_props.items() if isinstance(v, cv.Lambda)
+                }
+            if create and SharedStyles.enabled:
+                shared = {
+                    k: v
+                    for k, v in style_props.items()
+                    if not isinstance(v, cv.Lambda)
+                }
+                if shared:
+                    styles_used.update(remap_property(k) for k in shared)
+                    w.add_style(await SharedStyles.get_var(shared), lv_state)
+                    style_props = {
+                        k: v for k, v in style_props.items() if k not in shared
+                    }
+            for prop, value in style_props.items():
                 if isinstance(ALL_STYLES[prop], LValidator):
                     value = await ALL_STYLES[prop].process(value)
                 prop_r = remap_property(prop)
@@ -581,6 +655,8 @@ async def set_obj_properties(w: Widget, config):
     for prop, value in {k: v for k, v in props.items() if k in OBJ_FLAGS}.items():
         if isinstance(value, cv.Lambda):
             lambs[prop] = value
+        elif prebuilt:
+            continue
         elif value:
             flag_set.add(prop)
         else:
@@ -634,6 +710,10 @@ async def add_widgets(parent: Widget, config: dict):
     :param config: The configuration
     :return:
     """
+    from ..widget_table import WidgetTable, build_widget_table
+
+    if WidgetTable.enabled:
+        await build_widget_table(parent, config)
     for w in config.get(CONF_WIDGETS, ()):
         w_type, w_cnfig = next(iter(w.items()))
         await widget_to_code(w_cnfig, w_type, parent.obj)
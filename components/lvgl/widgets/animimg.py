@@ -1,18 +1,38 @@
+import logging
+
 from esphome import automation
+import esphome.codegen as cg
 import esphome.config_validation as cv
-from esphome.const import CONF_DURATION, CONF_ID
+from esphome.const import CONF_DURATION, CONF_FILE, CONF_ID, CONF_RESIZE
+from esphome.core import CORE, Lambda
 
 from ..automation import action_to_code
 from ..defines import CONF_AUTO_START, CONF_MAIN, CONF_REPEAT_COUNT, CONF_SRC
+from ..frames import (
+    ENCODING_DELTA,
+    FRAME_ENCODINGS,
+    bgra_to_rgb565a8,
+    encode_frames,
+    pack_words,
+)
 from ..helpers import lvgl_components_required
 from ..lv_validation import lv_image_list, lv_milliseconds
-from ..lvcode import lv
+from ..lvcode import lv, lv_add
 from ..types import LvType, ObjUpdateAction
 from . import Widget, WidgetType, get_widgets
 from .img import CONF_IMAGE
 from .label import CONF_LABEL
 
+_LOGGER = logging.getLogger(__name__)
+
 CONF_ANIMIMG = "animimg"
+CONF_ENCODING = "encoding"
+CONF_FRAME_DATA_ID = "frame_data_id"
+CONF_FRAME_DELAYS_ID = "frame_delays_id"
+CONF_FRAME_OFFSETS_ID = "frame_offsets_id"
+
+# Global flag – add the #include once
+_frame_player_include_added = False
 
 
 def lv_repeat_count(value):
@@ -27,12 +47,40 @@ ANIMIMG_BASE_SCHEMA = cv.Schema(
         cv.Optional(CONF_AUTO_START, default=True): cv.boolean,
     }
 )
+
+
+def validate_animimg_source(config):
+    """
+    Frames come either from a list of images, or from one animated image file
+    stored as a keyframe plus deltas and played by frame_player.h.
+    """
+    if (CONF_SRC in config) == (CONF_FILE in config):
+        raise cv.Invalid("Specify exactly one of 'src' or 'file'.")
+    if CONF_SRC in config:
+        if CONF_DURATION not in config:
+            raise cv.Invalid("'duration' is required with 'src'.", [CONF_DURATION])
+        for key in (CONF_RESIZE, CONF_ENCODING):
+            if key in config:
+                raise cv.Invalid(f"'{key}' requires 'file'.", [key])
+    elif isinstance(config.get(CONF_DURATION), Lambda):
+        raise cv.Invalid(
+            "'duration' must be a fixed time with 'file'.", [CONF_DURATION]
+        )
+    return config
+
+
 ANIMIMG_SCHEMA = ANIMIMG_BASE_SCHEMA.extend(
     {
-        cv.Required(CONF_DURATION): lv_milliseconds,
-        cv.Required(CONF_SRC): lv_image_list,
+        cv.Optional(CONF_DURATION): lv_milliseconds,
+        cv.Optional(CONF_SRC): lv_image_list,
+        cv.Optional(CONF_FILE): cv.file_,
+        cv.Optional(CONF_RESIZE): cv.dimensions,
+        cv.Optional(CONF_ENCODING): cv.one_of(*FRAME_ENCODINGS, upper=True),
+        cv.GenerateID(CONF_FRAME_DATA_ID): cv.declare_id(cg.uint32),
+        cv.GenerateID(CONF_FRAME_OFFSETS_ID): cv.declare_id(cg.uint32),
+        cv.GenerateID(CONF_FRAME_DELAYS_ID): cv.declare_id(cg.uint16),
     }
-)
+).add_extra(validate_animimg_source)
 
 ANIMIMG_MODIFY_SCHEMA = ANIMIMG_BASE_SCHEMA.extend(
     {
@@ -44,6 +92,33 @@ ANIMIMG_MODIFY_SCHEMA = ANIMIMG_BASE_SCHEMA.extend(
 lv_animimg_t = LvType("lv_animimg_t")
 
 
+def load_animation_frames(path, resize=None):
+    """
+    Read every frame of an animated image (GIF, WebP, APNG) as RGB565A8
+    :return: The frames, their size and how long to show each frame in milliseconds
+    """
+    from PIL import Image
+
+    with Image.open(path) as image:
+        width, height = image.size
+        if resize:
+            ratio = min(resize[0] / width, resize[1] / height)
+            width, height = max(int(width * ratio), 1), max(int(height * ratio), 1)
+        frames = []
+        delays = []
+        for index in range(getattr(image, "n_frames", 1)):
+            image.seek(index)
+            delays.append(image.info.get("duration", 100) or 100)
+            # PIL composites each frame onto its predecessors
+            frame = image.convert("RGBA").resize((width, height))
+            frames.append(
+                bgra_to_rgb565a8(
+                    frame.tobytes("raw", "BGRA"), width, height, premultiplied=False
+                )
+            )
+    return frames, width, height, delays
+
+
 class AnimimgType(WidgetType):
     def __init__(self):
         super().__init__(
@@ -57,6 +132,9 @@ class AnimimgType(WidgetType):
     async def to_code(self, w: Widget, config):
         lvgl_components_required.add(CONF_IMAGE)
         lvgl_components_required.add(CONF_ANIMIMG)
+        if CONF_FILE in config:
+            await self.file_to_code(w, config)
+            return
         if srcs := config.get(CONF_SRC):
             srcs = await lv_image_list.process(srcs)
             lv.animimg_set_src(w.obj, srcs)
@@ -67,6 +145,55 @@ class AnimimgType(WidgetType):
         if config[CONF_AUTO_START]:
             lv.animimg_start(w.obj)
 
+    async def file_to_code(self, w: Widget, config):
+        """Embed an animated image file as a frame sequence played by frame_player.h."""
+        global _frame_player_include_added
+
+        frames, width, height, delays = load_animation_frames(
+            CORE.relative_config_path(config[CONF_FILE]), config.get(CONF_RESIZE)
+        )
+        if duration := config.get(CONF_DURATION):
+            # Scale the file's timing to the given duration
+            scale = duration.total_milliseconds / sum(delays)
+            delays = [round(delay * scale) for delay in delays]
+        delays = [min(max(delay, 1), 0xFFFF) for delay in delays]
+        encoding = config.get(CONF_ENCODING, ENCODING_DELTA)
+        data, offsets = encode_frames(frames, encoding)
+        _LOGGER.info(
+            "Animation %s: %d frames at %dx%d, %d bytes %s encoded (%d raw)",
+            config[CONF_FILE],
+            len(frames),
+            width,
+            height,
+            len(data),
+            encoding.lower(),
+            sum(len(f) for f in frames),
+        )
+
+        if not _frame_player_include_added:
+            _frame_player_include_added = True
+            cg.add_global(
+                cg.RawStatement('#include "esphome/components/lvgl/frame_player.h"')
+            )
+
+        data_arr = cg.progmem_array(config[CONF_FRAME_DATA_ID], pack_words(data))
+        offsets_arr = cg.progmem_array(config[CONF_FRAME_OFFSETS_ID], offsets)
+        do_auto_start = "true" if config[CONF_AUTO_START] else "false"
+        lv_add(
+            cg.RawStatement(
+                f"""
+    esphome::lvgl::frame_player_set_repeat_count(esphome::lvgl::frame_player_init({w.obj}, (const uint8_t *) {data_arr}, {offsets_arr}, {len(frames)}, {width}, {height}, esphome::lvgl::FRAME_ENCODING_{encoding}, {delays[0]}, false, {do_auto_start}), {config[CONF_REPEAT_COUNT]});"""
+            )
+        )
+        # Frames with their own delays, e.g. a long hold on the first one, need a delay table
+        if len(set(delays)) > 1:
+            delays_arr = cg.progmem_array(config[CONF_FRAME_DELAYS_ID], delays)
+            lv_add(
+                cg.RawStatement(
+                    f"esphome::lvgl::frame_player_set_frame_delays(esphome::lvgl::frame_player_get({w.obj}), {delays_arr});"
+                )
+            )
+
     def get_uses(self):
         return "img", CONF_IMAGE, CONF_LABEL
 
@@ -88,7 +215,14 @@ async def animimg_start(config, action_id, template_arg, args):
     widget = await get_widgets(config)
 
     async def do_start(w: Widget):
-        lv.animimg_start(w.obj)
+        if w.config and CONF_FILE in w.config:
+            lv_add(
+                cg.RawStatement(
+                    f"esphome::lvgl::frame_player_start(esphome::lvgl::frame_player_get({w.obj}));"
+                )
+            )
+        else:
+            lv.animimg_start(w.obj)
 
     return await action_to_code(widget, do_start, action_id, template_arg, args)
 
@@ -107,6 +241,13 @@ async def animimg_stop(config, action_id, template_arg, args):
     widget = await get_widgets(config)
 
     async def do_stop(w: Widget):
-        lv.animimg_stop(w.obj)
+        if w.config and CONF_FILE in w.config:
+            lv_add(
+                cg.RawStatement(
+                    f"esphome::lvgl::frame_player_stop(esphome::lvgl::frame_player_get({w.obj}));"
+                )
+            )
+        else:
+            lv.animimg_stop(w.obj)
 
     return await action_to_code(widget, do_stop, action_id, template_arg, args)
@@ -6,7 +6,7 @@ This module implements the Lottie animation widget for LVGL 9.4.
 Lottie is a library for parsing Adobe After Effects animations exported as JSON
 using the Bodymovin plugin and rendering them natively.
 
-Requirements:
+Requirements (enabled automatically, and not needed for pre-rendered animations):
 - LV_USE_LOTTIE must be enabled
 - LV_USE_THORVG_INTERNAL must be enabled
 - LV_USE_VECTOR_GRAPHIC must be enabled
@@ -21,6 +21,7 @@ Usage in ESPHome YAML:
         height: 200
         loop: true
         auto_start: true
+        max_fps: 30                     # Optional cap on the render rate (default 60)
 
     Method 2 - Embedded in firmware (auto-detects size from JSON):
     - lottie:
@@ -29,6 +30,22 @@ Usage in ESPHome YAML:
         loop: true                       # width/height auto-detected from JSON
         auto_start: true
 
+    Method 4 - Pre-rendered at build time (no vector rendering on the device):
+    - lottie:
+        id: my_animation
+        file: "animations/loading.json"
+        width: 64
+        height: 64
+        max_fps: 25                      # Frame rate of the pre-rendered sequence
+        prerender: true                  # Requires the rlottie-python package
+        encoding: delta                  # raw, rle or delta (default)
+
+    Embedded files are minified at build time (whitespace and metadata removed):
+    - lottie:
+        file: "animations/loading.json"
+        precision: 2                     # Optionally round numbers to 2 decimals
+        compress: true                   # Deflate in flash, inflated once into PSRAM
+
     Method 3 - Embedded with resize (render at custom size for screen layout):
     - lottie:
         id: my_animation
@@ -43,30 +60,61 @@ Actions:
     - lvgl.lottie.stop: my_animation
     - lvgl.lottie.pause: my_animation
 
-Note: ThorVG parsing requires a large stack (32KB+). On ESP32, the loading is
-deferred to a FreeRTOS task with stack allocated in PSRAM to avoid stack overflow.
+Note: ThorVG parsing requires a large stack (32KB+). On ESP32, loading and frame
+rendering run on a shared pool of render workers (lvgl: render_workers, render_core)
+whose stacks are allocated in PSRAM, so widgets do not each need their own task.
 """
 
 import json
+import logging
 from pathlib import Path
+import zlib
 
 from esphome import automation, codegen as cg, config_validation as cv
 from esphome.const import CONF_FILE, CONF_HEIGHT, CONF_ID, CONF_RAW_DATA_ID, CONF_WIDTH
 from esphome.core import CORE
+from esphome.cpp_generator import MockObj
 
 from ..automation import action_to_code
 from ..defines import CONF_AUTO_START, CONF_MAIN, CONF_SRC, literal
+from ..frames import (
+    ENCODING_DELTA,
+    FRAME_ENCODINGS,
+    bgra_to_rgb565a8,
+    encode_frames,
+    pack_words,
+)
 from ..helpers import add_lv_use
 from ..lv_validation import size
-from ..lvcode import lv
+from ..lvcode import lv, lv_add, lv_expr
 from ..types import LvType, ObjUpdateAction
 from . import Widget, WidgetType, get_widgets
+from .img import CONF_IMAGE
 
 # Global flag to track if include has been added
 _lottie_include_added = False
+_frame_player_include_added = False
+
+_LOGGER = logging.getLogger(__name__)
 
 CONF_LOTTIE = "lottie"
+CONF_COMPRESS = "compress"
+CONF_ENCODING = "encoding"
+CONF_FRAME_DATA_ID = "frame_data_id"
+CONF_FRAME_OFFSETS_ID = "frame_offsets_id"
 CONF_LOOP = "loop"
+CONF_MAX_FPS = "max_fps"
+CONF_MINIFY = "minify"
+CONF_PRECISION = "precision"
+CONF_PRERENDER = "prerender"
+
+# Keys the player never reads
+LOTTIE_UNUSED_KEYS = ("meta",)
+# Layer/shape names and match names, only read by expressions, which look layers and
+# effects up by name
+LOTTIE_NAME_KEYS = ("mn", "nm")
+# Key of a property's expression source
+LOTTIE_EXPRESSION_KEY = "x"
 CONF_LOTTIE_WIDTH = "lottie_width"
 CONF_LOTTIE_HEIGHT = "lottie_height"
 
@@ -137,6 +185,84 @@ def validate_lottie_source(config):
     return config
 
 
+def validate_prerender(config):
+    """Pre-rendering needs an embedded file, a pixel size and the rlottie renderer."""
+    if not config[CONF_PRERENDER]:
+        return config
+    if CONF_FILE not in config:
+        raise cv.Invalid("'prerender' requires an embedded 'file'.", [CONF_PRERENDER])
+    for key in (CONF_WIDTH, CONF_HEIGHT):
+        if key in config and not isinstance(config[key], int):
+            raise cv.Invalid("'prerender' requires a size in pixels.", [key])
+    try:
+        import rlottie_python  # noqa: F401 pylint: disable=unused-import
+    except ImportError as e:
+        raise cv.Invalid(
+            "'prerender' requires the rlottie-python package: pip install rlottie-python",
+            [CONF_PRERENDER],
+        ) from e
+    return config
+
+
+def minify_lottie(data, precision=None):
+    """
+    Compact Lottie JSON for embedding: drop unused keys and whitespace, and optionally
+    round numbers. Names are only dropped when the animation has no expressions.
+    :param data: The JSON file contents
+    :param precision: Decimal places to round numbers to, or None to keep them as is
+    """
+
+    def has_expressions(node):
+        if isinstance(node, dict):
+            # Keyframe easing also has "x" keys, but their values are not strings
+            if isinstance(node.get(LOTTIE_EXPRESSION_KEY), str):
+                return True
+            return any(has_expressions(v) for v in node.values())
+        if isinstance(node, list):
+            return any(has_expressions(v) for v in node)
+        return False
+
+    def walk(node):
+        if isinstance(node, dict):
+            return {k: walk(v) for k, v in node.items() if k not in unused}
+        if isinstance(node, list):
+            return [walk(v) for v in node]
+        if isinstance(node, float) and precision is not None:
+            node = round(node, precision)
+            return int(node) if node.is_integer() else node
+        return node
+
+    document = json.loads(data)
+    unused = LOTTIE_UNUSED_KEYS
+    if not has_expressions(document):
+        unused += LOTTIE_NAME_KEYS
+    return json.dumps(
+        walk(document), separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def prerender_frames(file_path, width, height, max_fps):
+    """
+    Render a Lottie animation to RGB565A8 frames.
+    :return: The frames and the interval between them in milliseconds
+    """
+    from rlottie_python import LottieAnimation
+
+    anim = LottieAnimation.from_file(file_path)
+    total = anim.lottie_animation_get_totalframe()
+    source_fps = anim.lottie_animation_get_framerate() or max_fps
+    fps = min(source_fps, max_fps)
+    count = min(max(1, round(total * fps / source_fps)), 0xFFFF)
+    frames = []
+    for i in range(count):
+        frame_num = min(int(i * source_fps / fps), total - 1)
+        buffer = anim.lottie_animation_render(
+            frame_num=frame_num, width=width, height=height
+        )
+        frames.append(bgra_to_rgb565a8(buffer, width, height))
+    return frames, max(1, round(1000 / fps))
+
+
 LOTTIE_SCHEMA = cv.Schema(
     {
         cv.Optional(CONF_WIDTH): size,
@@ -145,9 +271,19 @@ LOTTIE_SCHEMA = cv.Schema(
         cv.Optional(CONF_FILE): lottie_file_validator,
         cv.Optional(CONF_LOOP, default=True): cv.boolean,
         cv.Optional(CONF_AUTO_START, default=True): cv.boolean,
+        cv.Optional(CONF_MAX_FPS, default=60): cv.int_range(min=1, max=60),
+        cv.Optional(CONF_MINIFY, default=True): cv.boolean,
+        cv.Optional(CONF_PRECISION): cv.int_range(min=0, max=6),
+        cv.Optional(CONF_COMPRESS, default=False): cv.boolean,
+        cv.Optional(CONF_PRERENDER, default=False): cv.boolean,
+        cv.Optional(CONF_ENCODING, default=ENCODING_DELTA): cv.one_of(
+            *FRAME_ENCODINGS, upper=True
+        ),
         cv.GenerateID(CONF_RAW_DATA_ID): cv.declare_id(cg.uint8),
+        cv.GenerateID(CONF_FRAME_DATA_ID): cv.declare_id(cg.uint32),
+        cv.GenerateID(CONF_FRAME_OFFSETS_ID): cv.declare_id(cg.uint32),
     }
-).add_extra(validate_lottie_source)
+).add_extra(validate_lottie_source).add_extra(validate_prerender)
 
 LOTTIE_MODIFY_SCHEMA = cv.Schema(
     {
@@ -170,14 +306,21 @@ class LottieType(WidgetType):
     def get_uses(self):
         return ("LOTTIE", "THORVG_INTERNAL", "VECTOR_GRAPHIC")
 
+    def get_lv_uses(self, config: dict):
+        # A pre-rendered animation is a plain image, without any vector support
+        if config.get(CONF_PRERENDER):
+            return "img", CONF_IMAGE
+        return super().get_lv_uses(config)
+
+    async def obj_creator(self, parent: MockObj, config: dict):
+        if config.get(CONF_PRERENDER):
+            return lv_expr.call("image_create", parent)
+        return await super().obj_creator(parent, config)
+
     async def to_code(self, w: Widget, config):
         global _lottie_include_added
 
-        add_lv_use("LOTTIE")
-        add_lv_use("THORVG_INTERNAL")
-        add_lv_use("VECTOR_GRAPHIC")
-
-        from ..lvcode import lv_obj, lv_add
+        from ..lvcode import lv_obj
 
         # Get dimensions - user-specified override auto-detected from JSON
         if CONF_WIDTH in config and CONF_HEIGHT in config:
@@ -196,34 +339,95 @@ class LottieType(WidgetType):
         # Note: Widget visibility during async load is managed by lottie_loader.h
         # (user's 'hidden' config is saved and restored after rendering)
 
-        # Add include for lottie loader helper (once)
-        if not _lottie_include_added:
-            _lottie_include_added = True
-            cg.add_global(cg.RawStatement('#include "esphome/components/lvgl/lottie_loader.h"'))
-
         # Get loop, auto_start, and hidden config
         do_loop = "true" if config.get(CONF_LOOP, True) else "false"
         do_auto_start = "true" if config.get(CONF_AUTO_START, True) else "false"
         user_wants_hidden = "true" if config.get("hidden", False) else "false"
+        max_fps = config.get(CONF_MAX_FPS, 60)
+
+        if config.get(CONF_PRERENDER):
+            await self.prerender_to_code(
+                w, config, width, height, do_loop, do_auto_start
+            )
+            return
+
+        add_lv_use("LOTTIE")
+        add_lv_use("THORVG_INTERNAL")
+        add_lv_use("VECTOR_GRAPHIC")
+
+        # Add include for lottie loader helper (once)
+        if not _lottie_include_added:
+            _lottie_include_added = True
+            cg.add_global(cg.RawStatement('#include "esphome/components/lvgl/lottie_loader.h"'))
 
         # Use lottie_init() which handles PSRAM allocation, screen events, and task launch
         if src := config.get(CONF_SRC):
             # File from filesystem
             lv_add(cg.RawStatement(f"""
-    esphome::lvgl::lottie_init({w.obj}, nullptr, 0, "{src}", {width}, {height}, {do_loop}, {do_auto_start}, {user_wants_hidden});"""))
+    esphome::lvgl::lottie_init({w.obj}, nullptr, 0, "{src}", {width}, {height}, {do_loop}, {do_auto_start}, {user_wants_hidden}, {max_fps});"""))
         elif file_path := config.get(CONF_FILE):
             # Embedded data
             with open(file_path, "rb") as f:
                 json_data = f.read()
-
-            # Add null terminator
-            json_data_with_null = json_data + b'\x00'
+            original_size = len(json_data)
+            if config[CONF_MINIFY]:
+                json_data = minify_lottie(json_data, config.get(CONF_PRECISION))
+
+            if config[CONF_COMPRESS]:
+                # Inflated on the device with the ROM tinfl, which adds the NUL
+                cg.add_define("USE_LVGL_LOTTIE_DEFLATE")
+                embedded = zlib.compress(json_data, 9)
+                compressed_size = len(embedded)
+            else:
+                # Add null terminator
+                embedded = json_data + b"\x00"
+                compressed_size = 0
+            _LOGGER.debug(
+                "Lottie %s: %d bytes embedded (%d original, %d minified)",
+                file_path,
+                len(embedded),
+                original_size,
+                len(json_data),
+            )
 
             raw_data_id = config[CONF_RAW_DATA_ID]
-            prog_arr = cg.progmem_array(raw_data_id, list(json_data_with_null))
+            prog_arr = cg.progmem_array(raw_data_id, list(embedded))
 
             lv_add(cg.RawStatement(f"""
-    esphome::lvgl::lottie_init({w.obj}, {prog_arr}, {len(json_data)}, nullptr, {width}, {height}, {do_loop}, {do_auto_start}, {user_wants_hidden});"""))
+    esphome::lvgl::lottie_init({w.obj}, {prog_arr}, {len(json_data)}, nullptr, {width}, {height}, {do_loop}, {do_auto_start}, {user_wants_hidden}, {max_fps}, {compressed_size});"""))
+
+    async def prerender_to_code(
+        self, w: Widget, config, width, height, do_loop, do_auto_start
+    ):
+        """Embed the animation as a pre-rendered frame sequence played by frame_player.h."""
+        global _frame_player_include_added
+
+        frames, frame_ms = prerender_frames(
+            config[CONF_FILE], width, height, config[CONF_MAX_FPS]
+        )
+        encoding = config[CONF_ENCODING]
+        data, offsets = encode_frames(frames, encoding)
+        _LOGGER.info(
+            "Lottie %s: pre-rendered %d frames at %dx%d, %d bytes %s encoded (%d raw)",
+            config[CONF_FILE],
+            len(frames),
+            width,
+            height,
+            len(data),
+            encoding.lower(),
+            sum(len(f) for f in frames),
+        )
+
+        if not _frame_player_include_added:
+            _frame_player_include_added = True
+            cg.add_global(
+                cg.RawStatement('#include "esphome/components/lvgl/frame_player.h"')
+            )
+
+        data_arr = cg.progmem_array(config[CONF_FRAME_DATA_ID], pack_words(data))
+        offsets_arr = cg.progmem_array(config[CONF_FRAME_OFFSETS_ID], offsets)
+        lv_add(cg.RawStatement(f"""
+    esphome::lvgl::frame_player_init({w.obj}, (const uint8_t *) {data_arr}, {offsets_arr}, {len(frames)}, {width}, {height}, esphome::lvgl::FRAME_ENCODING_{encoding}, {frame_ms}, {do_loop}, {do_auto_start});"""))
 
 
 lottie_spec = LottieType()
@@ -244,7 +448,14 @@ async def lottie_start(config, action_id, template_arg, args):
     widget = await get_widgets(config)
 
     async def do_start(w: Widget):
-        lv.anim_start(lv.lottie_get_anim(w.obj))
+        if w.config and w.config.get(CONF_PRERENDER):
+            lv_add(
+                cg.RawStatement(
+                    f"esphome::lvgl::frame_player_start(esphome::lvgl::frame_player_get({w.obj}));"
+                )
+            )
+        else:
+            lv.anim_start(lv.lottie_get_anim(w.obj))
 
     return await action_to_code(widget, do_start, action_id, template_arg, args)
 
@@ -264,7 +475,14 @@ async def lottie_stop(config, action_id, template_arg, args):
     widget = await get_widgets(config)
 
     async def do_stop(w: Widget):
-        lv.anim_delete(w.obj, literal("NULL"))
+        if w.config and w.config.get(CONF_PRERENDER):
+            lv_add(
+                cg.RawStatement(
+                    f"esphome::lvgl::frame_player_stop(esphome::lvgl::frame_player_get({w.obj}));"
+                )
+            )
+        else:
+            lv.anim_delete(w.obj, literal("NULL"))
 
     return await action_to_code(widget, do_stop, action_id, template_arg, args)
 
@@ -284,6 +502,13 @@ async def lottie_pause(config, action_id, template_arg, args):
     widget = await get_widgets(config)
 
     async def do_pause(w: Widget):
-        lv.anim_delete(w.obj, literal("NULL"))
+        if w.config and w.config.get(CONF_PRERENDER):
+            lv_add(
+                cg.RawStatement(
+                    f"esphome::lvgl::frame_player_stop(esphome::lvgl::frame_player_get({w.obj}));"
+                )
+            )
+        else:
+            lv.anim_delete(w.obj, literal("NULL"))
 
     return await action_to_code(widget, do_pause, action_id, template_arg, args)
@@ -1,7 +1,10 @@
+import re
+
 from esphome import automation, codegen as cg
 from esphome.automation import Trigger
 import esphome.config_validation as cv
 from esphome.const import CONF_ID, CONF_PAGES, CONF_TIME, CONF_TRIGGER_ID
+from esphome.core import CORE, Lambda
 from esphome.cpp_generator import MockObj, TemplateArguments
 
 from ..defines import (
@@ -10,6 +13,7 @@ from ..defines import (
     CONF_PAGE,
     CONF_PAGE_WRAP,
     CONF_SKIP,
+    LOGGER,
     LV_ANIM,
     literal,
 )
@@ -19,6 +23,7 @@ from ..lvcode import (
     LVGL_COMP_ARG,
     LambdaContext,
     ReturnStatement,
+    SourceFile,
     add_line_marks,
     lv_add,
     lvgl_comp,
@@ -33,16 +38,23 @@ from . import (
     get_widgets,
     set_obj_properties,
     wait_for_widgets,
+    widget_map,
 )
 
+CONF_LAZY = "lazy"
 CONF_ON_LOAD = "on_load"
 CONF_ON_UNLOAD = "on_unload"
+CONF_UNLOAD = "unload"
 
 PAGE_ARG = "_page"
 
 PAGE_SCHEMA = cv.Schema(
     {
         cv.Optional(CONF_SKIP, default=False): lv_bool,
+        # Create the page's widgets when it is first shown, rather than at boot
+        cv.Optional(CONF_LAZY, default=False): cv.boolean,
+        # Also delete them again when another page is shown, implies lazy
+        cv.Optional(CONF_UNLOAD, default=False): cv.boolean,
         cv.Optional(CONF_ON_LOAD): automation.validate_automation(
             {
                 cv.GenerateID(CONF_TRIGGER_ID): cv.declare_id(Trigger.template()),
@@ -166,13 +178,25 @@ async def add_pages(lv_component, config):
     for pconf in config.get(CONF_PAGES, ()):
         id = pconf[CONF_ID]
         skip = pconf[CONF_SKIP]
-        var = cg.new_Pvariable(id, skip)
-        page = Widget.create(id, var, page_spec, pconf)
-        lv_add(lv_component.add_page(var))
-        # Set outer config first
-        await set_obj_properties(page, config)
-        await set_obj_properties(page, pconf)
-        await add_widgets(page, pconf)
+        with SourceFile(f"page_{id}"):
+            var = cg.new_Pvariable(id, skip)
+            page = Widget.create(id, var, page_spec, pconf)
+            lv_add(lv_component.add_page(var))
+            # Set outer config first
+            await set_obj_properties(page, config)
+            await set_obj_properties(page, pconf)
+            if not (pconf[CONF_LAZY] or pconf[CONF_UNLOAD]):
+                await add_widgets(page, pconf)
+                continue
+            existing = set(widget_map)
+            async with LambdaContext(where=id) as builder:
+                await add_widgets(page, pconf)
+            lv_add(var.set_builder(await builder.get_lambda(), pconf[CONF_UNLOAD]))
+            for w in [w for k, w in widget_map.items() if k not in existing]:
+                w.lazy_page = var
+                # Only widget pointers can be cleared, not those inside other objects
+                if re.fullmatch(r"\w+(->obj)?", str(w.obj)):
+                    lv_add(var.add_widget(MockObj(f"&{w.obj}")))
 
 
 async def generate_page_triggers(config):
@@ -191,3 +215,35 @@ async def generate_page_triggers(config):
                         literal(f"LV_EVENT_SCREEN_{ev[3:].upper()}_START"),
                     )
                 )
+
+
+def find_lambda_ids(node, found):
+    """
+    Collect the ids used by all lambdas in a configuration
+    """
+    if isinstance(node, dict):
+        for value in node.values():
+            find_lambda_ids(value, found)
+    elif isinstance(node, (list, tuple)):
+        for value in node:
+            find_lambda_ids(value, found)
+    elif isinstance(node, Lambda):
+        found.update(str(x) for x in node.requires_ids)
+
+
+def warn_lazy_lambdas():
+    """
+    Warn about lambdas using widgets on lazy pages, since those are null until the
+    page is first shown, and again after it is unloaded. Must be done after all
+    widgets are created.
+    """
+    used = set()
+    find_lambda_ids(CORE.config, used)
+    for name, w in widget_map.items():
+        if w.lazy_page is not None and str(name) in used:
+            LOGGER.warning(
+                "Widget %s is on a lazy page, so is null in lambdas while the page"
+                " is not built. Check id(%s) != nullptr before using it",
+                name,
+                name,
+            )
@@ -2,8 +2,9 @@
 LVGL 9.4 SVG Widget for ESPHome
 
 Renders static SVG images using the ThorVG vector engine built into LVGL 9.4.
-The SVG is rasterised once (at the requested size) in a FreeRTOS task with a
-64 KB PSRAM stack, then displayed via an lv_canvas widget.
+The SVG is rasterised once (at the requested size) on the shared render worker
+pool, then displayed via an lv_canvas widget. Rasters of SVGs on pages that are
+not shown can be kept for reuse with the lvgl `svg_cache_size` option.
 
 Requirements:
 - LV_USE_THORVG_INTERNAL must be enabled
@@ -32,10 +33,19 @@ Usage in ESPHome YAML:
         width: 64                  # Render at 64x64 instead
         height: 64
 
+    Method 4 - Pre-rendered at build time (no ThorVG work on the device):
+    - svg:
+        id: my_icon
+        file: "icons/home.svg"
+        prerender: true            # Requires the resvg-py and pillow packages
+
 Note: ThorVG rendering requires a large stack (32 KB+). The rendering is
-deferred to a FreeRTOS task with stack allocated in PSRAM to avoid overflow.
+deferred to a render pool worker with its stack allocated in PSRAM to avoid
+overflow.
 """
 
+import io
+import logging
 import re
 from pathlib import Path
 
@@ -44,16 +54,23 @@ from esphome.const import CONF_FILE, CONF_HEIGHT, CONF_ID, CONF_RAW_DATA_ID, CON
 from esphome.core import CORE
 
 from ..defines import CONF_MAIN, CONF_SRC, literal
+from ..frames import ENCODING_RAW, bgra_to_rgb565a8, encode_frames, pack_words
 from ..helpers import add_lv_use
 from ..lv_validation import size
 from ..lvcode import lv_obj
 from ..types import LvType, lv_obj_t
 from . import Widget, WidgetType
 
-# Global flag – add the #include once
+_LOGGER = logging.getLogger(__name__)
+
+# Global flags – add each #include once
 _svg_include_added = False
+_frame_player_include_added = False
 
 CONF_SVG = "svg"
+CONF_PRERENDER = "prerender"
+CONF_FRAME_DATA_ID = "frame_data_id"
+CONF_FRAME_OFFSETS_ID = "frame_offsets_id"
 
 lv_canvas_t = LvType("lv_canvas_t")
 
@@ -167,15 +184,54 @@ def validate_svg_source(config):
     return config
 
 
+def validate_prerender(config):
+    """Pre-rendering needs an embedded file, a pixel size and the resvg renderer."""
+    if not config[CONF_PRERENDER]:
+        return config
+    if CONF_FILE not in config:
+        raise cv.Invalid("'prerender' requires an embedded 'file'.", [CONF_PRERENDER])
+    for key in (CONF_WIDTH, CONF_HEIGHT):
+        if key in config and not isinstance(config[key], int):
+            raise cv.Invalid("'prerender' requires a size in pixels.", [key])
+    try:
+        import PIL  # noqa: F401 pylint: disable=unused-import
+        import resvg_py  # noqa: F401 pylint: disable=unused-import
+    except ImportError as e:
+        raise cv.Invalid(
+            "'prerender' requires the resvg-py and pillow packages: "
+            "pip install resvg-py pillow",
+            [CONF_PRERENDER],
+        ) from e
+    return config
+
+
+def prerender_svg(file_path, width, height):
+    """Rasterise an SVG file to one RGB565A8 frame."""
+    import resvg_py
+    from PIL import Image
+
+    png = resvg_py.svg_to_bytes(svg_path=file_path, width=width, height=height)
+    image = Image.open(io.BytesIO(bytes(png))).convert("RGBA")
+    if image.size != (width, height):
+        image = image.resize((width, height))
+    # PIL gives straight alpha
+    return bgra_to_rgb565a8(
+        image.tobytes("raw", "BGRA"), width, height, premultiplied=False
+    )
+
+
 SVG_SCHEMA = cv.Schema(
     {
         cv.Optional(CONF_WIDTH): size,
         cv.Optional(CONF_HEIGHT): size,
         cv.Optional(CONF_SRC): svg_path_validator,
         cv.Optional(CONF_FILE): svg_file_validator,
+        cv.Optional(CONF_PRERENDER, default=False): cv.boolean,
         cv.GenerateID(CONF_RAW_DATA_ID): cv.declare_id(cg.uint8),
+        cv.GenerateID(CONF_FRAME_DATA_ID): cv.declare_id(cg.uint32),
+        cv.GenerateID(CONF_FRAME_OFFSETS_ID): cv.declare_id(cg.uint32),
     }
-).add_extra(validate_svg_source)
+).add_extra(validate_svg_source).add_extra(validate_prerender)
 
 
 class SvgType(WidgetType):
@@ -213,6 +269,10 @@ class SvgType(WidgetType):
         # Set widget size
         lv_obj.set_size(w.obj, width, height)
 
+        if config[CONF_PRERENDER]:
+            await self.prerender_to_code(w, config, width, height)
+            return
+
         # Note: Widget visibility during async render is managed by svg_loader.h
         # (user's 'hidden' config is saved and restored after rendering)
 
@@ -247,5 +307,31 @@ class SvgType(WidgetType):
             lv_add(cg.RawStatement(f"""
     esphome::lvgl::svg_setup_and_render({w.obj}, (const char *){prog_arr}, {len(svg_data)}, {width}, {height}, {user_wants_hidden});"""))
 
+    async def prerender_to_code(self, w: Widget, config, width, height):
+        """Embed the SVG as a raster shown straight from flash by frame_player.h."""
+        global _frame_player_include_added
+        from ..lvcode import lv_add
+
+        frame = prerender_svg(config[CONF_FILE], width, height)
+        data, offsets = encode_frames([frame], ENCODING_RAW)
+        _LOGGER.info(
+            "SVG %s: pre-rendered at %dx%d, %d bytes",
+            config[CONF_FILE],
+            width,
+            height,
+            len(data),
+        )
+
+        if not _frame_player_include_added:
+            _frame_player_include_added = True
+            cg.add_global(
+                cg.RawStatement('#include "esphome/components/lvgl/frame_player.h"')
+            )
+
+        data_arr = cg.progmem_array(config[CONF_FRAME_DATA_ID], pack_words(data))
+        offsets_arr = cg.progmem_array(config[CONF_FRAME_OFFSETS_ID], offsets)
+        lv_add(cg.RawStatement(f"""
+    esphome::lvgl::frame_player_init({w.obj}, (const uint8_t *) {data_arr}, {offsets_arr}, 1, {width}, {height}, esphome::lvgl::FRAME_ENCODING_RAW, 0, false, false);"""))
+
 
 svg_spec = SvgType()